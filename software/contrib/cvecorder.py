@@ -15,6 +15,7 @@ from europi import *
 from time import ticks_diff, ticks_ms, sleep_ms
 from random import randint, uniform
 from europi_script import EuroPiScript
+from file_utils import atomic_write
 import machine
 import json
 import gc
@@ -268,13 +269,12 @@ class CVecorder(EuroPiScript):
                 if self.debugLogging:
                     self.writeToDebugLog(f"[saveState] Saving state for bank: {str(self.bankToSave)}. Size: {len(jsonState)}")
 
-                with open(outputFile, 'w') as file:
-                    # Attempt write data to state on disk, then break from while loop if the return (num bytes written) > 0
-                    if file.write(jsonState) > 0:
-                        #self.errorString = ' '
-                        if self.debugLogging:
-                            self.writeToDebugLog(f"[saveState] Bank {str(self.bankToSave)} saved OK")
-                        break
+                # Write to a temporary file and rename it, so a power cut can't leave a truncated bank
+                atomic_write(outputFile, jsonState)
+                #self.errorString = ' '
+                if self.debugLogging:
+                    self.writeToDebugLog(f"[saveState] Bank {str(self.bankToSave)} saved OK")
+                break
             except MemoryError as e:
                 self.errorString = 'w'
                 if self.initTest:
@@ -98,6 +98,7 @@ EUROPI_SCRIPTS = OrderedDict([
     ["_Calibrate",        "tools.calibrate.Calibrate"],
     ["_Config Editor",    "tools.conf_edit.ConfigurationEditor"],
     ["_Diagnostic",       "tools.diagnostic.Diagnostic"],
+    ["_Display Bench",    "tools.display_benchmark.DisplayBenchmark"],
     ["_Exp Cfg Editor",   "tools.experimental_conf_edit.ExperimentalConfigurationEditor"],
 ])
 # fmt: on
@@ -22,6 +22,7 @@ See pams.md for complete feature list
 
 from europi import *
 from europi_script import EuroPiScript
+from file_utils import atomic_write
 
 from configuration import *
 
@@ -1595,8 +1596,10 @@ class PamsWorkout2(EuroPiScript):
 
         try:
             d = channel.to_bank()
-            with open(self.bank_filename(bank), "w") as file:
-                json.dump(d, file, separators=(",\n", ":"))
+            atomic_write(
+                self.bank_filename(bank),
+                lambda file: json.dump(d, file, separators=(",\n", ":")),
+            )
         except Exception as err:
             print(f"Failed to save {bank}: {err}")
 
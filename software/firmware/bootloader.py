@@ -42,8 +42,11 @@ class PrintMemoryUse:
             gc.collect()
             after = gc.mem_free()
             log_info(
-                f"free: {after/1024: >6.2f}k, used: {(self.before - after)/1024: >6.2f}k   {self.label}",
+                "free: %6.2fk, used: %6.2fk   %s",
                 "bootloader",
+                after / 1024,
+                (self.before - after) / 1024,
+                self.label,
             )
 
 
@@ -73,6 +76,8 @@ class BootloaderMenu(EuroPiScript):
         """
         self.scripts = scripts
         self.run_request = None
+        # The script launched by main(), if any
+        self.running_script = None
 
     @staticmethod
     def show_progress(percentage):
@@ -86,8 +91,10 @@ class BootloaderMenu(EuroPiScript):
             return getattr(__import__(module, None, None, [None]), clazz)
         except Exception as e:
             log_warning(
-                f"Warning: Ignoring bad qualified class name: {script_class_name}\n  caused by: {e}",
+                "Warning: Ignoring bad qualified class name: %s\n  caused by: %s",
                 "bootloader",
+                script_class_name,
+                e,
             )
             return None
 
@@ -120,6 +127,14 @@ class BootloaderMenu(EuroPiScript):
         self.remove_state()
         # Attempt to save the state of this script if it has been implemented.
         self.save_state()  # TODO: isn't this the wrong state?
+        # save any changes the running script hasn't written yet
+        if self.running_script:
+            # a script that fails to save must not stop us from returning to the menu
+            try:
+                self.running_script.flush_state(force=True)
+            except Exception as err:
+                log_warning("Failed to save the script's state: %s", "bootloader", err)
+        flush_log()
         machine.reset()  # why doesn't machine.soft_reset() work anymore?
 
     def run_menu(self) -> type:
@@ -183,14 +198,16 @@ class BootloaderMenu(EuroPiScript):
                     # Remove the last-launched file to force the module back to the menu after it powers-on next time
                     self.save_state_json({})
 
-                script_class().main()
+                # keep a reference so exit_to_menu() can save the script's pending state
+                self.running_script = script_class()
+                self.running_script.main()
             except Exception as err:
                 # set all outputs to zero for safety
                 europi.turn_off_all_cvs()
 
                 # in case we have the USB cable connected, print the stack trace for debugging
                 # otherwise, just halt and show the error message
-                log_error(f"Failed to run script: {err}", "bootloader")
+                log_error("Failed to run script: %s", "bootloader", err)
                 sys.print_exception(err)
 
                 # show the type & first portion of the exception on the OLED
@@ -206,8 +223,12 @@ class BootloaderMenu(EuroPiScript):
                         log_file.write(f"{time.ticks_ms()}: {err}\n")
                         sys.print_exception(err, log_file)
 
-                    log_error(f"Crash! See last_crash.txt for details: {err}", "bootloader")
+                    log_error("Crash! See last_crash.txt for details: %s", "bootloader", err)
                 except:
                     # If we fail to create the error log, just silently fail; we don't need
                     # an additional exception to handle
                     pass
+            finally:
+                # save any log messages still waiting in RAM, including those from a script
+                # that was stopped with ctrl+c
+                flush_log()
@@ -23,7 +23,7 @@ of the valid values that it may have. There are several different types of COnfi
 
 import os
 import json
-from file_utils import load_file, delete_file, load_json_file
+from file_utils import atomic_write, load_file, delete_file, load_json_file
 from collections import namedtuple
 
 Validation = namedtuple("Validation", "is_valid message")
@@ -330,10 +330,9 @@ class ConfigFile:
         :param path:  The path to the file we're saving to
         :param dict:  The data to save
         """
-        with open(path, "w") as file:
-            # put newlines between items to make the resulting file easier to read
-            # this makes debugging easier, in case human eyes are ever needed on the file
-            json.dump(data, file, separators=(",\n", ":"))
+        # put newlines between items to make the resulting file easier to read
+        # this makes debugging easier, in case human eyes are ever needed on the file
+        atomic_write(path, lambda file: json.dump(data, file, separators=(",\n", ":")))
 
     @staticmethod
     def config_filename(cls):
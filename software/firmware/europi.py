@@ -50,6 +50,7 @@ else:
 # Initialize EuroPi global singleton instance variables
 europi_config = load_europi_config()
 experimental_config = load_experimental_config()
+set_log_level(europi_config.LOG_LEVEL)
 
 # OLED component display dimensions.
 OLED_WIDTH = europi_config.DISPLAY_WIDTH
@@ -71,12 +72,33 @@ def turn_off_all_cvs():
         cv.off()
 
 
+def init(subset=None):
+    """Create the hardware objects now, instead of the first time they are used.
+
+    The outputs, thermometer and external I²C bus are only created when a script first uses
+    them, which keeps booting fast for scripts that don't need everything.
+    Scripts that would rather pay that cost up front (e.g. before starting a timing-sensitive
+    loop) can call this function first::
+
+        from europi import *
+
+        init(["cv1", "cv2", "k1"])
+
+    :param subset:  An iterable of the names of the objects to create. If None, every object
+        is created.
+    """
+    init_hardware(subset)
+
+
 def reset_state():
     """Return device to initial state with all components off and handlers reset."""
     if not TEST_ENV:
         oled.fill(0)
         oled.show()
-    turn_off_all_cvs()
+    # outputs that haven't been created yet are turned off when they are
+    for cv in cvs:
+        if is_initialized(cv):
+            cv.off()
     for d in (b1, b2, din):
         d.reset_handler()
 
@@ -108,10 +130,11 @@ if not TEST_ENV:
             freq=europi_config.DISPLAY_FREQUENCY,
             contrast=europi_config.DISPLAY_CONTRAST,
             rotate=europi_config.ROTATE_DISPLAY,
+            max_fps=europi_config.DISPLAY_MAX_FPS,
         )
     except Exception as err:
         log_warning(
-            f"Failed to initialize display: {err}. Is the hardware connected properly?", "europi"
+            "Failed to initialize display: %s. Is the hardware connected properly?", "europi", err
         )
         oled = DummyDisplay(
             width=europi_config.DISPLAY_WIDTH,
@@ -13,6 +13,7 @@
 # limitations under the License.
 import configuration
 from configuration import ConfigFile, ConfigSpec
+from europi_log import LOG_LEVELS, LOG_LEVEL_INFO
 
 
 # sub-key constants for CPU_FREQS dict (see below)
@@ -31,6 +32,12 @@ MODEL_PICO_W = "pico w"
 MODEL_PICO_2 = "pico 2"
 MODEL_PICO_2W = "pico 2w"
 
+# PWM profiles for the CV outputs
+# Key: the profile name used by the PWM_PROFILE_* settings
+PWM_PROFILE_DEFAULT = "default"
+PWM_PROFILE_AUDIO = "audio"
+PWM_PROFILE_PRECISION = "precision"
+
 # Default & overclocked CPU frequencies for supported boards
 # Key: board type (corresponds to EUROPI_MODEL setting)
 # Sub-key: "default" or "overclocked" or "underclocked"
@@ -116,6 +123,12 @@ class EuroPiConfig:
                 maximum=255,
                 default=255,
             ),
+            configuration.integer(
+                name="DISPLAY_MAX_FPS",
+                minimum=0,
+                maximum=120,
+                default=0,
+            ),
             configuration.integer(
                 name="DISPLAY_WIDTH",
                 minimum=8,
@@ -231,6 +244,31 @@ class EuroPiConfig:
                 default=5.0,
             ),
 
+            # PWM settings
+            # Outputs are configured in pairs; each pair shares one of the Pico's PWM slices
+            configuration.choice(
+                name="PWM_PROFILE_CV1_CV2",
+                choices=[PWM_PROFILE_DEFAULT, PWM_PROFILE_AUDIO, PWM_PROFILE_PRECISION],
+                default=PWM_PROFILE_DEFAULT,
+            ),
+            configuration.choice(
+                name="PWM_PROFILE_CV3_CV4",
+                choices=[PWM_PROFILE_DEFAULT, PWM_PROFILE_AUDIO, PWM_PROFILE_PRECISION],
+                default=PWM_PROFILE_DEFAULT,
+            ),
+            configuration.choice(
+                name="PWM_PROFILE_CV5_CV6",
+                choices=[PWM_PROFILE_DEFAULT, PWM_PROFILE_AUDIO, PWM_PROFILE_PRECISION],
+                default=PWM_PROFILE_DEFAULT,
+            ),
+
+            # Logging settings
+            configuration.choice(
+                name="LOG_LEVEL",
+                choices=LOG_LEVELS,
+                default=LOG_LEVEL_INFO,
+            ),
+
             # Menu settings
             configuration.boolean(
                 name="MENU_AFTER_POWER_ON",
@@ -15,14 +15,85 @@
 Classes and definitions for interacting with the OLED display
 """
 
+from framebuf import FrameBuffer, MONO_VLSB
 from machine import I2C, Pin
 import ssd1306
+import time
 from ssd1306 import SSD1306_I2C
 
 # Default font is 8x8 pixel monospaced font.
 CHAR_WIDTH = 8
 CHAR_HEIGHT = 8
 
+# Maximum number of centre_text layouts remembered; see centre_text_layout()
+MAX_CENTRE_LAYOUTS = 8
+
+# text -> (width, height, [(x, y, line), ...])
+_centre_layouts = {}
+
+
+def centre_text_layout(text, width, height):
+    """Return the position of each line of text centred on a screen of the given size
+
+    Layouts are cached, so status screens that are redrawn every loop don't re-split the text or
+    recompute the offsets.
+
+    :param text:  The text to lay out; lines are separated by ``\\n``
+    :param width:  The width of the screen in pixels
+    :param height:  The height of the screen in pixels
+    :return: A list of ``(x, y, line)`` tuples
+    :raises Exception: if the text has too many lines to fit on the screen
+    """
+    text = str(text)
+    cached = _centre_layouts.get(text)
+    if cached is not None and cached[0] == width and cached[1] == height:
+        return cached[2]
+
+    # Default font is 8x8 pixel monospaced font which can be split to a
+    # maximum of 4 lines on a 128x32 display, but the maximum_lines variable
+    # is rounded down for readability
+    lines = text.split("\n")
+    maximum_lines = round(height / CHAR_HEIGHT)
+    if len(lines) > maximum_lines:
+        raise Exception("Provided text exceeds available space on oled display.")
+    padding_top = (height - (len(lines) * (CHAR_HEIGHT + 1))) / 2
+    layout = []
+    for index, content in enumerate(lines):
+        x_offset = int((width - ((len(content) + 1) * (CHAR_WIDTH - 1))) / 2) - 1
+        y_offset = int((index * (CHAR_HEIGHT + 1)) + padding_top) - 1
+        layout.append((x_offset, y_offset, content))
+
+    if len(_centre_layouts) >= MAX_CENTRE_LAYOUTS:
+        _centre_layouts.clear()
+    _centre_layouts[text] = (width, height, layout)
+    return layout
+
+
+def draw_text_block(fb, lines, x, y, inverted_mask=0, line_height=CHAR_HEIGHT + 2):
+    """Draw several lines of text onto a FrameBuffer, one below the other
+
+    This is the drawing used by ``Display.draw_text_block()``, for FrameBuffers that aren't a
+    ``Display``.
+
+    :param fb:  The FrameBuffer to draw on
+    :param lines:  A list of strings, one per line
+    :param x:  The x coordinate of the left edge of every line
+    :param y:  The y coordinate of the top of the first line
+    :param inverted_mask:  A bit mask of the lines to draw inverted, i.e. dark text on a light
+        background. Bit 0 is the first line
+    :param line_height:  The distance between the tops of consecutive lines, in pixels
+    """
+    fill_rect = fb.fill_rect
+    text = fb.text
+    for line in lines:
+        if inverted_mask & 1:
+            fill_rect(x, y - 1, len(line) * CHAR_WIDTH, CHAR_HEIGHT + 2, 1)
+            text(line, x, y, 0)
+        else:
+            text(line, x, y, 1)
+        inverted_mask >>= 1
+        y += line_height
+
 
 class Display(SSD1306_I2C):
     """
@@ -36,6 +107,16 @@ class Display(SSD1306_I2C):
 
     To clear the display, simply fill the display with the colour black by using ``oled.fill(0)``
 
+    The display keeps track of which part of the framebuffer has been drawn on since the last
+    call to ``show()``, and only sends that part over I²C. Drawing a few pixels or a short line
+    of text is therefore much cheaper to show than redrawing the whole screen. If you modify
+    ``oled.buffer`` directly the whole screen is sent by the next ``show()``; call
+    ``oled.invalidate()`` if you also use the drawing methods, otherwise only the area they
+    changed is sent.
+
+    Frames that are identical to the last frame sent (e.g. a menu that is cleared and redrawn
+    every loop) are not sent at all.
+
     More explanations and tips about the the display can be found in the oled_tips file
     `oled_tips.md <https://github.com/Allen-Synthesis/EuroPi/blob/main/software/oled_tips.md>`_
     """
@@ -50,16 +131,225 @@ class Display(SSD1306_I2C):
         channel,
         freq,
         contrast,
-        rotate
+        rotate,
+        max_fps=0
         # fmt: on
     ):
         i2c = I2C(channel, sda=Pin(sda), scl=Pin(scl), freq=freq)
         self.width = width
         self.height = height
+
+        # Narrow displays are centred in the controller's 128 columns
+        self._col_offset = (128 - width) // 2 if width != 128 else 0
+        # Created by the first show(); the framebuffer doesn't exist until the driver is set up
+        self._buffer_view = None
+        # Off-screen buffer used by centre_text_cached(); created on first use
+        self._offscreen = None
+        self._offscreen_text = None
+        # Copy of the last frame sent, used to skip identical frames. None until the first
+        # frame is sent, since the contents of the display's RAM are unknown before then
+        self._sent = None
+
+        # Frame rate limiting; see show(). This must be set up before the driver's constructor
+        # runs, since it clears the display by calling fill() & show()
+        self.set_max_fps(max_fps)
+        self._last_show = 0
+        if self._min_interval_ms:
+            self._last_show = time.ticks_add(time.ticks_ms(), -self._min_interval_ms)
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+
         super().__init__(self.width, self.height, i2c)
         self.rotate(rotate)
         self.contrast(contrast)
 
+        # The dirty window is stored as inclusive column & page ranges. Start with everything
+        # dirty so the first show() looks at the whole framebuffer
+        self.invalidate()
+
+    def _clear_dirty(self):
+        self._dirty_x0 = self.width
+        self._dirty_x1 = -1
+        self._dirty_p0 = self.pages
+        self._dirty_p1 = -1
+
+    def _mark_dirty(self, x0, y0, x1, y1):
+        # Add the rectangle with inclusive corners (x0, y0), (x1, y1) to the dirty window
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        if x1 < 0 or y1 < 0 or x0 >= self.width or y0 >= self.height:
+            return
+        if x0 < self._dirty_x0:
+            self._dirty_x0 = x0 if x0 > 0 else 0
+        if x1 > self._dirty_x1:
+            self._dirty_x1 = x1 if x1 < self.width else self.width - 1
+        p0 = y0 >> 3 if y0 > 0 else 0
+        if p0 < self._dirty_p0:
+            self._dirty_p0 = p0
+        p1 = y1 >> 3 if y1 < self.height else self.pages - 1
+        if p1 > self._dirty_p1:
+            self._dirty_p1 = p1
+
+    def invalidate(self, x=0, y=0, width=None, height=None):
+        """Mark part of the screen as changed, so the next ``show()`` sends it
+
+        Use this after writing to ``buffer`` directly. By default the whole screen is marked.
+
+        :param x:  The left edge of the changed area
+        :param y:  The top edge of the changed area
+        :param width:  The width of the changed area; if None, the whole screen is marked
+        :param height:  The height of the changed area
+        """
+        if width is not None:
+            self._mark_dirty(x, y, x + width - 1, y + height - 1)
+            return
+        self._dirty_x0 = 0
+        self._dirty_x1 = self.width - 1
+        self._dirty_p0 = 0
+        self._dirty_p1 = self.pages - 1
+
+    def set_max_fps(self, max_fps):
+        """Limit the number of frames per second sent to the display
+
+        :param max_fps:  The maximum frame rate. If 0, every call to ``show()`` sends a frame
+        """
+        self._min_interval_ms = 1000 // max_fps if max_fps > 0 else 0
+
+    def reset_frame_counters(self):
+        """Reset ``frames_sent``, ``frames_dropped`` and ``frames_skipped`` to zero"""
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+
+    def show(self, force=False):
+        """Send the parts of the framebuffer that changed since the last call to the display
+
+        Changes are sent as a single window of columns & pages using the SSD1306's addressing
+        commands. If nothing has been drawn since the last call but the framebuffer was changed
+        directly, the whole screen is sent. If the framebuffer is identical to the last frame
+        sent, nothing is sent and the frame is counted in ``frames_skipped``. If sending the frame
+        raises an ``OSError`` its changes are kept, and are sent by the next call.
+
+        If a maximum frame rate is set (see ``set_max_fps()``) and the last frame was sent too
+        recently, the frame is dropped and counted in ``frames_dropped``. Its changes are not lost;
+        they are sent with the next frame that isn't dropped.
+
+        :param force:  If True, send the frame even if it is too soon after the last one
+        """
+        x0 = self._dirty_x0
+        x1 = self._dirty_x1
+        sent = self._sent
+        if x0 > x1:
+            # Nothing was drawn with the drawing methods, but the buffer may have been changed
+            # directly; comparing the whole 512 byte buffer is much cheaper than sending it
+            if sent is not None and sent == self.buffer:
+                self.frames_skipped += 1
+                return
+            self.invalidate()
+            x0 = 0
+            x1 = self.width - 1
+        elif sent is not None and sent == self.buffer:
+            self._clear_dirty()
+            self.frames_skipped += 1
+            return
+        if self._min_interval_ms:
+            now = time.ticks_ms()
+            # A negative difference means the tick counter wrapped since the last frame
+            elapsed = time.ticks_diff(now, self._last_show)
+            if not force and 0 <= elapsed < self._min_interval_ms:
+                self.frames_dropped += 1
+                return
+        p0 = self._dirty_p0
+        p1 = self._dirty_p1
+
+        self.write_cmd(ssd1306.SET_COL_ADDR)
+        self.write_cmd(x0 + self._col_offset)
+        self.write_cmd(x1 + self._col_offset)
+        self.write_cmd(ssd1306.SET_PAGE_ADDR)
+        self.write_cmd(p0)
+        self.write_cmd(p1)
+
+        view = self._buffer_view
+        if view is None:
+            view = memoryview(self.buffer)
+            self._buffer_view = view
+
+        # The framebuffer is stored page by page, so full-width windows are contiguous. Otherwise
+        # send each page's columns in turn; the display's address pointer wraps to the next page
+        width = self.width
+        if x0 == 0 and x1 == width - 1:
+            self.write_data(view[p0 * width : (p1 + 1) * width])
+        else:
+            for page in range(p0, p1 + 1):
+                start = page * width
+                self.write_data(view[start + x0 : start + x1 + 1])
+
+        # Only once the frame has been sent: if writing raised an OSError the window is still
+        # dirty, and is sent again by the next show(). Everything outside the window already
+        # matched the display, so now the whole buffer is what the display shows
+        self._clear_dirty()
+        if sent is None:
+            self._sent = bytearray(self.buffer)
+        else:
+            sent[:] = self.buffer
+        if self._min_interval_ms:
+            self._last_show = now
+        self.frames_sent += 1
+
+    def fill(self, c):
+        self.invalidate()
+        super().fill(c)
+
+    def pixel(self, x, y, *args):
+        # pixel(x, y) reads the framebuffer, pixel(x, y, c) draws on it
+        if args:
+            self._mark_dirty(x, y, x, y)
+        return super().pixel(x, y, *args)
+
+    def text(self, s, x, y, *args):
+        self._mark_dirty(x, y, x + len(s) * CHAR_WIDTH - 1, y + CHAR_HEIGHT - 1)
+        super().text(s, x, y, *args)
+
+    def hline(self, x, y, w, c=1):
+        self._mark_dirty(x, y, x + w - 1, y)
+        super().hline(x, y, w, c)
+
+    def vline(self, x, y, h, c=1):
+        self._mark_dirty(x, y, x, y + h - 1)
+        super().vline(x, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c=1):
+        self._mark_dirty(x1, y1, x2, y2)
+        super().line(x1, y1, x2, y2, c)
+
+    def rect(self, x, y, w, h, c=1, *args):
+        self._mark_dirty(x, y, x + w - 1, y + h - 1)
+        super().rect(x, y, w, h, c, *args)
+
+    def fill_rect(self, x, y, w, h, c=1):
+        self._mark_dirty(x, y, x + w - 1, y + h - 1)
+        super().fill_rect(x, y, w, h, c)
+
+    def ellipse(self, x, y, xr, yr, c=1, *args):
+        self._mark_dirty(x - xr, y - yr, x + xr, y + yr)
+        super().ellipse(x, y, xr, yr, c, *args)
+
+    def blit(self, fbuf, x, y, *args):
+        # The size of a FrameBuffer isn't exposed, so assume it covers the rest of the screen
+        self._mark_dirty(x, y, self.width - 1, self.height - 1)
+        super().blit(fbuf, x, y, *args)
+
+    def poly(self, *args):
+        self.invalidate()
+        super().poly(*args)
+
+    def scroll(self, xstep, ystep):
+        self.invalidate()
+        super().scroll(xstep, ystep)
+
     def rotate(self, rotate):
         """Flip the screen from its default orientation
 
@@ -74,6 +364,36 @@ class Display(SSD1306_I2C):
         self.write_cmd(ssd1306.SET_COM_OUT_DIR | ((rotate & 1) << 3))
         self.write_cmd(ssd1306.SET_SEG_REMAP | (rotate & 1))
 
+    def draw_text_block(self, lines, x, y, inverted_mask=0, line_height=CHAR_HEIGHT + 2):
+        """Draw several lines of text, one below the other, in a single call
+
+        Inverted lines are drawn as dark text on a light background that extends one pixel above
+        and below the text, which is how menus highlight the selected item. The whole block is
+        added to the area sent by the next ``show()`` at once, rather than line by line.
+
+        You must call ``show()`` after calling this.
+
+        :param lines:  A list of strings, one per line
+        :param x:  The x coordinate of the left edge of every line
+        :param y:  The y coordinate of the top of the first line
+        :param inverted_mask:  A bit mask of the lines to draw inverted. Bit 0 is the first line
+        :param line_height:  The distance between the tops of consecutive lines, in pixels
+        """
+        if not lines:
+            return
+        widest = 0
+        for line in lines:
+            if len(line) > widest:
+                widest = len(line)
+        self._mark_dirty(
+            x,
+            y - 1,
+            x + widest * CHAR_WIDTH - 1,
+            y + (len(lines) - 1) * line_height + CHAR_HEIGHT,
+        )
+        # draw with the driver's methods, which don't update the dirty window again
+        draw_text_block(super(), lines, x, y, inverted_mask, line_height)
+
     def centre_text(self, text, clear_first=True, auto_show=True):
         """Display one or more lines of text centred both horizontally and vertically.
 
@@ -83,18 +403,34 @@ class Display(SSD1306_I2C):
         """
         if clear_first:
             self.fill(0)
-        # Default font is 8x8 pixel monospaced font which can be split to a
-        # maximum of 4 lines on a 128x32 display, but the maximum_lines variable
-        # is rounded down for readability
-        lines = str(text).split("\n")
-        maximum_lines = round(self.height / CHAR_HEIGHT)
-        if len(lines) > maximum_lines:
-            raise Exception("Provided text exceeds available space on oled display.")
-        padding_top = (self.height - (len(lines) * (CHAR_HEIGHT + 1))) / 2
-        for index, content in enumerate(lines):
-            x_offset = int((self.width - ((len(content) + 1) * (CHAR_WIDTH - 1))) / 2) - 1
-            y_offset = int((index * (CHAR_HEIGHT + 1)) + padding_top) - 1
-            self.text(content, x_offset, y_offset)
+        for x, y, line in centre_text_layout(text, self.width, self.height):
+            self.text(line, x, y)
+
+        if auto_show:
+            self.show()
+
+    def centre_text_cached(self, text, auto_show=True):
+        """Like ``centre_text()``, but renders the text into an off-screen buffer first
+
+        The rendered text is kept, so showing the same message again is a single ``blit``
+        instead of clearing the screen and drawing each line. Useful for status messages that
+        are redrawn every loop. The screen is always cleared first.
+
+        :param text:  The text to display
+        :param auto_show:  If true, oled.show() is called after rendering the text
+        """
+        if self._offscreen is None:
+            self._offscreen = FrameBuffer(
+                bytearray(self.width * self.height // 8), self.width, self.height, MONO_VLSB
+            )
+            self._offscreen_text = None
+        fb = self._offscreen
+        if text != self._offscreen_text:
+            fb.fill(0)
+            for x, y, line in centre_text_layout(text, self.width, self.height):
+                fb.text(line, x, y, 1)
+            self._offscreen_text = text
+        self.blit(fb, 0, 0)
 
         if auto_show:
             self.show()
@@ -110,14 +446,33 @@ class DummyDisplay:
     def __init__(self, width, height):
         self.width = width
         self.height = height
+        self.buffer = bytearray(width * height // 8)
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
 
     def rotate(self, rotate):
         pass
 
+    def invalidate(self, *args):
+        pass
+
+    def set_max_fps(self, max_fps):
+        pass
+
+    def reset_frame_counters(self):
+        pass
+
     def centre_text(self, text, clear_first=True, auto_show=True):
         pass
 
-    def show(self):
+    def centre_text_cached(self, text, auto_show=True):
+        pass
+
+    def draw_text_block(self, lines, x, y, inverted_mask=0, line_height=CHAR_HEIGHT + 2):
+        pass
+
+    def show(self, force=False):
         pass
 
     def fill(self, color):
@@ -156,5 +511,11 @@ class DummyDisplay:
     def contrast(self, contrast):
         pass
 
+    def poweroff(self):
+        pass
+
+    def poweron(self):
+        pass
+
     def pixel(self, x, y, color=1):
         pass
@@ -27,13 +27,25 @@ from machine import ADC
 from machine import I2C
 from machine import PWM
 from machine import Pin
+from machine import Timer
 from machine import freq
 from machine import mem32
+from array import array
+import _thread
+import micropython
 import time
 
-from europi_config import load_europi_config, CPU_FREQS
+from europi_config import load_europi_config, CPU_FREQS, MODEL_PICO_2, MODEL_PICO_2W
+from europi_config import PWM_PROFILE_DEFAULT, PWM_PROFILE_AUDIO, PWM_PROFILE_PRECISION
 from experimental.experimental_config import load_experimental_config
 
+try:
+    from rp2 import DMA
+except ImportError:
+    # DMA support was added in MicroPython 1.21; older firmware (and the test environment)
+    # will fall back to reading the ADC one sample at a time
+    DMA = None
+
 # Load the configuration objects so we can initialize
 # the hardware according to user preferences
 europi_config = load_europi_config()
@@ -51,6 +63,19 @@ MAX_OUTPUT_VOLTAGE = europi_config.MAX_OUTPUT_VOLTAGE
 
 PWM_FREQ = 100_000
 
+# PWM frequency used by each output profile (see PwmSlices)
+# The precision profile has no fixed frequency; it uses the fastest frequency that still gives
+# (almost) the full 16-bit duty cycle resolution
+PWM_PROFILE_FREQS = {
+    PWM_PROFILE_DEFAULT: PWM_FREQ,
+    PWM_PROFILE_AUDIO: 250_000,
+    PWM_PROFILE_PRECISION: None,
+}
+
+# Number of PWM slices; each slice drives 2 GPIO pins (channels A & B)
+PWM_SLICES_RP2040 = 8
+PWM_SLICES_RP2350 = 12
+
 # Digital input and output binary values.
 HIGH = 1
 LOW = 0
@@ -74,6 +99,37 @@ PIN_TEMPERATURE = 4
 # Standard max int consts.
 MAX_UINT16 = 65535
 
+# The ADC is 12 bits; raw FIFO readings are in the range [0, MAX_ADC_RAW]
+MAX_ADC_RAW = 4095
+
+# GPIO26 is ADC channel 0, GPIO27 is channel 1, etc...
+ADC_GPIO_OFFSET = 26
+
+# ADC registers & bit-fields used for bulk sampling
+# See section 4.9.6 of the RP2040 datasheet & section 12.4.7 of the RP2350 datasheet
+ADC_BASE_RP2040 = 0x4004C000
+ADC_BASE_RP2350 = 0x400A0000
+ADC_CS = 0x00
+ADC_FCS = 0x08
+ADC_FIFO = 0x0C
+ADC_CS_EN = 1 << 0
+ADC_CS_TS_EN = 1 << 1
+ADC_CS_START_MANY = 1 << 3
+ADC_CS_READY = 1 << 8
+ADC_CS_AINSEL_SHIFT = 12
+ADC_CS_RROBIN_SHIFT = 16
+ADC_FCS_EN = 1 << 0
+ADC_FCS_DREQ_EN = 1 << 3
+ADC_FCS_EMPTY = 1 << 8
+ADC_FCS_THRESH_SHIFT = 24
+
+# Each conversion takes 96 cycles of the 48MHz ADC clock
+ADC_CONVERSION_US = 2
+
+# DMA transfer request signal for the ADC FIFO
+DREQ_ADC_RP2040 = 36
+DREQ_ADC_RP2350 = 48
+
 # How many CV outputs are there?
 # On EuroPi this 6, but future versions (e.g. EuroPi X may have more)
 NUM_CVS = 6
@@ -118,6 +174,281 @@ def clamp(value: int | float, low: int | float, high: int | float):
     return max(min(value, high), low)
 
 
+class AdcSampler:
+    """Reads several ADC channels at once using the ADC's round-robin mode.
+
+    Instead of calling ``read_u16()`` in a Python loop, the ADC free-runs across all of the
+    requested channels and a DMA channel copies the results from the ADC's FIFO into a
+    preallocated ``array('H')``. One capture provides ``depth`` samples for every channel.
+
+    AnalogueReaders use the sampler automatically when it is available. Reading a channel
+    consumes its samples; reading a channel whose samples have already been consumed triggers a
+    new capture of all channels. A main loop that reads ``k1``, ``k2`` and ``ain`` once per
+    iteration therefore only performs a single capture. Samples older than ``max_age_us``, the
+    time taken by one full capture, are never used; reading a channel after that triggers a new
+    capture even if its samples haven't been consumed.
+
+    Captures are guarded by a lock, so channels can be read from both cores. If a reading is
+    requested while a capture is in progress (on the other core, or in an ISR that interrupted
+    the capture) it is served from the buffer without waiting, and may combine samples from the
+    previous capture with the ones captured so far.
+
+    If DMA is not available (e.g. older MicroPython firmware, or when running tests on a PC)
+    the sampler is disabled and AnalogueReaders sample the ADC directly.
+
+    :param pins:  The ADC-capable GPIO pins to sample
+    :param depth:  The number of samples to capture for each channel
+    """
+
+    def __init__(self, pins, depth=DEFAULT_SAMPLES):
+        # round-robin mode converts channels in ascending order, so the buffer is interleaved
+        # in ascending pin order
+        pins = sorted(pins)
+        self.depth = depth
+        self.buffer = array("H", [0] * (depth * len(pins)))
+        self._stride = len(pins)
+        self._offsets = {}
+        self._mask = 0
+        for offset, pin in enumerate(pins):
+            self._offsets[pin] = offset
+            self._mask |= 1 << (pin - ADC_GPIO_OFFSET)
+        self._first_channel = pins[0] - ADC_GPIO_OFFSET
+
+        # Start with every channel consumed so the first read triggers a capture
+        self._consumed = self._mask
+        # The number of samples per channel in the buffer, and when they were captured
+        self._captured = 0
+        self._captured_at = 0
+        self.max_age_us = depth * len(pins) * ADC_CONVERSION_US
+        self._lock = _thread.allocate_lock()
+
+        if europi_config.PICO_MODEL == MODEL_PICO_2 or europi_config.PICO_MODEL == MODEL_PICO_2W:
+            base = ADC_BASE_RP2350
+            dreq = DREQ_ADC_RP2350
+        else:
+            base = ADC_BASE_RP2040
+            dreq = DREQ_ADC_RP2040
+        self._cs = base + ADC_CS
+        self._fcs = base + ADC_FCS
+        self._fifo = base + ADC_FIFO
+
+        self._dma = None
+        if DMA is not None:
+            try:
+                self._dma = DMA()
+                self._ctrl = self._dma.pack_ctrl(
+                    size=1,  # 16-bit transfers
+                    inc_read=False,
+                    inc_write=True,
+                    treq_sel=dreq,
+                )
+            except Exception:
+                # all DMA channels are in use; fall back to direct sampling
+                self._dma = None
+        self.enabled = self._dma is not None
+
+    def handles(self, pin, samples):
+        """Can a reading of the given pin with the given number of samples be served from the buffer?
+
+        :param pin:  The GPIO pin of the ADC
+        :param samples:  The number of samples the caller wants averaged
+        """
+        return self.enabled and samples <= self.depth and pin in self._offsets
+
+    def read(self, pin, samples):
+        """Return the average of the most recent samples for the given pin, scaled to 16 bits
+
+        A new capture is performed first if this pin's samples have already been read, if they
+        are older than ``max_age_us``, or if fewer than ``samples`` samples were captured.
+
+        :param pin:  The GPIO pin of the ADC
+        :param samples:  The number of samples to average. Must be no larger than ``depth``
+        """
+        if not self._lock.acquire(0):
+            # a capture is in progress; don't wait for it, since we may have interrupted it
+            return self._average(self._offsets[pin], samples)
+        try:
+            bit = 1 << (pin - ADC_GPIO_OFFSET)
+            if (
+                self._consumed & bit
+                or samples > self._captured
+                or time.ticks_diff(time.ticks_us(), self._captured_at) > self.max_age_us
+            ):
+                self._capture()
+            self._consumed |= bit
+            return self._average(self._offsets[pin], samples)
+        finally:
+            self._lock.release()
+
+    @micropython.native
+    def _average(self, offset, samples):
+        buf = self.buffer
+        stride = self._stride
+        total = 0
+        i = offset
+        end = offset + samples * stride
+        while i < end:
+            total += buf[i]
+            i += stride
+        # Scale the 12-bit average up to 16 bits the same way ADC.read_u16() does
+        value = (total << 4) // samples
+        return value + (value >> 12)
+
+    def _drain_fifo(self):
+        while not mem32[self._fcs] & ADC_FCS_EMPTY:
+            mem32[self._fifo]
+
+    def capture(self):
+        """Fill the buffer with fresh samples from every channel
+
+        If another capture is already in progress nothing is done; waiting for it could deadlock
+        if this was called from an ISR that interrupted it.
+        """
+        if not self._lock.acquire(0):
+            return
+        try:
+            self._capture()
+        finally:
+            self._lock.release()
+
+    def _capture(self):
+        # The caller must hold the lock
+        # preserve the enable & temperature sensor bits so other ADC users are unaffected
+        idle = mem32[self._cs] & (ADC_CS_EN | ADC_CS_TS_EN)
+        round_robin = (
+            idle
+            | (self._first_channel << ADC_CS_AINSEL_SHIFT)
+            | (self._mask << ADC_CS_RROBIN_SHIFT)
+        )
+
+        mem32[self._fcs] = ADC_FCS_EN | ADC_FCS_DREQ_EN | (1 << ADC_FCS_THRESH_SHIFT)
+        self._drain_fifo()
+        mem32[self._cs] = round_robin
+        self._dma.config(
+            read=self._fifo,
+            write=self.buffer,
+            count=len(self.buffer),
+            ctrl=self._ctrl,
+            trigger=True,
+        )
+        mem32[self._cs] = round_robin | ADC_CS_START_MANY
+        while self._dma.active():
+            pass
+
+        # Stop free-running, let the last conversion finish and restore the single-shot
+        # configuration that ADC.read_u16() expects
+        mem32[self._cs] = idle
+        while not mem32[self._cs] & ADC_CS_READY:
+            pass
+        self._drain_fifo()
+        mem32[self._fcs] = 0
+        self._consumed = 0
+        self._captured = self.depth
+        self._captured_at = time.ticks_us()
+
+
+class AdcSamplingService:
+    """Continuously samples analogue inputs in the background using a hardware timer.
+
+    While running, every timer tick reads each input once and adds the reading to a ring buffer
+    of that input's ``window`` most recent readings. The average of the window is updated
+    incrementally on every tick, so reading a knob or ``ain`` just returns the latest average
+    without touching the ADC::
+
+        from europi import *
+
+        adc_service.start()
+        while True:
+            # neither of these block on the ADC
+            cv1.voltage(ain.read_voltage() * k1.percent())
+
+    While the service is running the ``samples`` parameter of the AnalogueReader methods is
+    ignored for the inputs it samples; the amount of smoothing is set by ``window`` instead.
+
+    The service is stopped by default. Call ``adc_service.stop()`` to return to on-demand
+    sampling.
+
+    :param readers:  The AnalogueReaders whose ADCs we sample
+    :param window:  The number of readings averaged for each input
+    """
+
+    def __init__(self, readers, window=DEFAULT_SAMPLES):
+        self.window = window
+        self.running = False
+        self._readers = readers
+        self._timer = None
+        self._index = 0
+        self._adcs = None
+        self._offsets = {}
+
+    def _setup(self):
+        # The readers may not have been created yet (see LazyHardware), so their ADCs are only
+        # looked up when the service first starts
+        self._adcs = []
+        self._history = []
+        for reader in self._readers:
+            self._offsets[reader.pin_id] = len(self._adcs)
+            self._adcs.append(reader.pin)
+            self._history.append(array("H", [0] * self.window))
+        self._sums = [0] * len(self._adcs)
+        self._averages = [0] * len(self._adcs)
+
+    def start(self, freq=1000):
+        """Start sampling in the background
+
+        :param freq:  The number of times per second each input is sampled
+        """
+        if self.running:
+            return
+        if self._adcs is None:
+            self._setup()
+
+        # Fill the windows with the current readings so the averages are valid immediately
+        for i in range(len(self._adcs)):
+            value = self._adcs[i].read_u16()
+            history = self._history[i]
+            for j in range(self.window):
+                history[j] = value
+            self._sums[i] = value * self.window
+            self._averages[i] = value
+
+        self._timer = Timer(mode=Timer.PERIODIC, freq=freq, callback=self._tick)
+        self.running = True
+
+    def stop(self):
+        """Stop sampling in the background"""
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+        self.running = False
+
+    def handles(self, pin):
+        """Is the service currently providing readings for the given pin?
+
+        :param pin:  The GPIO pin of the ADC
+        """
+        return self.running and pin in self._offsets
+
+    def latest(self, pin):
+        """Return the latest average reading for the given pin, scaled to 16 bits
+
+        :param pin:  The GPIO pin of the ADC
+        """
+        return self._averages[self._offsets[pin]]
+
+    def _tick(self, timer):
+        index = self._index
+        window = self.window
+        for i in range(len(self._adcs)):
+            value = self._adcs[i].read_u16()
+            history = self._history[i]
+            total = self._sums[i] + value - history[index]
+            history[index] = value
+            self._sums[i] = total
+            self._averages[i] = total // window
+        self._index = (index + 1) % window
+
+
 class AnalogueReader:
     """A base class for common analogue read methods.
 
@@ -138,10 +469,16 @@ class AnalogueReader:
 
     def _sample_adc(self, samples=None):
         # Over-samples the ADC and returns the average.
+        if adc_service.handles(self.pin_id):
+            return adc_service.latest(self.pin_id)
+        samples = samples or self._samples
+        if adc_sampler.handles(self.pin_id, samples):
+            return adc_sampler.read(self.pin_id, samples)
         value = 0
-        for _ in range(samples or self._samples):
+        for _ in range(samples):
             value += self.pin.read_u16()
-        return round(value / (samples or self._samples))
+        # integer division rounded to nearest avoids allocating a float
+        return (value + (samples >> 1)) // samples
 
     def set_samples(self, samples):
         """Override the default number of sample reads with the given value."""
@@ -154,6 +491,7 @@ class AnalogueReader:
         if not isinstance(deadzone, float):
             raise ValueError(f"set_deadzone expects an float value, got: {deadzone}")
         self._deadzone = deadzone
+        self._deadzone_u16 = int(deadzone * MAX_UINT16)
 
     def percent(self, samples=None, deadzone=None):
         """Return the percentage of the component's current relative range."""
@@ -182,6 +520,41 @@ class AnalogueReader:
             return values[-1]
         return values[int(percent * len(values))]
 
+    # Integer read methods
+    #
+    # These are equivalent to percent(), range() etc... but use only integer maths, so they
+    # avoid allocating floats. This makes them faster on the Pico, which has no FPU, and
+    # reduces garbage collection in tight loops.
+
+    def raw_u16(self, samples=None):
+        """Return the averaged ADC reading as an integer in the range [0, MAX_UINT16]."""
+        return self._sample_adc(samples)
+
+    def _position_u16(self, samples=None, deadzone=None):
+        # Integer equivalent of percent(), scaled to [0, MAX_UINT16]
+        if deadzone is None:
+            dz = self._deadzone_u16
+        else:
+            dz = int(deadzone * MAX_UINT16)
+        value = self._sample_adc(samples)
+        value = value + (2 * value * dz) // MAX_UINT16 - dz
+        if value < 0:
+            return 0
+        if value > MAX_UINT16:
+            return MAX_UINT16
+        return value
+
+    def permille(self, samples=None, deadzone=None):
+        """Return the current relative position as an integer in the range [0, 1000]."""
+        return (self._position_u16(samples, deadzone) * 1000 + (MAX_UINT16 >> 1)) // MAX_UINT16
+
+    def range_int(self, steps=100, samples=None, deadzone=None):
+        """Integer-only equivalent of ``range()``; returns a value in [0, steps)."""
+        value = self._position_u16(samples, deadzone) * steps // MAX_UINT16
+        if value >= steps:
+            return steps - 1
+        return value
+
 
 class AnalogueInput(AnalogueReader):
     """A class for handling the reading of analogue control voltage.
@@ -223,6 +596,38 @@ class AnalogueInput(AnalogueReader):
                 )
         self._gradients.append(self._gradients[-1])
 
+        # Integer equivalents of the above for permille(), range_int() and the lookup table
+        self._span = INPUT_CALIBRATION_VALUES[-1] - INPUT_CALIBRATION_VALUES[0]
+        self._diffs = []
+        for index, value in enumerate(INPUT_CALIBRATION_VALUES[:-1]):
+            self._diffs.append(INPUT_CALIBRATION_VALUES[index + 1] - value)
+        self._diffs.append(self._diffs[-1])
+
+        # Precompute the calibrated voltage, in millivolts, for every 12-bit ADC code. Readings
+        # are then converted with a single lookup & interpolation instead of the calibration maths
+        # The extra entry at the end lets us interpolate above the last code
+        min_mv = int(min_voltage * 1000)
+        max_mv = int(max_voltage * 1000)
+        self._mv_table = array(
+            "h",
+            (clamp(self._raw_to_mv(code << 4), min_mv, max_mv) for code in range(MAX_ADC_RAW + 2)),
+        )
+
+    def _raw_to_mv(self, raw_reading):
+        # Convert a raw 16-bit ADC reading to calibrated millivolts using integer maths
+        reading = raw_reading - INPUT_CALIBRATION_VALUES[0]
+        if reading < 0:
+            reading = 0
+        # low precision vs. high precision
+        if len(self._diffs) == 2:
+            return 10000 * reading // self._span
+        index = reading * (len(INPUT_CALIBRATION_VALUES) - 1) // self._span
+        if index >= len(INPUT_CALIBRATION_VALUES):
+            index = len(INPUT_CALIBRATION_VALUES) - 1
+        return index * 1000 + (
+            1000 * (raw_reading - INPUT_CALIBRATION_VALUES[index]) // self._diffs[index]
+        )
+
     def percent(self, samples=None, deadzone=None):
         """Current voltage as a relative percentage of the component's range."""
         # Determine the percent value from the max calibration value.
@@ -234,23 +639,35 @@ class AnalogueInput(AnalogueReader):
         return max(reading / max_value, 0.0)
 
     def read_voltage(self, samples=None):
+        """Return the calibrated input voltage, clamped to the range MIN_VOLTAGE to MAX_VOLTAGE."""
+        return self.read_millivolts(samples) / 1000
+
+    def permille(self, samples=None, deadzone=None):
+        """Integer-only equivalent of ``percent()``; returns a value in [0, 1000]."""
+        reading = self._sample_adc(samples) - INPUT_CALIBRATION_VALUES[0]
+        if reading <= 0:
+            return 0
+        if reading >= self._span:
+            return 1000
+        return (reading * 1000 + (self._span >> 1)) // self._span
+
+    def range_int(self, steps=100, samples=None, deadzone=None):
+        """Integer-only equivalent of ``range()``; returns a value in [0, steps)."""
+        reading = self._sample_adc(samples) - INPUT_CALIBRATION_VALUES[0]
+        if reading <= 0:
+            return 0
+        if reading >= self._span:
+            return steps - 1
+        return reading * steps // self._span
+
+    def read_millivolts(self, samples=None):
+        """Integer-only equivalent of ``read_voltage()``; returns the input voltage in millivolts."""
         raw_reading = self._sample_adc(samples)
-        reading = raw_reading - INPUT_CALIBRATION_VALUES[0]
-        max_value = max(
-            reading,
-            INPUT_CALIBRATION_VALUES[-1] - INPUT_CALIBRATION_VALUES[0],
-        )
-        percent = max(reading / max_value, 0.0)
-        # low precision vs. high precision
-        if len(self._gradients) == 2:
-            cv = 10 * max(
-                reading / (INPUT_CALIBRATION_VALUES[-1] - INPUT_CALIBRATION_VALUES[0]),
-                0.0,
-            )
-        else:
-            index = int(percent * (len(INPUT_CALIBRATION_VALUES) - 1))
-            cv = index + (self._gradients[index] * (raw_reading - INPUT_CALIBRATION_VALUES[index]))
-        return clamp(cv, self.MIN_VOLTAGE, self.MAX_VOLTAGE)
+        table = self._mv_table
+        code = raw_reading >> 4
+        low = table[code]
+        # interpolate between adjacent codes using the extra precision from oversampling
+        return low + (((table[code + 1] - low) * (raw_reading & 0xF)) >> 4)
 
 
 class Knob(AnalogueReader):
@@ -303,6 +720,10 @@ class Knob(AnalogueReader):
         # Reverse range to provide increasing range.
         return 1.0 - super().percent(samples, deadzone)
 
+    def _position_u16(self, samples=None, deadzone=None):
+        # Reverse range to provide increasing range.
+        return MAX_UINT16 - super()._position_u16(samples, deadzone)
+
     def read_position(self, steps=100, samples=None, deadzone=None):
         """Returns the position as a value between zero and provided integer."""
         return self.range(steps, samples, deadzone)
@@ -334,6 +755,18 @@ class DigitalReader:
         self.last_rising_ms = 0
         self.last_falling_ms = 0
 
+        # Edge capture ring buffer; see capture_edges()
+        self._edge_times = None
+        self._edge_levels = None
+        self._edge_head = 0
+        self._edge_tail = 0
+        self._edge_wrap = 0
+        self._dispatch = False
+        self._dispatch_pending = False
+        self._dispatch_ref = None
+        self.last_rising_us = 0
+        self.last_period_us = 0
+
     def _bounce_wrapper(self, pin):
         """IRQ handler wrapper for falling and rising edge callback functions."""
         if self.value() == HIGH:
@@ -362,19 +795,25 @@ class DigitalReader:
         # (high when on, low when off)
         return LOW if self.pin.value() else HIGH
 
+    def _enable_irq(self):
+        if self._edge_times is None:
+            self.pin.irq(handler=self._bounce_wrapper)
+        else:
+            self.pin.irq(handler=self._capture_wrapper, hard=True)
+
     def handler(self, func):
         """Define the callback function to call when rising edge detected."""
         if not callable(func):
             raise ValueError("Provided handler func is not callable")
         self._rising_handler = func
-        self.pin.irq(handler=self._bounce_wrapper)
+        self._enable_irq()
 
     def handler_falling(self, func):
         """Define the callback function to call when falling edge detected."""
         if not callable(func):
             raise ValueError("Provided handler func is not callable")
         self._falling_handler = func
-        self.pin.irq(handler=self._bounce_wrapper)
+        self._enable_irq()
 
     def reset_handler(self):
         self.pin.irq(handler=None)
@@ -385,7 +824,112 @@ class DigitalReader:
             raise ValueError("Provided handler func is not callable")
         self._other = other
         self._both_handler = func
-        self.pin.irq(handler=self._bounce_wrapper)
+        self._enable_irq()
+
+    def capture_edges(self, size=32, dispatch=False):
+        """Record edge timestamps in a ring buffer instead of running handlers inside the IRQ.
+
+        In capture mode the IRQ only stores the ``ticks_us()`` timestamp and level of each edge
+        in a preallocated buffer. It allocates no memory, so nothing is lost to garbage collection
+        pauses and edges are timed to the microsecond. The recorded edges are delivered later,
+        either by calling ``drain()`` from the main loop or, if ``dispatch`` is True, by running
+        the normal ``handler()`` & ``handler_falling()`` callbacks via ``micropython.schedule``::
+
+            din.capture_edges()
+
+            while True:
+                din.drain(lambda ticks_us, level: print(ticks_us, level))
+
+        Debouncing is not applied to captured edges.
+
+        If more than ``size`` edges arrive between calls to ``drain()`` the oldest are dropped.
+
+        :param size:  The number of edges the ring buffer can hold
+        :param dispatch:  If True, schedule the rising/falling handlers for every recorded edge
+        """
+        self._edge_times = array("L", [0] * size)
+        self._edge_levels = bytearray(size)
+        self._edge_head = 0
+        self._edge_tail = 0
+        # The head & tail counters wrap at a multiple of size to keep them small ints;
+        # the IRQ must not allocate memory
+        self._edge_wrap = size << 16
+        self._dispatch = dispatch
+        self._dispatch_pending = False
+        self._dispatch_ref = self._dispatch_edges
+        self._enable_irq()
+
+    def stop_capture_edges(self):
+        """Leave capture mode and return to running handlers directly from the IRQ."""
+        self._edge_times = None
+        self._edge_levels = None
+        self._enable_irq()
+
+    def _record_edge(self, now_us, level):
+        # Add an edge to the ring buffer. Called from IRQs, so must not allocate memory
+        head = self._edge_head
+        index = head % len(self._edge_times)
+        self._edge_times[index] = now_us
+        self._edge_levels[index] = level
+        self._edge_head = (head + 1) % self._edge_wrap
+
+        if level == HIGH:
+            self.last_period_us = time.ticks_diff(now_us, self.last_rising_us)
+            self.last_rising_us = now_us
+            self.last_rising_ms = time.ticks_ms()
+        else:
+            self.last_falling_ms = time.ticks_ms()
+
+    def _capture_wrapper(self, pin):
+        """IRQ handler that records edges into the ring buffer. Must not allocate memory."""
+        self._record_edge(time.ticks_us(), self.value())
+
+        if self._dispatch and not self._dispatch_pending:
+            self._dispatch_pending = True
+            try:
+                micropython.schedule(self._dispatch_ref, None)
+            except Exception:
+                # the schedule queue is full; the edges will be dispatched with the next one
+                self._dispatch_pending = False
+
+    def _dispatch_edges(self, _):
+        self._dispatch_pending = False
+        self.drain(self._dispatch_edge)
+
+    def _dispatch_edge(self, ticks_us, level):
+        if level == HIGH:
+            self._rising_handler()
+        else:
+            self._falling_handler()
+
+    def pending_edges(self):
+        """Return the number of recorded edges that have not been drained yet."""
+        if self._edge_times is None:
+            return 0
+        return min((self._edge_head - self._edge_tail) % self._edge_wrap, len(self._edge_times))
+
+    def drain(self, func):
+        """Deliver every recorded edge, oldest first, to the given function.
+
+        :param func:  Called as ``func(ticks_us, level)`` for each edge, where ``level`` is HIGH for a
+            rising edge and LOW for a falling edge
+        :return:  The number of edges delivered
+        """
+        if self._edge_times is None:
+            return 0
+        size = len(self._edge_times)
+        head = self._edge_head
+        count = (head - self._edge_tail) % self._edge_wrap
+        if count > size:
+            # we were too slow; the oldest edges have been overwritten
+            count = size
+        tail = (head - count) % self._edge_wrap
+        for _ in range(count):
+            index = tail % size
+            func(self._edge_times[index], self._edge_levels[index])
+            tail = (tail + 1) % self._edge_wrap
+        self._edge_tail = tail
+        return count
 
 
 class DigitalInput(DigitalReader):
@@ -471,6 +1015,108 @@ class Button(DigitalReader):
         return self.last_rising_ms
 
 
+class PwmSlices:
+    """Tracks the configuration of the PWM slices that drive the CV outputs.
+
+    Each of the Pico's PWM slices drives two GPIO pins (channels A & B) which always share one
+    frequency. On EuroPi the outputs are paired as cv1 & cv2, cv3 & cv4 and cv5 & cv6, so changing
+    the PWM profile of an output also changes it for its partner.
+
+    A slice is only reprogrammed when its frequency actually changes, so configuring both outputs
+    of a pair, or re-applying the current profile, costs nothing.
+
+    :param num_slices:  The number of PWM slices on the microcontroller
+    """
+
+    def __init__(self, num_slices=PWM_SLICES_RP2040):
+        self.num_slices = num_slices
+        self._freqs = {}
+        # slice -> the name of its PWM profile
+        self._profiles = {}
+        # pin -> the Output using it
+        self._outputs = {}
+
+    def slice_of(self, pin):
+        """Return the PWM slice that drives the given GPIO pin"""
+        # GPIO 0-31 cycle through slices 0-7 on both chips; the RP2350B's GPIO 32-47 use 8-11
+        if pin < 32:
+            return (pin >> 1) & 7
+        return 8 + ((pin >> 1) & 3)
+
+    def channel_of(self, pin):
+        """Return the PWM channel of the given GPIO pin: 0 for A, 1 for B"""
+        return pin & 1
+
+    def profile_freq(self, profile):
+        """Return the PWM frequency in Hz to use for the given profile
+
+        :param profile:  One of ``"default"``, ``"audio"`` or ``"precision"``
+        :raises ValueError: if the profile is unknown
+        """
+        if profile not in PWM_PROFILE_FREQS:
+            raise ValueError(f"Unknown PWM profile: {profile}")
+        pwm_freq = PWM_PROFILE_FREQS[profile]
+        if pwm_freq is None:
+            # Round up so the period is at most MAX_UINT16 + 1 cycles, keeping the clock divider at 1
+            pwm_freq = (freq() + MAX_UINT16) // (MAX_UINT16 + 1)
+        return pwm_freq
+
+    def configure(self, pwm, pin, pwm_freq):
+        """Set the frequency of the slice driving the given pin, if it has changed
+
+        :param pwm:  The PWM object for the pin
+        :param pin:  The GPIO pin number
+        :param pwm_freq:  The desired PWM frequency in Hz
+        :return: True if the slice was reprogrammed, otherwise False
+        """
+        slice_id = self.slice_of(pin)
+        if self._freqs.get(slice_id) == pwm_freq:
+            return False
+        pwm.freq(pwm_freq)
+        self._freqs[slice_id] = pwm_freq
+        return True
+
+    def set_profile(self, output, profile):
+        """Set the PWM profile of the slice driving an Output
+
+        Every Output on the same slice has its ``pwm_profile`` updated. If the slice's frequency
+        changed, their duty cycles are written again so they keep the same voltage.
+
+        :param output:  The Output whose profile is being set
+        :param profile:  The name of the profile to use
+        :raises ValueError: if the profile is unknown
+        """
+        pwm_freq = self.profile_freq(profile)
+        slice_id = self.slice_of(output.pin_id)
+        self._outputs[output.pin_id] = output
+        reprogrammed = self.configure(output.pin, output.pin_id, pwm_freq)
+        self._profiles[slice_id] = profile
+        for pin, other in self._outputs.items():
+            if self.slice_of(pin) == slice_id:
+                other.pwm_profile = profile
+                if reprogrammed:
+                    other.pin.duty_u16(clamp(other._duty, 0, MAX_UINT16))
+
+    def profile_of(self, pin):
+        """Return the name of the PWM profile of the slice driving the given pin, or None if not set"""
+        return self._profiles.get(self.slice_of(pin))
+
+    def freq_of(self, pin):
+        """Return the PWM frequency of the slice driving the given pin, or None if not configured"""
+        return self._freqs.get(self.slice_of(pin))
+
+    def steps(self, pin):
+        """Return the number of distinct duty cycles available on the given pin
+
+        Lower PWM frequencies give more steps (i.e. finer voltage resolution) at the cost of more
+        ripple on the output. Returns 0 if the pin's slice has not been configured.
+        """
+        pwm_freq = self.freq_of(pin)
+        if not pwm_freq:
+            return 0
+        return min(freq() // pwm_freq, MAX_UINT16 + 1)
+
+
 class Output:
     """A class for sending digital or analogue voltage to an output jack.
 
@@ -486,6 +1132,8 @@ class Output:
     :param max_voltage: The maximum allowed output voltage
     :param gate_voltage:  The voltage we use for gate signals (see ``.on()``, ``.off()``)
     :param calibration_values:  Calibration data for this output
+    :param pwm_profile:  The PWM profile to use; see ``set_pwm_profile()``. If the other output on
+        this output's PWM slice has already set a profile, that profile is used instead
     """
 
     def __init__(
@@ -495,25 +1143,100 @@ class Output:
         max_voltage=MAX_OUTPUT_VOLTAGE,
         gate_voltage=GATE_VOLTAGE,
         calibration_values=OUTPUT_CALIBRATION_VALUES[0],
+        pwm_profile=PWM_PROFILE_DEFAULT,
     ):
+        self.pin_id = pin
         self.pin = PWM(Pin(pin))
-        self.pin.freq(PWM_FREQ)
+        self._duty = 0
+        self.pwm_profile = None
+        # Don't reset a slice that is already in use by our partner
+        current_profile = pwm_slices.profile_of(pin)
+        self.set_pwm_profile(pwm_profile if current_profile is None else current_profile)
         self.MIN_VOLTAGE = min_voltage
         self.MAX_VOLTAGE = max_voltage
         self.gate_voltage = gate_voltage
 
         self._calibration_values = calibration_values
-        self._duty = 0
         self._gradients = []
         for index, value in enumerate(self._calibration_values[:-1]):
             self._gradients.append(self._calibration_values[index + 1] - value)
         self._gradients.append(self._gradients[-1])
 
+        # Optional voltage -> duty lookup table; see build_voltage_table()
+        self._voltage_table = None
+        self._table_resolution_mv = 1
+        self._min_mv = int(min_voltage * 1000)
+        self._max_mv = int(max_voltage * 1000)
+
+    def set_pwm_profile(self, profile):
+        """Change the PWM frequency/resolution tradeoff of this output
+
+        - ``"default"``: 100kHz PWM; a good balance of resolution & ripple for most uses
+        - ``"audio"``: faster PWM with lower ripple for audio-rate signals, at a coarser resolution
+        - ``"precision"``: full 16-bit resolution for precise DC levels & slow, smooth LFOs, at the
+          cost of more ripple
+
+        Outputs share PWM slices in pairs (cv1 & cv2, cv3 & cv4, cv5 & cv6), so this also changes
+        the profile of the other output in the pair. Both outputs keep their current voltage.
+
+        :param profile:  The name of the profile to use
+        """
+        pwm_slices.set_profile(self, profile)
+
     def _set_duty(self, cycle):
         cycle = int(cycle)
         self.pin.duty_u16(clamp(cycle, 0, MAX_UINT16))
         self._duty = cycle
 
+    def _mv_to_duty(self, millivolts):
+        # Integer-only equivalent of the calibration maths in voltage()
+        index = millivolts // 1000
+        return self._calibration_values[index] + (
+            self._gradients[index] * (millivolts - index * 1000) // 1000
+        )
+
+    def build_voltage_table(self, resolution_mv=1):
+        """
+        Precompute the calibrated duty cycle for every output voltage
+
+        Once the table is built, setting the output with ``voltage()`` or ``voltage_mv()`` costs a
+        single table lookup instead of the calibration maths. The table uses 2 bytes per entry;
+        at the default 1mV resolution this is about 20kB for a 0-10V output, so coarser resolutions
+        may be preferable if several outputs need a table.
+
+        :param resolution_mv:  The voltage step between table entries, in millivolts.
+        """
+        self._table_resolution_mv = resolution_mv
+        self._voltage_table = array(
+            "H",
+            (
+                clamp(self._mv_to_duty(mv), 0, MAX_UINT16)
+                for mv in range(0, self._max_mv + 1, resolution_mv)
+            ),
+        )
+
+    def free_voltage_table(self):
+        """Discard the lookup table created by ``build_voltage_table()`` to free its RAM"""
+        self._voltage_table = None
+
+    def _duty_for_voltage(self, voltage):
+        if self._voltage_table is not None:
+            return self._duty_for_mv(int(voltage * 1000 + 0.5))
+        voltage = clamp(voltage, self.MIN_VOLTAGE, self.MAX_VOLTAGE)
+        index = int(voltage // 1)
+        return int(self._calibration_values[index] + (self._gradients[index] * (voltage % 1)))
+
+    def _duty_for_mv(self, millivolts):
+        if millivolts < self._min_mv:
+            millivolts = self._min_mv
+        elif millivolts > self._max_mv:
+            millivolts = self._max_mv
+
+        table = self._voltage_table
+        if table is None:
+            return clamp(self._mv_to_duty(millivolts), 0, MAX_UINT16)
+        return table[millivolts // self._table_resolution_mv]
+
     def voltage(self, voltage=None):
         """
         Set the output voltage to the provided value within the range of MIN_VOLTAGE to MAX_VOLTAGE
@@ -524,9 +1247,20 @@ class Output:
         """
         if voltage is None:
             return self._duty / MAX_UINT16 * self.MAX_VOLTAGE
-        voltage = clamp(voltage, self.MIN_VOLTAGE, self.MAX_VOLTAGE)
-        index = int(voltage // 1)
-        self._set_duty(self._calibration_values[index] + (self._gradients[index] * (voltage % 1)))
+        self._set_duty(self._duty_for_voltage(voltage))
+
+    def voltage_mv(self, millivolts):
+        """
+        Set the output voltage using integer millivolts, avoiding floating-point maths
+
+        The value is clamped to the range of MIN_VOLTAGE to MAX_VOLTAGE. If a lookup table has been
+        built with ``build_voltage_table()`` the duty cycle is read directly from the table.
+
+        :param millivolts:  The desired output voltage in millivolts, e.g. ``2500`` for 2.5V
+        """
+        duty = self._duty_for_mv(millivolts)
+        self.pin.duty_u16(duty)
+        self._duty = duty
 
     def on(self):
         """
@@ -559,6 +1293,80 @@ class Output:
             self.off()
 
 
+class OutputBank(list):
+    """A list of Outputs that can be updated together.
+
+    ``cvs`` is an ``OutputBank``, so it can be used like a normal list (e.g. ``for cv in cvs``)
+    but also provides methods for setting every output from a single frame of values. The whole
+    frame is converted to duty cycles first and the PWM hardware is then written back-to-back,
+    which keeps the skew between channels to a minimum::
+
+        # compute every channel first...
+        frame = [lfo.value(t) for lfo in lfos]
+        # ...then update all of the outputs at once
+        cvs.set_voltages(frame)
+
+    Frames shorter than the bank only update the first ``len(frame)`` outputs.
+
+    Lazily-initialized outputs are created the first time the bank writes a frame, and the bank
+    then uses the real Outputs directly rather than going through their stand-ins.
+
+    :param outputs:  The Outputs in this bank
+    """
+
+    def __init__(self, outputs):
+        super().__init__(outputs)
+        self._duties = array("H", [0] * len(outputs))
+        self._outputs = None
+
+    def _real_outputs(self):
+        # Return the Outputs themselves, creating any that are lazily initialized
+        outputs = self._outputs
+        if outputs is None:
+            outputs = [o._lazy_get() if isinstance(o, LazyHardware) else o for o in self]
+            self._outputs = outputs
+        return outputs
+
+    def set_voltages(self, voltages):
+        """Set the voltage of several outputs at once
+
+        :param voltages:  A sequence of voltages. ``voltages[i]`` is applied to ``self[i]``
+        """
+        outputs = self._real_outputs()
+        duties = self._duties
+        for i in range(len(voltages)):
+            duties[i] = outputs[i]._duty_for_voltage(voltages[i])
+        self._write(duties, len(voltages))
+
+    def set_voltages_mv(self, millivolts):
+        """Set the voltage of several outputs at once using integer millivolts
+
+        :param millivolts:  A sequence of millivolt values. ``millivolts[i]`` is applied to ``self[i]``
+        """
+        outputs = self._real_outputs()
+        duties = self._duties
+        for i in range(len(millivolts)):
+            duties[i] = outputs[i]._duty_for_mv(millivolts[i])
+        self._write(duties, len(millivolts))
+
+    def set_duties(self, duties):
+        """Write raw PWM duty cycles to several outputs at once
+
+        No calibration is applied.
+
+        :param duties:  A sequence (e.g. an ``array('H')``) of 16-bit duty cycles. ``duties[i]`` is
+            applied to ``self[i]``
+        """
+        self._write(duties, len(duties))
+
+    def _write(self, duties, count):
+        outputs = self._real_outputs()
+        for i in range(count):
+            output = outputs[i]
+            output.pin.duty_u16(duties[i])
+            output._duty = duties[i]
+
+
 class Thermometer:
     """
     Wrapper for the temperature sensor connected to Pin 4
@@ -622,7 +1430,59 @@ class UsbConnection:
                 return 0
 
 
+class LazyHardware:
+    """A stand-in for a hardware object that is only created the first time it is used.
+
+    Creating every input, output & peripheral at import time slows down booting and uses RAM for
+    objects that many scripts never touch. A LazyHardware object behaves like the object returned
+    by ``factory``; the real object is created on the first attribute access and every attribute
+    read or write is passed through to it.
+
+    Methods are looked up through the stand-in only once: after that they are cached on the
+    stand-in itself, so e.g. ``cv1.voltage(...)`` costs the same as calling the real object.
+
+    :param factory:  A callable with no arguments that creates the real object
+    """
+
+    def __init__(self, factory):
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_obj", None)
+
+    def _lazy_get(self):
+        """Return the real object, creating it if needed"""
+        obj = self._lazy_obj
+        if obj is None:
+            obj = self._lazy_factory()
+            object.__setattr__(self, "_lazy_obj", obj)
+        return obj
+
+    def __getattr__(self, name):
+        obj = self._lazy_get()
+        value = getattr(obj, name)
+        if callable(value) and hasattr(type(obj), name):
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._lazy_get(), name, value)
+        # drop any cached method so the next lookup sees the new value
+        if name in self.__dict__:
+            object.__delattr__(self, name)
+
+
+# PWM slice bookkeeping for the outputs
+if europi_config.PICO_MODEL == MODEL_PICO_2 or europi_config.PICO_MODEL == MODEL_PICO_2W:
+    pwm_slices = PwmSlices(PWM_SLICES_RP2350)
+else:
+    pwm_slices = PwmSlices(PWM_SLICES_RP2040)
+
+# Bulk sampler shared by the analogue inputs & knobs
+adc_sampler = AdcSampler([PIN_AIN, PIN_K1, PIN_K2])
+
 # Define all the I/O using the appropriate class and with the pins used
+# The inputs & buttons are cheap to create, and scripts check their types (e.g. to reverse knobs),
+# so they're created immediately. The outputs & other peripherals are created the first time
+# they're used; see LazyHardware & init_hardware()
 din = DigitalInput(PIN_DIN)
 ain = AnalogueInput(PIN_AIN)
 k1 = Knob(PIN_K1)
@@ -630,30 +1490,92 @@ k2 = Knob(PIN_K2)
 b1 = Button(PIN_B1)
 b2 = Button(PIN_B2)
 
+# Background sampler for the analogue inputs & knobs; stopped until a script starts it
+adc_service = AdcSamplingService([ain, k1, k2])
+
+
+def _make_output(pin, index, pwm_profile):
+    output = Output(
+        pin,
+        calibration_values=OUTPUT_CALIBRATION_VALUES[index],
+        pwm_profile=pwm_profile,
+    )
+    # make sure a newly-created output starts at 0V, whatever the PWM was doing before
+    output.off()
+    return output
+
+
 # Output CVs
-cv1 = Output(PIN_CV1, calibration_values=OUTPUT_CALIBRATION_VALUES[0])
-cv2 = Output(PIN_CV2, calibration_values=OUTPUT_CALIBRATION_VALUES[1])
-cv3 = Output(PIN_CV3, calibration_values=OUTPUT_CALIBRATION_VALUES[2])
-cv4 = Output(PIN_CV4, calibration_values=OUTPUT_CALIBRATION_VALUES[3])
-cv5 = Output(PIN_CV5, calibration_values=OUTPUT_CALIBRATION_VALUES[4])
-cv6 = Output(PIN_CV6, calibration_values=OUTPUT_CALIBRATION_VALUES[5])
-cvs = [cv1, cv2, cv3, cv4, cv5, cv6]
+# Each pair of outputs shares a PWM slice, so they share a PWM profile too
+cv1 = LazyHardware(lambda: _make_output(PIN_CV1, 0, europi_config.PWM_PROFILE_CV1_CV2))
+cv2 = LazyHardware(lambda: _make_output(PIN_CV2, 1, europi_config.PWM_PROFILE_CV1_CV2))
+cv3 = LazyHardware(lambda: _make_output(PIN_CV3, 2, europi_config.PWM_PROFILE_CV3_CV4))
+cv4 = LazyHardware(lambda: _make_output(PIN_CV4, 3, europi_config.PWM_PROFILE_CV3_CV4))
+cv5 = LazyHardware(lambda: _make_output(PIN_CV5, 4, europi_config.PWM_PROFILE_CV5_CV6))
+cv6 = LazyHardware(lambda: _make_output(PIN_CV6, 5, europi_config.PWM_PROFILE_CV5_CV6))
+cvs = OutputBank([cv1, cv2, cv3, cv4, cv5, cv6])
 
 # Helper object for reading the onboard temperature sensor
-thermometer = Thermometer()
+thermometer = LazyHardware(Thermometer)
 
 # Helper object to detect if the USB cable is connected or not
 usb_connected = UsbConnection()
 
 # External I2C
-external_i2c = I2C(
-    europi_config.EXTERNAL_I2C_CHANNEL,
-    sda=Pin(europi_config.EXTERNAL_I2C_SDA),
-    scl=Pin(europi_config.EXTERNAL_I2C_SCL),
-    freq=europi_config.EXTERNAL_I2C_FREQUENCY,
-    timeout=europi_config.EXTERNAL_I2C_TIMEOUT,
+external_i2c = LazyHardware(
+    lambda: I2C(
+        europi_config.EXTERNAL_I2C_CHANNEL,
+        sda=Pin(europi_config.EXTERNAL_I2C_SDA),
+        scl=Pin(europi_config.EXTERNAL_I2C_SCL),
+        freq=europi_config.EXTERNAL_I2C_FREQUENCY,
+        timeout=europi_config.EXTERNAL_I2C_TIMEOUT,
+    )
+)
+
+# Names of the objects created by init_hardware()
+LAZY_HARDWARE = (
+    "cv1",
+    "cv2",
+    "cv3",
+    "cv4",
+    "cv5",
+    "cv6",
+    "thermometer",
+    "external_i2c",
 )
 
+# Names of objects that are always created immediately. init_hardware() accepts them, so scripts
+# can list everything they use
+EAGER_HARDWARE = ("din", "ain", "k1", "k2", "b1", "b2", "usb_connected")
+
+
+def init_hardware(subset=None):
+    """Create lazily-initialized hardware objects now, instead of the first time they're used
+
+    :param subset:  An iterable of the names of the objects to create, e.g. ``["cv1", "k1"]``.
+        If None, every lazily-initialized object is created.
+    :raises ValueError: if a name is not a lazily-initialized hardware object
+    """
+    if subset is None:
+        subset = LAZY_HARDWARE
+    for name in subset:
+        if name in EAGER_HARDWARE:
+            continue
+        if name not in LAZY_HARDWARE:
+            raise ValueError(f"Unknown hardware object: {name}")
+        globals()[name]._lazy_get()
+
+
+def is_initialized(obj):
+    """Has the given hardware object been created yet?
+
+    Objects that are not lazily initialized are always considered to be initialized.
+
+    :param obj:  A hardware object, e.g. ``cv1``
+    """
+    return not isinstance(obj, LazyHardware) or obj._lazy_obj is not None
+
+
 # Set the desired clock speed according to the configuration
 # By default this will overclock the CPU, but some users may not want to
 # e.g. to lower power consumption on a very power-constrained system
@@ -23,97 +23,334 @@ We define 4 levels of log:
 Each log item has a level and a tag associated with it. The tag should be
 unique to each module to make tracing the source of warnings easier
 
-Log messages are written to the console and saved to /europi_log.txt. Importing
-the ``europi`` module will reset the log file.
+Up to 3 further arguments are substituted into the message with the ``%`` operator, but
+only if the message is going to be logged. Prefer this to building the message with an
+f-string, which is done even if the message is discarded. The arguments are fixed parameters
+rather than ``*args``, so a discarded message doesn't allocate anything::
+
+    log_warning("Failed to process packet: %s", "osc", err)
+    log_debug("Raw packet: %s", None, data)
+
+Messages below the current log level (see ``set_log_level``, and ``LOG_LEVEL`` in
+CONFIGURATION.md) are discarded. Other messages are written to the console immediately.
+Warnings & errors are saved to /europi_log.txt straight away; info & debug messages are kept in
+RAM and saved in batches. A batch is saved when ``LOG_FLUSH_LINES`` messages are waiting, when
+``flush_log()`` is called, or by a timer ``LOG_FLUSH_INTERVAL_MS`` after the oldest waiting
+message was logged, so messages reach flash even if nothing else is logged before the power is
+cut. This keeps slow flash writes out of loops that log frequently.
+
+When /europi_log.txt grows beyond ``LOG_MAX_BYTES`` it is renamed to /europi_log.1.txt,
+/europi_log.1.txt is renamed to /europi_log.2.txt, and so on; at most ``LOG_MAX_FILES`` files
+are kept.
 """
 
 import os
+import utime
+from machine import Timer
+
+LOG_LEVEL_DEBUG = "debug"
+LOG_LEVEL_INFO = "info"
+LOG_LEVEL_WARNING = "warning"
+LOG_LEVEL_ERROR = "error"
+
+LOG_LEVELS = [LOG_LEVEL_DEBUG, LOG_LEVEL_INFO, LOG_LEVEL_WARNING, LOG_LEVEL_ERROR]
+
+# The file the log is saved to
+LOG_FILE = "/europi_log.txt"
+
+# The maximum number of messages kept in RAM. If saving the log fails, the oldest
+# waiting messages are discarded to make room for new ones
+LOG_BUFFER_LINES = 32
+
+# The number of waiting messages that triggers a save
+LOG_FLUSH_LINES = 16
+
+# The longest a message waits before it is saved, provided something else is logged
+LOG_FLUSH_INTERVAL_MS = 5000
+
+# The size at which the log file is rotated, in bytes
+LOG_MAX_BYTES = 16384
+
+# The number of log files kept, including the current one
+LOG_MAX_FILES = 3
+
+# The numeric value of each level; messages are kept if their level is >= _level
+_DEBUG = 0
+_INFO = 1
+_WARNING = 2
+_ERROR = 3
+
+_level = _INFO
+
+# Default for the format arguments of log_info() etc., so None can be logged
+_NO_ARG = object()
+
+# Ring buffer of messages that haven't been saved yet
+_buffer = [None] * LOG_BUFFER_LINES
+_head = 0  # index of the oldest waiting message
+_count = 0  # number of waiting messages
+_oldest_at = 0  # utime.ticks_ms() when the oldest waiting message was logged
+
+# Size of LOG_FILE, or None if it hasn't been checked yet
+_file_size = None
+
+# One-shot timer that saves waiting messages; created when it's first needed
+_flush_timer = None
+_flush_timer_armed = False
 
+# True while the buffer is being changed, so the timer doesn't save it halfway through
+_busy = False
 
-def log_info(message, tag=None):
+
+def set_log_level(level):
+    """
+    Set the minimum level of the messages that are logged
+
+    This is done automatically by europi.py using the ``LOG_LEVEL`` setting
+
+    :param level:  One of ``LOG_LEVELS``, e.g. ``LOG_LEVEL_WARNING`` to discard info & debug
+        messages
+    :raises ValueError: if the level isn't one of ``LOG_LEVELS``
+    """
+    global _level
+    if level not in LOG_LEVELS:
+        raise ValueError(f"Unknown log level {level}")
+    _level = LOG_LEVELS.index(level)
+
+
+def get_log_level():
+    """
+    Get the minimum level of the messages that are logged
+
+    :return:  One of ``LOG_LEVELS``
+    """
+    return LOG_LEVELS[_level]
+
+
+def log_info(message, tag=None, a=_NO_ARG, b=_NO_ARG, c=_NO_ARG):
     """
     Log a simple information message.
 
-    :param message: The message to log
+    :param message: The message to log. If ``a`` is given, this is a format string
     :param tag: An optional tag to use as a prefix (e.g. the module name)
+    :param a, b, c: Up to 3 values to substitute into the message with the ``%`` operator
     """
-    if tag:
-        write_log_entry(f"[INFO] [{tag}] {message}")
-    else:
-        write_log_entry(f"[INFO] {message}")
+    if _level > _INFO:
+        return
+    _log_entry("[INFO]", message, tag, a, b, c)
 
 
-def log_warning(message, tag=None):
+def log_warning(message, tag=None, a=_NO_ARG, b=_NO_ARG, c=_NO_ARG):
     """
     Log a warning message.
 
-    Warnings indicate an abnormal state, but are recoverable or can be worked-around.
+    Warnings indicate an abnormal state, but are recoverable or can be worked-around. Warnings
+    are saved to the log file immediately.
 
-    :param message: The message to log
+    :param message: The message to log. If ``a`` is given, this is a format string
     :param tag: An optional tag to use as a prefix (e.g. the module name)
+    :param a, b, c: Up to 3 values to substitute into the message with the ``%`` operator
     """
-    if tag:
-        write_log_entry(f"[WARN] [{tag}] {message}")
-    else:
-        write_log_entry(f"[WARN] {message}")
+    if _level > _WARNING:
+        return
+    _log_entry("[WARN]", message, tag, a, b, c)
+    flush_log()
 
 
-def log_error(message, tag=None):
+def log_error(message, tag=None, a=_NO_ARG, b=_NO_ARG, c=_NO_ARG):
     """
     Log an error message.
 
     Errors are critical and may indicate a crash, missing hardware, or other
-    unrecoverable errors.
+    unrecoverable errors. Errors are always logged, and are saved to the log file
+    immediately.
 
-    :param message: The message to log
+    :param message: The message to log. If ``a`` is given, this is a format string
     :param tag: An optional tag to use as a prefix (e.g. the module name)
+    :param a, b, c: Up to 3 values to substitute into the message with the ``%`` operator
     """
-    if tag:
-        write_log_entry(f"[ERR ] [{tag}] {message}")
-    else:
-        write_log_entry(f"[ERR ] {message}")
+    _log_entry("[ERR ]", message, tag, a, b, c)
+    flush_log()
 
 
-def log_debug(message, tag=None):
+def log_debug(message, tag=None, a=_NO_ARG, b=_NO_ARG, c=_NO_ARG):
     """
     Log a debugging message.
 
     Debug messages are for developers and can contain very low-level, code-related
-    information.
+    information. They are discarded unless the log level is ``LOG_LEVEL_DEBUG``, so
+    calls can be left in frequently-run code.
 
-    :param message: The message to log
+    :param message: The message to log. If ``a`` is given, this is a format string
     :param tag: An optional tag to use as a prefix (e.g. the module name)
+    :param a, b, c: Up to 3 values to substitute into the message with the ``%`` operator
     """
+    if _level > _DEBUG:
+        return
+    _log_entry("[DBUG]", message, tag, a, b, c)
+
+
+def _log_entry(prefix, message, tag, a, b, c):
+    # Format a message that passed the level check & add it to the log
+    if a is not _NO_ARG:
+        if b is _NO_ARG:
+            args = (a,)
+        elif c is _NO_ARG:
+            args = (a, b)
+        else:
+            args = (a, b, c)
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            # a mismatched format string shouldn't stop the script; log everything we were given
+            message = f"{message} {args}"
     if tag:
-        write_log_entry(f"[DBUG] [{tag}] {message}")
+        write_log_entry(f"{prefix} [{tag}] {message}")
     else:
-        write_log_entry(f"[DBUG] {message}")
+        write_log_entry(f"{prefix} {message}")
 
 
 def write_log_entry(log_entry: str):
     """
     Write line to the log.
 
-    When logged, the message is written to the console and saved to /europi_log.txt
+    The line is written to the console immediately and saved to /europi_log.txt with the
+    next batch. Unlike ``log_info`` etc. the log level isn't checked.
 
     :param log_entry:  The line of text to write to the log
     """
+    global _head, _count, _oldest_at, _busy
     print(log_entry)
+
+    _busy = True
     try:
-        with open("/europi_log.txt", "a") as log_out:
-            log_out.write(log_entry)
-            log_out.write("\n")
-    except Exception:
+        now = utime.ticks_ms()
+        if _count == 0:
+            _oldest_at = now
+        elif _count == LOG_BUFFER_LINES:
+            # a previous save failed & the buffer is full; drop the oldest message
+            _head = (_head + 1) % LOG_BUFFER_LINES
+            _count -= 1
+        _buffer[(_head + _count) % LOG_BUFFER_LINES] = log_entry
+        _count += 1
+
+        if _count >= LOG_FLUSH_LINES or utime.ticks_diff(now, _oldest_at) >= LOG_FLUSH_INTERVAL_MS:
+            flush_log()
+        elif not _flush_timer_armed:
+            _arm_flush_timer(LOG_FLUSH_INTERVAL_MS - utime.ticks_diff(now, _oldest_at))
+    finally:
+        _busy = False
+
+
+def _arm_flush_timer(period):
+    global _flush_timer, _flush_timer_armed
+    if _flush_timer is None:
+        _flush_timer = Timer()
+    _flush_timer_armed = True
+    _flush_timer.init(mode=Timer.ONE_SHOT, period=max(period, 1), callback=_on_flush_timer)
+
+
+def _on_flush_timer(timer):
+    # Timer callbacks run between two bytecodes of the main program; if it was changing the
+    # buffer, try again shortly
+    global _flush_timer_armed
+    _flush_timer_armed = False
+    if _busy:
+        _arm_flush_timer(100)
+    else:
+        flush_log()
+
+
+def _rotated_name(index):
+    # The name of the index'th old log file; 0 is the current log
+    if index == 0:
+        return LOG_FILE
+    base, ext = LOG_FILE.rsplit(".", 1)
+    return f"{base}.{index}.{ext}"
+
+
+def _rotate_log():
+    # Shift every log file along by one, discarding the oldest
+    try:
+        os.remove(_rotated_name(LOG_MAX_FILES - 1))
+    except OSError:
         pass
+    for index in range(LOG_MAX_FILES - 2, -1, -1):
+        try:
+            os.rename(_rotated_name(index), _rotated_name(index + 1))
+        except OSError:
+            pass
 
 
-def init_log():
+def flush_log():
     """
-    Initialize the log file.
+    Save any waiting log messages to /europi_log.txt
 
-    This is done automatically by europi.py when it is imported
+    This is called automatically, but scripts may call it before a long-running operation
+    or a reset to make sure nothing is lost.
     """
+    global _busy
+    busy = _busy
+    _busy = True
+    try:
+        _flush_log()
+    finally:
+        _busy = busy
+
+
+def _flush_log():
+    global _head, _count, _file_size
+    if _count == 0:
+        return
+
+    lines = []
+    for i in range(_count):
+        index = (_head + i) % LOG_BUFFER_LINES
+        lines.append(_buffer[index])
+        _buffer[index] = None
+    lines.append("")
+    batch = "\n".join(lines)
+
     try:
-        os.remove("/europi_log.txt")
+        if _file_size is None:
+            try:
+                _file_size = os.stat(LOG_FILE)[6]
+            except OSError:
+                _file_size = 0
+        if _file_size > 0 and _file_size + len(batch) > LOG_MAX_BYTES:
+            _rotate_log()
+            _file_size = 0
+
+        with open(LOG_FILE, "a") as log_out:
+            log_out.write(batch)
+        _file_size += len(batch)
     except Exception:
-        pass
+        # put the messages back; they'll be retried with the next batch
+        for i in range(_count):
+            _buffer[(_head + i) % LOG_BUFFER_LINES] = lines[i]
+        return
+
+    _head = 0
+    _count = 0
+
+
+def init_log():
+    """
+    Initialize the log file.
+
+    Any waiting messages are discarded and all log files, including rotated ones, are removed.
+    """
+    global _head, _count, _file_size, _flush_timer_armed
+    if _flush_timer is not None:
+        _flush_timer.deinit()
+    _flush_timer_armed = False
+    for index in range(LOG_MAX_FILES):
+        try:
+            os.remove(_rotated_name(index))
+        except Exception:
+            pass
+    for index in range(LOG_BUFFER_LINES):
+        _buffer[index] = None
+    _head = 0
+    _count = 0
+    _file_size = 0
@@ -15,10 +15,128 @@
 
 import os
 import json
+import struct
 from utime import ticks_diff, ticks_ms
 from configuration import ConfigSpec, ConfigFile
 from europi_config import EuroPiConfig
-from file_utils import load_file, delete_file, load_json_file
+from europi_log import log_warning
+from file_utils import atomic_write, load_file, delete_file, load_json_file, recover_file
+from file_utils import BACKUP_SUFFIX
+
+
+class StateSchema:
+    """Describes the layout of a script's state for ``save_state_struct()`` & ``load_state_struct()``
+
+    The state is a dict whose values are numbers, or (nested) lists of them. Each field
+    is stored as fixed-size binary values using a ``struct`` format character, so files are much
+    smaller than JSON and are read & written a row at a time rather than built up in RAM.
+
+    Each field is a tuple of ``(name, format)`` for a single value, or ``(name, format, shape)``
+    for a list, where ``shape`` is the length of the list or a tuple of lengths for nested lists.
+    For example, 6 banks of 6 channels of 64 steps, stored as 16-bit integers::
+
+        SCHEMA = StateSchema([
+            ("bank", "B"),
+            ("recording", "B"),
+            ("steps", "h", (6, 6, 64)),
+        ])
+
+    Useful formats are ``"b"``/``"B"`` (8-bit int), ``"h"``/``"H"`` (16-bit int), ``"i"``/``"I"``
+    (32-bit int) and ``"f"`` (32-bit float). Capital letters are unsigned. MicroPython's ``struct``
+    has no bool format, so store booleans as ``"B"`` and convert them with ``bool()`` when the
+    state is loaded.
+
+    Files start with a signature of the schema. If the schema changes, files saved with the old
+    one aren't loaded.
+
+    :param fields:  A list of field tuples, in the order they are stored
+    """
+
+    FORMATS = "bBhHiIlLqQf"
+    MAGIC = b"EPS1"
+
+    def __init__(self, fields):
+        self.fields = []
+        for field in fields:
+            name, fmt = field[0], field[1]
+            shape = field[2] if len(field) > 2 else ()
+            if type(shape) is int:
+                shape = (shape,)
+            if len(fmt) != 1 or fmt not in self.FORMATS:
+                raise ValueError(f"Unsupported format {fmt} for {name}")
+            for length in shape:
+                if length < 1:
+                    raise ValueError(f"Invalid shape {shape} for {name}")
+            self.fields.append((name, fmt, tuple(shape)))
+
+        # 16-bit FNV-1a hash of the field descriptions
+        signature = 0x811C
+        for b in repr(self.fields).encode():
+            signature = ((signature ^ b) * 0x0193) & 0xFFFF
+        self.signature = signature
+
+    def _header(self):
+        return self.MAGIC + struct.pack("<H", self.signature)
+
+    def write(self, file, state):
+        """Write the state to an open binary file
+
+        :param file:  The file to write to
+        :param state:  A dict with a value for every field
+        :raises ValueError: if a field is missing or a list has the wrong length
+        """
+        file.write(self._header())
+        for name, fmt, shape in self.fields:
+            if name not in state:
+                raise ValueError(f"State has no value for {name}")
+            if not shape:
+                file.write(struct.pack("<" + fmt, state[name]))
+                continue
+            # every innermost list is packed into the same buffer & written in one go
+            row_format = f"<{shape[-1]}{fmt}"
+            buf = bytearray(struct.calcsize(row_format))
+            self._write_rows(file, state[name], shape, row_format, buf, name)
+
+    def _write_rows(self, file, value, shape, row_format, buf, name):
+        if len(value) != shape[0]:
+            raise ValueError(f"{name} has length {len(value)}, expected {shape[0]}")
+        if len(shape) == 1:
+            struct.pack_into(row_format, buf, 0, *value)
+            file.write(buf)
+        else:
+            for item in value:
+                self._write_rows(file, item, shape[1:], row_format, buf, name)
+
+    def read(self, file):
+        """Read the state from an open binary file
+
+        :param file:  The file to read from
+        :return:  A dict with a value for every field
+        :raises ValueError: if the file wasn't written with this schema, or is truncated
+        """
+        header = self._header()
+        if file.read(len(header)) != header:
+            raise ValueError("State was saved with a different schema")
+        state = {}
+        for name, fmt, shape in self.fields:
+            if not shape:
+                size = struct.calcsize("<" + fmt)
+                data = file.read(size)
+                if len(data) != size:
+                    raise ValueError(f"State is truncated at {name}")
+                state[name] = struct.unpack("<" + fmt, data)[0]
+            else:
+                row_format = f"<{shape[-1]}{fmt}"
+                buf = bytearray(struct.calcsize(row_format))
+                state[name] = self._read_rows(file, shape, row_format, buf, name)
+        return state
+
+    def _read_rows(self, file, shape, row_format, buf, name):
+        if len(shape) == 1:
+            if file.readinto(buf) != len(buf):
+                raise ValueError(f"State is truncated at {name}")
+            return list(struct.unpack(row_format, buf))
+        return [self._read_rows(file, shape[1:], row_format, buf, name) for _ in range(shape[0])]
 
 
 class EuroPiScript:
@@ -79,10 +197,12 @@ class EuroPiScript:
         #. **Save state upon state change.** When a state variable changes, call the save state function.
 
         #. **Implement save_state() method.** Provide an implementation to serialize the state variables into a string, JSON, or
-           bytes an call the appropriate save state method.
+           bytes an call the appropriate save state method. Large states made of numbers, like sequencer banks, are best
+           saved with ``save_state_struct()``, which uses a compact binary format described by a ``StateSchema``.
 
         #. **Throttle the frequency of saves.** Saving state too often could negatively impact the performance of your script, so it is
-           advised to add some checks in your code to ensure it doesn't save too frequently.
+           advised to add some checks in your code to ensure it doesn't save too frequently. The easiest way is to call
+           ``mark_state_dirty()`` instead of ``save_state()``; see below.
 
 
     Here is an extension of the script above with some added trivial features that incorporate saving and loading script state::
@@ -125,6 +245,36 @@ class EuroPiScript:
                 oled.centre_text("Hello world")
 
 
+    **Deferred Saving**
+
+    Instead of calling ``save_state()`` whenever the state changes, a script can call ``mark_state_dirty()``. This only
+    sets a flag, so it is safe to call from button & input handlers. The script's main loop then calls ``flush_state()``,
+    which calls ``save_state()`` at most once every ``SAVE_STATE_INTERVAL_MS`` milliseconds, no matter how often the
+    state changes. Because the save happens in the main loop it never sees a half-finished update, and never interrupts
+    a handler. Pending changes are always saved when the user exits to the menu. Scripts that use this can drop their
+    own ``last_saved()`` checks from ``save_state()``::
+
+        class HelloWorld(EuroPiScript):
+            SAVE_STATE_INTERVAL_MS = 2000  # optional; the default is 5s
+
+            def __init__(self):
+                super().__init__()
+                state = self.load_state_json()
+                self.counter = state.get("counter", 0)
+
+                @din.handler
+                def increment_counter():
+                    self.counter += 1
+                    self.mark_state_dirty()
+
+            def save_state(self):
+                self.save_state_json({"counter": self.counter})
+
+            def main(self):
+                while True:
+                    oled.centre_text(str(self.counter))
+                    self.flush_state()
+
     .. note::
        EuroPiScripts should not call ``europi.reset_state()`` as this call would remove the button handlers that
        allow the user to exit the program and return to the menu. Similarly, EuroPiScripts should not override the
@@ -159,8 +309,13 @@ class EuroPiScript:
     versions of these files, see `/scripts/generate_default_configs.py`.
     """
 
+    # The minimum time between saves made by flush_state()
+    SAVE_STATE_INTERVAL_MS = 5000
+
     def __init__(self):
         self._last_saved = 0
+        # see mark_state_dirty() & flush_state()
+        self._state_dirty = False
         self.config = EuroPiScript._load_config_for_class(self.__class__)
         self.europi_config = EuroPiScript._load_config_for_class(EuroPiConfig)
 
@@ -206,9 +361,8 @@ class EuroPiScript:
             script. Only call save state when state has changed and consider
             adding a time since last save check to reduce save frequency.
         """
-        with open(self._state_filename, "wb") as file:
-            file.write(state)
-            self._last_saved = ticks_ms()
+        atomic_write(self._state_filename, state)
+        self._last_saved = ticks_ms()
 
     def save_state_json(self, state: dict):
         """Take state as a dict and save as a json string.
@@ -219,9 +373,25 @@ class EuroPiScript:
             script. Only call save state when state has changed and consider
             adding a time since last save check to reduce save frequency.
         """
-        with open(self._state_filename, "w") as file:
-            json.dump(state, file, separators=(",\n", ":"))
-            self._last_saved = ticks_ms()
+        atomic_write(
+            self._state_filename, lambda file: json.dump(state, file, separators=(",\n", ":"))
+        )
+        self._last_saved = ticks_ms()
+
+    def save_state_struct(self, state: dict, schema: StateSchema):
+        """Take state as a dict and save it in the compact binary format described by ``schema``.
+
+        The file is written a row at a time, without building the whole file in RAM first.
+        See ``StateSchema`` for details.
+
+        .. note::
+            Be mindful of how often `save_state_struct()` is called because
+            writing to disk too often can slow down the performance of your
+            script. Only call save state when state has changed and consider
+            adding a time since last save check to reduce save frequency.
+        """
+        atomic_write(self._state_filename, lambda file: schema.write(file, state), mode="wb")
+        self._last_saved = ticks_ms()
 
     def load_state_bytes(self) -> bytes:
         """Check disk for saved state, if it exists, return the raw state value as bytes.
@@ -239,6 +409,27 @@ class EuroPiScript:
         """
         return load_json_file(self._state_filename)
 
+    def load_state_struct(self, schema: StateSchema) -> dict:
+        """Load state previously saved with ``save_state_struct()`` as a dict.
+
+        If no state is found, or it was saved with a different schema, an empty dictionary will be
+        returned.
+
+        :param schema:  The StateSchema the state was saved with
+        """
+        for filename in (self._state_filename, self._state_filename + BACKUP_SUFFIX):
+            try:
+                with open(filename, "rb") as file:
+                    return schema.read(file)
+            except OSError:
+                # no saved state, unless the power was cut while saving
+                if filename == self._state_filename and recover_file(filename):
+                    return self.load_state_struct(schema)
+                continue
+            except ValueError as err:
+                log_warning("Unable to load %s: %s", "europi_script", filename, err)
+        return {}
+
     def remove_state(self):
         """Remove the state file for this script."""
         delete_file(self._state_filename)
@@ -250,6 +441,31 @@ class EuroPiScript:
         except AttributeError:
             raise Exception("EuroPiScript classes must call `super().__init__()`.")
 
+    def mark_state_dirty(self):
+        """Note that the script's state has changed & should be saved by the next ``flush_state()``.
+
+        This only sets a flag, so it can be called from button & input handlers.
+        """
+        self._state_dirty = True
+
+    def flush_state(self, force=False):
+        """Save the state now if it was marked dirty with ``mark_state_dirty()``.
+
+        Call this from the script's main loop; however often the state changes, it is only saved
+        once every ``SAVE_STATE_INTERVAL_MS``.
+
+        :param force:  If False, nothing is saved if the last save was less than
+            ``SAVE_STATE_INTERVAL_MS`` ago. If True, the state is saved anyway
+        :return:  True if ``save_state()`` was called
+        """
+        if not self._state_dirty:
+            return False
+        if not force and self.last_saved() < self.SAVE_STATE_INTERVAL_MS:
+            return False
+        self._state_dirty = False
+        self.save_state()
+        return True
+
     # config methods
 
     @classmethod
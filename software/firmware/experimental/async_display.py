@@ -0,0 +1,172 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Double-buffered OLED drawing, with the I²C transfer done on the Pico's second core
+
+Sending a frame to the OLED blocks for a millisecond or more, which can cause audible or
+visible glitches in scripts that generate CVs from the same loop that draws the GUI. An
+``AsyncDisplay`` is drawn on like ``oled``, but ``present()`` only copies the finished frame
+and returns; a thread on core 1 sends it to the display.
+
+Example::
+
+    from europi import *
+    from experimental.async_display import AsyncDisplay
+
+    screen = AsyncDisplay(oled, max_fps=30)
+    screen.start()
+
+    while True:
+        cv1.voltage(k1.percent() * 10)
+
+        screen.fill(0)
+        screen.text(f"{k1.percent():0.2f}", 0, 0, 1)
+        screen.present()
+
+While the flush thread is running, don't draw on ``oled`` directly and don't start another
+thread with ``_thread``; MicroPython only supports one thread on core 1.
+"""
+
+import _thread
+import time
+
+from framebuf import FrameBuffer, MONO_VLSB
+
+from europi_display import CHAR_HEIGHT, Display, draw_text_block
+
+# Default upper limit on the number of frames sent to the display per second
+DEFAULT_MAX_FPS = 30
+
+
+class AsyncDisplay(FrameBuffer):
+    """A FrameBuffer that is sent to the OLED in the background
+
+    Three buffers are used: scripts draw into the back buffer, ``present()`` copies it into the
+    pending buffer, and the flush thread copies the pending buffer into the display's own buffer
+    before sending it over I²C. The main thread therefore never waits for the I²C transfer.
+
+    If a new frame is presented before the previous one was sent, the older frame is dropped.
+
+    :param display:  The Display to draw on, usually ``europi.oled``
+    :param max_fps:  The maximum number of frames per second sent to the display
+    """
+
+    def __init__(self, display, max_fps=DEFAULT_MAX_FPS):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+
+        size = self.width * self.height // 8
+        self._back = bytearray(size)
+        self._pending = bytearray(size)
+        # the back buffer, for code that draws into a display's buffer directly
+        self.buffer = self._back
+        super().__init__(self._back, self.width, self.height, MONO_VLSB)
+
+        self._lock = _thread.allocate_lock()
+        self._has_frame = False
+        self._last_flush = time.ticks_ms()
+        self.set_max_fps(max_fps)
+
+        self.running = False
+        self._stopped = True
+
+        # Statistics; see present() & _flush()
+        self.frames_presented = 0
+        self.frames_shown = 0
+
+    def set_max_fps(self, max_fps):
+        """Change the maximum frame rate
+
+        :param max_fps:  The maximum number of frames per second sent to the display. If 0, frames
+            are sent as quickly as the display allows
+        """
+        self._interval_ms = 1000 // max_fps if max_fps > 0 else 0
+
+    def start(self):
+        """Start sending frames from core 1"""
+        if self.running:
+            return
+        self.running = True
+        self._stopped = False
+        _thread.start_new_thread(self._flush_loop, ())
+
+    def stop(self):
+        """Stop the flush thread & send any frame that is still waiting"""
+        self.running = False
+        while not self._stopped:
+            time.sleep_ms(1)
+        self._flush()
+
+    def present(self):
+        """Hand the current contents of the buffer over to be displayed
+
+        Returns immediately; the frame is sent by the flush thread. If the thread isn't running
+        the frame is sent immediately instead.
+        """
+        with self._lock:
+            self._pending[:] = self._back
+            self._has_frame = True
+        self.frames_presented += 1
+        if not self.running:
+            self._flush()
+
+    def show(self, force=False):
+        """Alias of ``present()``, so code written for ``oled`` works unchanged"""
+        self.present()
+
+    def invalidate(self, *args):
+        """Does nothing; provided for compatibility with ``Display``
+
+        Every presented frame is checked in full, so direct changes to ``buffer`` are always seen.
+        """
+        pass
+
+    def centre_text(self, text, clear_first=True, auto_show=True):
+        """Display one or more lines of text centred both horizontally and vertically.
+
+        See ``Display.centre_text()``
+        """
+        Display.centre_text(self, text, clear_first, auto_show)
+
+    def draw_text_block(self, lines, x, y, inverted_mask=0, line_height=CHAR_HEIGHT + 2):
+        """Draw several lines of text, one below the other, in a single call
+
+        See ``Display.draw_text_block()``
+        """
+        draw_text_block(self, lines, x, y, inverted_mask, line_height)
+
+    def _flush(self):
+        # Copy the pending frame into the display's buffer & send it
+        # Returns True if a frame was sent
+        with self._lock:
+            if not self._has_frame:
+                return False
+            self.display.buffer[:] = self._pending
+            self._has_frame = False
+        self.display.invalidate()
+        # we do our own frame rate limiting, so never let the display drop the frame
+        self.display.show(force=True)
+        self.frames_shown += 1
+        return True
+
+    def _flush_loop(self):
+        while self.running:
+            wait = self._interval_ms - time.ticks_diff(time.ticks_ms(), self._last_flush)
+            if wait > 0:
+                time.sleep_ms(wait)
+            elif self._flush():
+                self._last_flush = time.ticks_ms()
+            else:
+                time.sleep_ms(1)
+        self._stopped = True
@@ -28,12 +28,27 @@ from europi_display import Display as BasicDisplay
 # TODO: add a method to select the font to use by default
 
 
+# Default RAM budget, in bytes, for each font's cache of pre-rendered glyphs
+DEFAULT_GLYPH_CACHE_BYTES = 4096
+
+# Approximate RAM used by each cached glyph on top of its pixel data (FrameBuffer, list, dict slot)
+GLYPH_OVERHEAD_BYTES = 64
+
+# Maximum number of strings whose pixel widths are remembered
+MAX_CACHED_STRING_WIDTHS = 16
+
+
 class CustomFontWriter:
-    def __init__(self, device, font):
+    def __init__(self, device, font, cache_bytes=DEFAULT_GLYPH_CACHE_BYTES):
         """Initialize the Writer.
 
+        Rendered glyphs are cached as FrameBuffers, so printing text that has been printed before
+        doesn't allocate any memory. When the cache is full the least-recently used glyphs are
+        discarded.
+
         device: the OLED display instance
         font: a font module
+        cache_bytes: the approximate amount of RAM the glyph cache may use
         """
         self.device = device
         self.font = font
@@ -44,35 +59,91 @@ class CustomFontWriter:
         self.screenwidth = device.width  # In pixels
         self.screenheight = device.height
 
+        # Glyph cache: char -> [FrameBuffer, width, size in bytes, last-used stamp]
+        # Normal & inverted glyphs are kept in separate dicts so lookups don't allocate a key
+        self.cache_bytes = cache_bytes
+        self._glyphs = {}
+        self._inverted_glyphs = {}
+        self._cached_bytes = 0
+        self._stamp = 0
+
+        # Width caches: char -> width & string -> width, in pixels
+        self._char_widths = {}
+        self._string_widths = {}
+
     def print(self, string, x, y, c=1):
         """Print the string using the x, y coordinates as the upper-left corner of the text.
         With c=0, the text is display as black text on white background.
         """
+        glyphs = self._glyphs if c == 1 else self._inverted_glyphs
         for char in string:
             if char == "\n":  # line breaks are ignored
                 return
-            glyph, char_height, char_width = self.font.get_ch(char)
-            buf = bytearray(glyph)
-            if c != 1:
-                for i, v in enumerate(buf):
-                    buf[i] = 0xFF & ~v
-            fbc = framebuf.FrameBuffer(buf, char_width, char_height, self.map)
-            self.device.blit(fbc, x, y)
-            x += char_width
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = self._render(char, glyphs, c != 1)
+            glyph[3] = self._stamp
+            self._stamp += 1
+            self.device.blit(glyph[0], x, y)
+            x += glyph[1]
+
+    def _render(self, char, glyphs, invert):
+        """Render a glyph into a new FrameBuffer and add it to the cache if it fits"""
+        data, char_height, char_width = self.font.get_ch(char)
+        buf = bytearray(data)
+        if invert:
+            for i, v in enumerate(buf):
+                buf[i] = 0xFF & ~v
+        size = len(buf) + GLYPH_OVERHEAD_BYTES
+        glyph = [framebuf.FrameBuffer(buf, char_width, char_height, self.map), char_width, size, 0]
+
+        if size <= self.cache_bytes:
+            while self._cached_bytes + size > self.cache_bytes:
+                self._evict()
+            glyphs[char] = glyph
+            self._cached_bytes += size
+        return glyph
+
+    def _evict(self):
+        """Remove the least-recently used glyph from the cache"""
+        oldest = None
+        for glyphs in (self._glyphs, self._inverted_glyphs):
+            for char, glyph in glyphs.items():
+                if oldest is None or glyph[3] < oldest[2][3]:
+                    oldest = (glyphs, char, glyph)
+        glyphs, char, glyph = oldest
+        del glyphs[char]
+        self._cached_bytes -= glyph[2]
+
+    def clear_cache(self):
+        """Discard all cached glyphs & widths, freeing their RAM"""
+        self._glyphs = {}
+        self._inverted_glyphs = {}
+        self._cached_bytes = 0
+        self._char_widths = {}
+        self._string_widths = {}
 
     def string_len(self, string):
         """Returns the length of string in pixels."""
-        n = 0
-        for char in string:
-            n += self._char_len(char)
+        n = self._string_widths.get(string)
+        if n is None:
+            n = 0
+            for char in string:
+                n += self._char_len(char)
+            if len(self._string_widths) >= MAX_CACHED_STRING_WIDTHS:
+                self._string_widths = {}
+            self._string_widths[string] = n
         return n
 
     def _char_len(self, char):
         """Returns the length of char in pixels."""
-        if char == "\n":
-            char_width = 0
-        else:
-            _, _, char_width = self.font.get_ch(char)
+        char_width = self._char_widths.get(char)
+        if char_width is None:
+            if char == "\n":
+                char_width = 0
+            else:
+                _, _, char_width = self.font.get_ch(char)
+            self._char_widths[char] = char_width
         return char_width
 
 
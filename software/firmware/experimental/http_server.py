@@ -265,13 +265,13 @@ class HttpServer:
                         headers=None,
                     )
             except NotImplementedError as err:
-                log_warning(f"{err}", "http_server")
+                log_warning(err, "http_server")
                 # send a 501 error page
                 self.send_error_page(err, conn, HttpStatus.NOT_IMPLEMENTED)
             except OSError as err:
                 return
             except Exception as err:
-                log_warning(f"{err}", "http_server")
+                log_warning(err, "http_server")
                 # send a 500 error page
                 self.send_error_page(err, conn, HttpStatus.INTERNAL_SERVER_ERROR)
             finally:
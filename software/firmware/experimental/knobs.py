@@ -365,6 +365,9 @@ class BufferedKnob(Knob):
     This allows multiple uses of .percent(), .choice(...), etc... without forcing a re-read of
     the ADC value
 
+    To keep every knob & input continuously sampled in the background instead, see
+    ``europi_hardware.AdcSamplingService``
+
     :param knob: The analogue input to wrap e.g. ``europi_hardware.k1``
     """
 
@@ -151,7 +151,7 @@ class OpenSoundPacket:
                     # infinity; skip
                     pass
                 else:
-                    log_warning(f"Unsupported type {t}", "osc")
+                    log_warning("Unsupported type %s", "osc", t)
 
                 i += 1
         except IndexError:
@@ -209,14 +209,14 @@ class OpenSoundServer:
     """
 
     def __init__(self, recv_port=9000, send_port=9001, send_addr="192.168.4.100"):
-        log_info(f"Listening for OSC packets on port {recv_port}", "osc")
+        log_info("Listening for OSC packets on port %s", "osc", recv_port)
         addr = socket.getaddrinfo("0.0.0.0", recv_port)[0][-1]
         self.recv_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.recv_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.recv_socket.settimeout(0)
         self.recv_socket.bind(addr)
 
-        log_info(f"Sending OSC packets to {send_addr}:{send_port}", "osc")
+        log_info("Sending OSC packets to %s:%s", "osc", send_addr, send_port)
         addr = socket.getaddrinfo(send_addr, send_port)[0][-1]
         self.send_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.send_port = send_port
@@ -291,16 +291,12 @@ class OpenSoundServer:
                 for packet in packets:
                     self.recv_callback(connection=connection, data=packet)
             except ValueError as err:
-                log_warning(f"Failed to process packet: {err}", "osc")
+                log_warning("Failed to process packet: %s", "osc", err)
                 break
             except OSError as err:
                 break
             except Exception as err:
-                # log_warning(f"Failed to process packet. Malformed? {err}", "osc")
-                # s = ""
-                # for byte in data:
-                #     s += f"{byte:02x} "
-                # log_debug(f"Raw packet: {s}")
+                log_debug("Failed to process packet. Malformed? %s", "osc", err)
                 break
 
     def send_data(self, address, *args):
@@ -383,4 +379,4 @@ class OpenSoundServer:
         except OSError:
             pass
         except Exception as err:
-            log_warning(f"Failed to send OSC data: {err}", "osc")
+            log_warning("Failed to send OSC data: %s", "osc", err)
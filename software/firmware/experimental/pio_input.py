@@ -0,0 +1,169 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hardware clock & gate capture for the digital input using the Pico's PIO
+
+A PIO state machine watches ``din`` and timestamps every rising edge in hardware, so clock
+measurements are unaffected by the main loop, garbage collection or other IRQs. This is useful
+for scripts that follow fast external clocks.
+
+Example::
+
+    from europi import *
+    from experimental.pio_input import PioDigitalInput
+
+    clock_in = PioDigitalInput()
+
+    @clock_in.handler
+    def on_clock():
+        cv1.on()
+
+    while True:
+        oled.centre_text(f"{clock_in.period_us()}us\\n{clock_in.pulse_count()} pulses")
+"""
+
+from machine import Pin, mem32
+from rp2 import PIO, StateMachine, asm_pio
+import time
+
+from europi_hardware import DigitalInput, HIGH, PIN_DIN
+
+# Each loop of the capture program takes 2 cycles, so running the state machine at 2MHz
+# gives timestamps with a resolution of 1us
+PIO_CAPTURE_FREQ = 2_000_000
+
+# The state machine counts microseconds since it was started. Timestamps are converted to
+# time.ticks_us() by adding the ticks when it started & masking to 30 bits, the period of
+# ticks_us(), so they can be compared with time.ticks_diff() and stay small ints
+TICKS_MASK = 0x3FFFFFFF
+
+# PIO registers used to detect edges lost when the RX FIFO is full
+# See section 3.7 of the RP2040 datasheet & section 11.7 of the RP2350 datasheet
+PIO0_BASE = 0x50200000
+PIO_BLOCK_SIZE = 0x100000
+PIO_FDEBUG = 0x008
+PIO_FDEBUG_RXSTALL_SHIFT = 0
+
+
+@asm_pio(fifo_join=PIO.JOIN_RX)
+def edge_capture_prog():
+    # x counts down once every 2 cycles. On every rising edge of the jack its value is pushed to
+    # the RX FIFO and the state machine raises an IRQ.
+    # The input is inverted in hardware: the jack is high when the GPIO is low
+    mov(x, invert(null))
+    label("gpio_high")
+    jmp(x_dec, "gpio_high_next")
+    label("gpio_high_next")
+    jmp(pin, "gpio_high")
+    # The jack went high. These 6 cycles also decrement x 3 times to keep the timebase exact
+    mov(isr, x)
+    push(noblock)
+    irq(rel(0))
+    jmp(x_dec, "edge_1")
+    label("edge_1")
+    jmp(x_dec, "edge_2")
+    label("edge_2")
+    jmp(x_dec, "gpio_low")
+    label("gpio_low")
+    wrap_target()
+    jmp(x_dec, "gpio_low_next")
+    label("gpio_low_next")
+    jmp(pin, "gpio_high")
+    wrap()
+
+
+class PioDigitalInput(DigitalInput):
+    """A DigitalInput whose rising edges are detected & timestamped by a PIO state machine
+
+    The state machine timestamps rising edges in hardware with 1us resolution. Each edge is
+    counted, added to the edge buffer (see ``DigitalReader.drain()``) and passed to the
+    ``handler()`` callback. Falling edges are not captured by the state machine; a
+    ``handler_falling()`` callback is run from a normal GPIO IRQ instead.
+
+    Timestamps are converted to ``time.ticks_us()`` using the ticks when the state machine was
+    started, so they can be compared with ``ticks_us()`` to within a few microseconds.
+
+    Edges are counted in software as they are read from the state machine's 8-entry FIFO. If
+    more than 8 edges arrive before the IRQ handler runs (e.g. during a long garbage collection)
+    the newest are lost and ``pulse_count()`` is too low. ``overflows`` counts the number of times
+    this happened.
+
+    Only one object should use a given pin and state machine at a time; don't mix this
+    object with ``europi.din``'s handlers.
+
+    :param pin:  The GPIO pin to capture
+    :param state_machine:  The ID of the PIO state machine to use (0-7)
+    :param size:  The number of edges the edge buffer can hold
+    :param debounce_delay:  The debounce time in ms applied to falling edges
+    """
+
+    def __init__(self, pin=PIN_DIN, state_machine=0, size=32, debounce_delay=0):
+        super().__init__(pin, debounce_delay)
+        self._pulse_count = 0
+        self.overflows = 0
+        self.capture_edges(size)
+
+        # The RX stall flag of our state machine is set when an edge is pushed to a full FIFO
+        self._fdebug = PIO0_BASE + (state_machine >> 2) * PIO_BLOCK_SIZE + PIO_FDEBUG
+        self._rxstall = 1 << (PIO_FDEBUG_RXSTALL_SHIFT + (state_machine & 3))
+
+        self._sm = StateMachine(
+            state_machine,
+            edge_capture_prog,
+            freq=PIO_CAPTURE_FREQ,
+            jmp_pin=Pin(pin, Pin.IN),
+        )
+        self._sm.irq(self._on_pio_irq)
+        self._start_us = time.ticks_us()
+        self._sm.active(1)
+
+    def _enable_irq(self):
+        # Rising edges come from the state machine; only falling edges need the GPIO IRQ.
+        # The GPIO is inverted, so a falling edge on the jack is a rising edge on the pin
+        self.pin.irq(handler=self._bounce_wrapper, trigger=Pin.IRQ_RISING)
+
+    def _on_pio_irq(self, sm):
+        if mem32[self._fdebug] & self._rxstall:
+            # at least one edge was dropped; writing 1 clears the flag
+            mem32[self._fdebug] = self._rxstall
+            self.overflows += 1
+        while self._sm.rx_fifo():
+            # x counts down from 0xFFFFFFFF, so inverting it gives the time since the start
+            now_us = (self._start_us + (~self._sm.get() & TICKS_MASK)) & TICKS_MASK
+            self._record_edge(now_us, HIGH)
+            self._pulse_count += 1
+            self._rising_handler()
+
+    def reset_handler(self):
+        """Remove the rising & falling handlers. Edges are still counted & timestamped."""
+        self._rising_handler = lambda: None
+        self._falling_handler = lambda: None
+        super().reset_handler()
+
+    def period_us(self):
+        """Return the time between the last two rising edges, in microseconds."""
+        return self.last_period_us
+
+    def pulse_count(self):
+        """Return the number of rising edges seen since creation or the last reset."""
+        return self._pulse_count
+
+    def reset_pulse_count(self):
+        """Reset the pulse counter to zero."""
+        self._pulse_count = 0
+
+    def deinit(self):
+        """Stop the state machine and release the IRQs."""
+        self._sm.active(0)
+        self._sm.irq(None)
+        self.pin.irq(handler=None)
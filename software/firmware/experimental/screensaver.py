@@ -50,6 +50,9 @@ class Screensaver:
     BLANK_TIMEOUT_MS = 1000 * 60 * 20
     BLANK_TIMEOUT_US = BLANK_TIMEOUT_MS * 1000
 
+    ## The logo as a FrameBuffer; shared by every instance & created on first use
+    _logo_fb = None
+
     def __init__(self):
         self.last_logo_reposition_at = 0
 
@@ -65,14 +68,18 @@ class Screensaver:
         LOGO_UPDATE_INTERVAL = 2000
 
         now = utime.ticks_ms()
-        elapsed_ms = time.ticks_diff(now, self.last_logo_reposition_at)
+        elapsed_ms = utime.ticks_diff(now, self.last_logo_reposition_at)
         if force or abs(elapsed_ms) >= LOGO_UPDATE_INTERVAL:
             self.last_logo_reposition_at = now
             x = random.randint(0, OLED_WIDTH - self.LOGO_WIDTH)
             y = random.randint(0, OLED_HEIGHT - self.LOGO_HEIGHT)
 
+            fb = Screensaver._logo_fb
+            if fb is None:
+                fb = FrameBuffer(self.LOGO, self.LOGO_WIDTH, self.LOGO_HEIGHT, MONO_HLSB)
+                Screensaver._logo_fb = fb
+
             oled.fill(0)
-            fb = FrameBuffer(self.LOGO, self.LOGO_WIDTH, self.LOGO_HEIGHT, MONO_HLSB)
             oled.blit(fb, x, y)
             oled.show()
 
@@ -91,6 +98,10 @@ class OledWithScreensaver:
     Set .enable_screensaver or .enable_blank to False to disable the screensaver/blanking activation completely
     (though if you do that, just use europi.oled instead of this class)
 
+    The drawing methods (``fill``, ``text``, ``blit``, etc...) are europi.oled's own methods, so calling them costs
+    exactly the same as calling them on europi.oled; the screensaver is only checked in ``show()``. While the
+    screen is blanked the display is switched off, so ``show()`` doesn't send anything over I²C.
+
     :param enable_screensaver:  If true, the screensaver will activate when needed
     :param enable_blank:        If true, the screen will blank after the screensaver has been active for a while
     """
@@ -105,6 +116,23 @@ class OledWithScreensaver:
 
         self.last_user_interaction_at = utime.ticks_ms()
 
+        # Use oled's bound methods directly for drawing, so there's no extra call for every primitive.
+        # See europi.Display for documentation details
+        self.fill = oled.fill
+        self.text = oled.text
+        self.draw_text_block = oled.draw_text_block
+        self.line = oled.line
+        self.hline = oled.hline
+        self.vline = oled.vline
+        self.rect = oled.rect
+        self.fill_rect = oled.fill_rect
+        self.ellipse = oled.ellipse
+        self.blit = oled.blit
+        self.scroll = oled.scroll
+        self.invert = oled.invert
+        self.contrast = oled.contrast
+        self.pixel = oled.pixel
+
     def is_screenaver(self):
         """Is the screensaver currently showing?"""
         return self.show_screensaver
@@ -120,71 +148,28 @@ class OledWithScreensaver:
         self.last_user_interaction_at = utime.ticks_ms()
 
     def show(self):
-        now = utime.ticks_ms()
-        if (
-            self.enable_blank
-            and utime.ticks_diff(now, self.last_user_interaction_at)
-            > self.screensaver.BLANK_TIMEOUT_MS
-        ):
-            self.show_blank = True
-            self.show_screensaver = False
-            self.screensaver.draw_blank()
-        elif (
-            self.enable_screensaver
-            and utime.ticks_diff(now, self.last_user_interaction_at)
-            > self.screensaver.ACTIVATE_TIMEOUT_MS
-        ):
-            self.show_screensaver = True
+        idle_ms = utime.ticks_diff(utime.ticks_ms(), self.last_user_interaction_at)
+        if self.enable_blank and idle_ms > self.screensaver.BLANK_TIMEOUT_MS:
+            if not self.show_blank:
+                # Turn the panel off instead of sending blank frames; the display keeps its RAM, so
+                # nothing needs to be sent until it wakes up again
+                self.show_blank = True
+                self.show_screensaver = False
+                oled.poweroff()
+            return
+
+        if self.show_blank:
             self.show_blank = False
+            oled.poweron()
+
+        if self.enable_screensaver and idle_ms > self.screensaver.ACTIVATE_TIMEOUT_MS:
+            self.show_screensaver = True
             self.screensaver.draw()
         else:
-            self.show_blank = False
             self.show_screensaver = False
             oled.show()
 
-    # The following are just wrappers for the functions in the Display class to allow 1:1 access
-    # See europi.Display for documentation details
-
-    def fill(self, color):
-        oled.fill(color)
-
-    def text(self, string, x, y, color=1):
-        oled.text(string, x, y, color)
-
     def centre_text(self, text, clear_first=True, auto_show=True):
         oled.centre_text(text, clear_first=clear_first, auto_show=False)
         if auto_show:
             self.show()
-
-    def line(self, x1, y1, x2, y2, color=1):
-        oled.line(x1, y1, x2, y2, color)
-
-    def hline(self, x, y, length, color=1):
-        oled.hline(x, y, length, color)
-
-    def vline(self, x, y, length, color=1):
-        oled.vline(x, y, length, color)
-
-    def rect(self, x, y, width, height, color=1):
-        oled.rect(x, y, width, height, color)
-
-    def fill_rect(self, x, y, width, height, color=1):
-        oled.fill_rect(x, y, width, height, color)
-
-    def ellipse(self, x, y, xr, yr, colour=1, fill=False):
-        oled.ellipse(x, y, xr, yr, colour, fill)
-
-    def blit(self, buffer, x, y):
-        oled.blit(buffer, x, y)
-
-    def scroll(self, x, y):
-        oled.scroll(x, y)
-
-    def invert(self, color=1):
-        oled.invert(color)
-
-    def contrast(self, contrast):
-        oled.contrast(contrast)
-
-    def pixel(self, x, y, color=1):
-        oled.pixel(x, y, color)
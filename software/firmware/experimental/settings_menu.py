@@ -109,6 +109,8 @@ class MenuItem:
         self.children.append(item)
         item.parent = self
         item.menu = self.menu
+        if self.menu:
+            self.menu._visible_items = None
 
     @property
     def is_editable(self):
@@ -125,6 +127,9 @@ class MenuItem:
     @is_visible.setter
     def is_visible(self, is_visible):
         self._is_visible = is_visible
+        # the menu caches its list of visible items; make it rebuild the list
+        if self.menu:
+            self.menu._visible_items = None
 
 
 class ChoiceMenuItem(MenuItem):
@@ -688,6 +693,9 @@ class SettingsMenu:
             for item in menu_items:
                 self.items.append(item)
 
+        # The visible subset of active_items; None until visible_items is next read. Cleared when
+        # active_items changes or an item is shown or hidden
+        self._visible_items = None
         self.active_items = self.items
         self.active_item = self.knob.choice(self.items)
 
@@ -721,6 +729,16 @@ class SettingsMenu:
         self.autoselect_cv_items = []
         self.autoselect_knob_items = []
 
+    @property
+    def active_items(self):
+        """The list of menu items at the current menu level"""
+        return self._active_items
+
+    @active_items.setter
+    def active_items(self, items):
+        self._active_items = items
+        self._visible_items = None
+
     @property
     def knob(self):
         """Get the navigation knob that controls this menu"""
@@ -942,9 +960,14 @@ class SettingsMenu:
 
         Menu items can be shown/hidden by setting their is_visible property. Normally this should be done in
         a value-change callback of a menu item to show/hide dependent other items.
+
+        The list is cached until an item is shown or hidden, or the menu level changes, so it must not be
+        modified.
         """
-        items = []
-        for item in self.active_items:
-            if item.is_visible:
-                items.append(item)
-        return items
+        if self._visible_items is None:
+            items = []
+            for item in self.active_items:
+                if item.is_visible:
+                    items.append(item)
+            self._visible_items = items
+        return self._visible_items
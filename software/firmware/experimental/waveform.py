@@ -0,0 +1,189 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scrolling waveform plots for the OLED
+
+``WaveformView`` keeps a short history of one or more signals and draws them as traces that
+scroll from right to left, like an oscilloscope. Each channel's history is a ``bytearray`` ring
+buffer of pixel rows, so adding a sample never shifts a list, and the traces are drawn straight
+into the display's framebuffer by a native-compiled routine instead of one ``pixel()`` call per
+point.
+
+Example::
+
+    from europi import *
+    from experimental.waveform import WaveformView
+
+    view = WaveformView(channels=2, max_value=10)
+
+    while True:
+        cv1.voltage(ain.read_voltage())
+        view.push((ain.read_voltage(), k1.percent() * 10))
+
+        view.draw(oled)
+        oled.show()
+"""
+
+import micropython
+
+from europi import OLED_WIDTH, OLED_HEIGHT, MAX_OUTPUT_VOLTAGE
+
+
+@micropython.native
+def _plot_trace(buf, stride, history, head, width, count, x0, y0, connect, colour):
+    # Draw the newest `count` entries of `history` into a MONO_VLSB framebuffer, oldest first,
+    # right-aligned so the newest sample is in the right-most column of the view
+    start = head - count
+    if start < 0:
+        start += width
+    prev = history[start]
+    x = x0 + width - count
+    for i in range(count):
+        idx = start + i
+        if idx >= width:
+            idx -= width
+        row = history[idx]
+        if connect and prev < row:
+            lo = prev
+            hi = row
+        elif connect:
+            lo = row
+            hi = prev
+        else:
+            lo = row
+            hi = row
+        prev = row
+        for y in range(y0 + lo, y0 + hi + 1):
+            offset = (y >> 3) * stride + x
+            if colour:
+                buf[offset] |= 1 << (y & 7)
+            else:
+                buf[offset] &= 0xFF ^ (1 << (y & 7))
+        x += 1
+
+
+class WaveformView:
+    """A scrolling plot of one or more signals
+
+    Call ``push()`` once per sample with one value per channel, then ``draw()`` whenever the
+    display should be updated. Drawing costs the same however often ``push()`` was called, so
+    sampling and drawing can run at different rates.
+
+    :param channels:  The number of signals to plot
+    :param width:  The width of the plot in pixels; this is also the number of samples shown
+    :param height:  The height of the plot in pixels
+    :param x:  The x coordinate of the plot's left edge
+    :param y:  The y coordinate of the plot's top edge
+    :param min_value:  The value plotted at the bottom of the view
+    :param max_value:  The value plotted at the top of the view
+    :param connect:  If True, consecutive samples are joined with vertical lines so fast-moving
+        signals stay continuous. Otherwise each sample is a single pixel
+    """
+
+    def __init__(
+        self,
+        channels=1,
+        width=OLED_WIDTH,
+        height=OLED_HEIGHT,
+        x=0,
+        y=0,
+        min_value=0.0,
+        max_value=MAX_OUTPUT_VOLTAGE,
+        connect=True,
+    ):
+        if width < 1 or height < 1 or height > 256:
+            raise ValueError(f"Invalid view size {width}x{height}")
+        if max_value <= min_value:
+            raise ValueError("max_value must be greater than min_value")
+
+        self.channels = channels
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.min_value = min_value
+        self.max_value = max_value
+        self.connect = connect
+
+        self._scale = (height - 1) / (max_value - min_value)
+        self._history = [bytearray(width) for _ in range(channels)]
+        self._head = 0
+        self._count = 0
+
+    def _to_row(self, value):
+        row = int((self.max_value - value) * self._scale + 0.5)
+        if row < 0:
+            return 0
+        if row >= self.height:
+            return self.height - 1
+        return row
+
+    def push(self, values):
+        """Add one sample to every channel, scrolling the plot by one column
+
+        :param values:  A sequence with one value per channel. Missing channels repeat their
+            previous sample
+        """
+        head = self._head
+        last = head - 1 if head > 0 else self.width - 1
+        for channel in range(self.channels):
+            history = self._history[channel]
+            if channel < len(values):
+                history[head] = self._to_row(values[channel])
+            else:
+                history[head] = history[last]
+        head += 1
+        self._head = head if head < self.width else 0
+        if self._count < self.width:
+            self._count += 1
+
+    def clear(self):
+        """Forget every channel's history"""
+        self._head = 0
+        self._count = 0
+
+    def draw(self, display, colour=1, clear=True):
+        """Draw the traces onto the display
+
+        This doesn't call ``show()``.
+
+        :param display:  The display to draw on, e.g. ``oled``
+        :param colour:  The colour of the traces
+        :param clear:  If True, the view's area is filled with the opposite colour first
+        :raises ValueError: if the view doesn't fit on the display
+        """
+        if self.x < 0 or self.y < 0:
+            raise ValueError("The view must be on the display")
+        if self.x + self.width > display.width or self.y + self.height > display.height:
+            raise ValueError("The view must fit on the display")
+
+        if clear:
+            display.fill_rect(self.x, self.y, self.width, self.height, 0 if colour else 1)
+
+        buf = display.buffer
+        for history in self._history:
+            _plot_trace(
+                buf,
+                display.width,
+                history,
+                self._head,
+                self.width,
+                self._count,
+                self.x,
+                self.y,
+                self.connect,
+                colour,
+            )
+
+        # the traces were written to the buffer directly, so tell the display which area changed
+        display.invalidate(self.x, self.y, self.width, self.height)
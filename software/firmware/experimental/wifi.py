@@ -87,23 +87,24 @@ class WifiConnection:
             # see if we have a lingering connection from the previous boot
             self._nic = nic
             log_info(
-                f"NIC reports we already have an IP address: {self.ip_addr}. Re-using exising connection",
+                "NIC reports we already have an IP address: %s. Re-using exising connection",
                 "wifi",
+                self.ip_addr,
             )
         elif ex_cfg.WIFI_MODE == WIFI_MODE_AP:
             log_info("Starting wifi in AP mode...", "wifi")
             try:
                 self.connect_ap(ex_cfg)
-                log_info(f"Access point {self.ssid} is up. {self.ip_addr}", "wifi")
+                log_info("Access point %s is up. %s", "wifi", self.ssid, self.ip_addr)
             except Exception as err:
                 raise WifiError(f"Failed to enable AP mode: {err}")
         else:
             log_info("Starting wifi in client mode...", "wifi")
             try:
                 self.connect_station(ex_cfg)
-                log_info(f"Connected to {self.ssid}: {self.ip_addr}", "wifi")
+                log_info("Connected to %s: %s", "wifi", self.ssid, self.ip_addr)
             except Exception as err:
-                log_error(f"Failed to connect to network {ex_cfg.WIFI_SSID}: {err}", "wifi")
+                log_error("Failed to connect to network %s: %s", "wifi", ex_cfg.WIFI_SSID, err)
                 raise WifiError(f"Failed to connect to network {ex_cfg.WIFI_SSID}: {err}")
 
         if ex_cfg.ENABLE_WEBREPL:
@@ -150,7 +151,7 @@ class WifiConnection:
         max_tries = 3
         current_try = 1
         while current_try < max_tries and current_try > 0:
-            log_info(f"Connecting to {ssid}... ({current_try})", "wifi")
+            log_info("Connecting to %s... (%s)", "wifi", ssid, current_try)
             self._nic.connect(
                 ssid=ssid,
                 key=password,
@@ -18,6 +18,72 @@ import json
 from europi_log import *
 
 
+# Suffixes of the files used by atomic_write()
+TEMP_SUFFIX = ".tmp"
+BACKUP_SUFFIX = ".bak"
+
+
+def atomic_write(filename, data, mode=None, backup=True):
+    """Replace a file's contents without risking a truncated file if the power is cut
+
+    The data is written to a temporary file, which is synced to flash and then renamed over the
+    original. Until the rename the original file is untouched, and the rename itself can't leave a
+    partially-written file.
+
+    :param filename:  The name of the file to write
+    :param data:      The new contents; a str, bytes, or a function that is called with the open
+                      file to write the contents itself (e.g. to stream JSON with ``json.dump``)
+    :param mode:      The mode to open the file in, "w" or "wb". By default this is "wb" for bytes
+                      and "w" otherwise
+    :param backup:    If True the previous version of the file is kept, with ``BACKUP_SUFFIX``
+                      added to its name. If the file can't be parsed when it's loaded, the backup is
+                      used instead
+    """
+    if mode is None:
+        mode = "wb" if isinstance(data, (bytes, bytearray, memoryview)) else "w"
+    temp = filename + TEMP_SUFFIX
+    try:
+        with open(temp, mode) as file:
+            if callable(data):
+                data(file)
+            else:
+                file.write(data)
+        if hasattr(os, "sync"):
+            os.sync()
+    except Exception:
+        _remove(temp)
+        raise
+
+    if backup:
+        _remove(filename + BACKUP_SUFFIX)
+        try:
+            os.rename(filename, filename + BACKUP_SUFFIX)
+        except OSError:
+            # this is the first time the file has been written
+            pass
+    os.rename(temp, filename)
+
+
+def recover_file(filename):
+    """Finish an ``atomic_write`` that was interrupted after the temporary file was complete
+
+    If the power was cut between moving the file to its backup & renaming the temporary file, the
+    file itself is missing. Call this when opening a file written by ``atomic_write`` fails.
+
+    :param filename:  The name of the missing file
+    :return:  True if the file was recovered
+    """
+    temp = filename + TEMP_SUFFIX
+    try:
+        os.stat(temp)
+        os.stat(filename + BACKUP_SUFFIX)
+        os.rename(temp, filename)
+    except OSError:
+        return False
+    log_warning("Recovered /%s from an interrupted write", "file_utils", filename)
+    return True
+
+
 def load_file(filename, mode: str = "r") -> object:
     """Load a file and return its contents
 
@@ -30,7 +96,9 @@ def load_file(filename, mode: str = "r") -> object:
         with open(filename, mode) as file:
             return file.read()
     except OSError as e:
-        log_warning(f"Unable to read {filename}: {e}", "file_utils")
+        if e.errno == errno.ENOENT and recover_file(filename):
+            return load_file(filename, mode)
+        log_warning("Unable to read %s: %s", "file_utils", filename, e)
         if "b" in mode:
             return b""
         else:
@@ -40,6 +108,9 @@ def load_file(filename, mode: str = "r") -> object:
 def load_json_file(filename, mode="r") -> dict:
     """Load a file and return its contents
 
+    If the file can't be parsed and a backup made by ``atomic_write`` exists, the backup is loaded
+    instead.
+
     :param filename:  The name of the file to load
     :param mode:      The mode to open the file in. Should be "r" except in very unique circumstances
 
@@ -49,13 +120,23 @@ def load_json_file(filename, mode="r") -> dict:
         with open(filename, mode) as file:
             return json.load(file)
     except ValueError as e:
-        log_warning(f"Unable to parse JSON data from {filename}: {e}", "file_utils")
+        log_warning("Unable to parse JSON data from %s: %s", "file_utils", filename, e)
+        if not filename.endswith(BACKUP_SUFFIX):
+            try:
+                with open(filename + BACKUP_SUFFIX, mode) as file:
+                    data = json.load(file)
+                log_warning("Using the backup of %s", "file_utils", filename)
+                return data
+            except (OSError, ValueError):
+                pass
         return {}
     except OSError as e:
         if e.errno == errno.ENOENT:
-            log_info(f"/{filename} does not exist. Using default settings", "file_utils")
+            if recover_file(filename):
+                return load_json_file(filename, mode)
+            log_info("/%s does not exist. Using default settings", "file_utils", filename)
         else:
-            log_warning(f"Unable to open {filename}: {e}", "file_utils")
+            log_warning("Unable to open %s: %s", "file_utils", filename, e)
         return {}
 
 
@@ -63,8 +144,17 @@ def delete_file(filename):
     """
     Delete a file from the disk if it exists
 
+    Any backup or temporary file made by ``atomic_write`` is deleted too.
+
     :param filename:  The file to delete
     """
+    _remove(filename)
+    _remove(filename + BACKUP_SUFFIX)
+    _remove(filename + TEMP_SUFFIX)
+
+
+def _remove(filename):
+    # Delete a single file, if it exists
     try:
         os.remove(filename)
     except OSError:
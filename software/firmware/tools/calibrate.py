@@ -14,6 +14,7 @@
 from time import sleep
 from europi import oled, b1, b2, k2, ain, cvs, usb_connected, turn_off_all_cvs
 from europi_script import EuroPiScript
+from file_utils import atomic_write
 from os import stat, mkdir
 from experimental.math_extras import mean
 
@@ -50,14 +51,14 @@ class CalibrationValues:
 
         Note: this will overwrite all previous calibrations
         """
-        with open(f"lib/calibration_values.py", "w") as file:
-            values = ", ".join(map(str, self.input_calibration_values))
-            file.write(f"INPUT_CALIBRATION_VALUES=[{values}]\n")
-
-            values = ", ".join(map(str, self.output_calibration_values))
-            file.write(f"OUTPUT_CALIBRATION_VALUES=[{values}]\n")
-
-            file.write(f"CALIBRATION_MODE = '{self.mode}'\n")
+        input_values = ", ".join(map(str, self.input_calibration_values))
+        output_values = ", ".join(map(str, self.output_calibration_values))
+        atomic_write(
+            "lib/calibration_values.py",
+            f"INPUT_CALIBRATION_VALUES=[{input_values}]\n"
+            f"OUTPUT_CALIBRATION_VALUES=[{output_values}]\n"
+            f"CALIBRATION_MODE = '{self.mode}'\n",
+        )
 
 
 class Calibrate(EuroPiScript):
@@ -0,0 +1,270 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures how long it takes to send frames to the OLED at each of the I²C frequencies allowed by
+DISPLAY_FREQUENCY, and recommends the fastest one that works reliably with the attached display.
+
+- b1: run the benchmark again
+- b2: save the recommended frequency to /config/EuroPiConfig.json
+- k1: choose which result to show
+"""
+
+import time
+
+from europi import b1, b2, k1, europi_config, turn_off_all_cvs
+from europi_config import EuroPiConfig
+from europi_display import Display
+from europi_log import flush_log, log_info
+from europi_script import EuroPiScript
+from configuration import ConfigFile
+from file_utils import load_json_file
+
+# The number of frames sent for each measurement
+DEFAULT_ITERATIONS = 20
+
+# The size of the area changed for the partial flush measurement; one 8x8 character cell
+PARTIAL_SIZE = 8
+
+
+class BenchmarkResult:
+    """The timings measured at one I²C frequency
+
+    :param freq:  The I²C frequency, in Hz
+    """
+
+    def __init__(self, freq):
+        self.freq = freq
+
+        # Average time to send a frame, in microseconds. None if no frame was sent successfully
+        self.full_us = None
+        self.partial_us = None
+
+        # The number of frames that couldn't be sent
+        self.errors = 0
+
+    @property
+    def stable(self):
+        """True if every frame was sent without an error"""
+        return self.errors == 0 and self.full_us is not None and self.partial_us is not None
+
+    def __str__(self):
+        if self.full_us is None or self.partial_us is None:
+            return f"{self.freq}Hz: failed ({self.errors} errors)"
+        return (
+            f"{self.freq}Hz: full {self.full_us}us, partial {self.partial_us}us, "
+            f"{self.errors} errors"
+        )
+
+
+def create_display(freq):
+    """Create a Display on the configured pins, using the given I²C frequency
+
+    :param freq:  The I²C frequency, in Hz
+    """
+    return Display(
+        width=europi_config.DISPLAY_WIDTH,
+        height=europi_config.DISPLAY_HEIGHT,
+        sda=europi_config.DISPLAY_SDA,
+        scl=europi_config.DISPLAY_SCL,
+        channel=europi_config.DISPLAY_CHANNEL,
+        freq=freq,
+        contrast=europi_config.DISPLAY_CONTRAST,
+        rotate=europi_config.ROTATE_DISPLAY,
+    )
+
+
+def candidate_frequencies():
+    """Return the I²C frequencies allowed by DISPLAY_FREQUENCY, slowest first"""
+    for point in EuroPiConfig.config_points():
+        if point.name == "DISPLAY_FREQUENCY":
+            return sorted(point.choices)
+    return [europi_config.DISPLAY_FREQUENCY]
+
+
+def _time_frames(display, draw, iterations):
+    # Clear the display, then send `iterations` frames, calling draw(display, colour) before each
+    # Returns the total time taken in microseconds & the number of frames that failed
+    # OSErrors raised while clearing the display are left to the caller
+    display.fill(0)
+    display.show(force=True)
+
+    total = 0
+    errors = 0
+    for i in range(iterations):
+        # alternate the colour, starting with 1, so every frame differs from the last one sent;
+        # identical frames would be skipped by Display.show()
+        draw(display, 1 - (i & 1))
+        start = time.ticks_us()
+        try:
+            display.show(force=True)
+        except OSError:
+            errors += 1
+            continue
+        total += time.ticks_diff(time.ticks_us(), start)
+    return total, errors
+
+
+def _draw_full(display, colour):
+    display.fill(colour)
+
+
+def _draw_partial(display, colour):
+    display.fill_rect(0, 0, PARTIAL_SIZE, PARTIAL_SIZE, colour)
+
+
+def benchmark_frequency(freq, iterations=DEFAULT_ITERATIONS, display_factory=create_display):
+    """Measure the time taken to send full & partial frames at one I²C frequency
+
+    :param freq:  The I²C frequency to test, in Hz
+    :param iterations:  The number of frames to send for each measurement
+    :param display_factory:  A function that creates a Display using the given frequency
+
+    :return:  A BenchmarkResult
+    """
+    result = BenchmarkResult(freq)
+    try:
+        display = display_factory(freq)
+
+        total, errors = _time_frames(display, _draw_full, iterations)
+        result.errors += errors
+        if errors < iterations:
+            result.full_us = total // (iterations - errors)
+
+        total, errors = _time_frames(display, _draw_partial, iterations)
+        result.errors += errors
+        if errors < iterations:
+            result.partial_us = total // (iterations - errors)
+    except OSError:
+        # the display didn't respond to its initialization sequence, or couldn't be cleared
+        result.errors += iterations
+
+    return result
+
+
+def run_benchmark(frequencies=None, iterations=DEFAULT_ITERATIONS, display_factory=create_display):
+    """Benchmark every frequency in turn
+
+    :param frequencies:  The I²C frequencies to test. If None, every allowed DISPLAY_FREQUENCY
+        is tested
+    :param iterations:  The number of frames to send for each measurement
+    :param display_factory:  A function that creates a Display using the given frequency
+
+    :return:  A list of BenchmarkResults, in the same order as the frequencies
+    """
+    if frequencies is None:
+        frequencies = candidate_frequencies()
+    return [benchmark_frequency(freq, iterations, display_factory) for freq in frequencies]
+
+
+def recommend_frequency(results):
+    """Choose the frequency that sent full frames the quickest without any errors
+
+    Above a certain frequency the display may stretch the clock, so a higher frequency isn't
+    necessarily quicker; if two frequencies are equally fast the lower one is chosen.
+
+    :param results:  A list of BenchmarkResults
+    :return:  The recommended frequency in Hz, or None if no frequency was stable
+    """
+    best = None
+    for result in results:
+        if not result.stable:
+            continue
+        if (
+            best is None
+            or result.full_us < best.full_us
+            or (result.full_us == best.full_us and result.freq < best.freq)
+        ):
+            best = result
+    return best.freq if best else None
+
+
+def save_display_frequency(freq):
+    """Save DISPLAY_FREQUENCY to the EuroPi configuration file, keeping any other settings
+
+    The new frequency is used after the module is restarted.
+
+    :param freq:  The I²C frequency to save, in Hz
+    """
+    config = load_json_file(ConfigFile.config_filename(EuroPiConfig))
+    config["DISPLAY_FREQUENCY"] = freq
+    ConfigFile.save_config(EuroPiConfig, config)
+
+
+class DisplayBenchmark(EuroPiScript):
+    """
+    Benchmarks the OLED at each allowed I²C frequency & optionally saves the best one
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self.recommended = None
+        self.saved = False
+        self.rerun = True
+
+        b1.handler(self.on_rerun)
+        b2.handler(self.on_save)
+
+    def on_rerun(self):
+        self.rerun = True
+
+    def on_save(self):
+        if self.recommended is not None and not self.saved:
+            save_display_frequency(self.recommended)
+            self.saved = True
+
+    def benchmark(self):
+        """Test every frequency, then switch back to the configured one to show the results"""
+        create_display(europi_config.DISPLAY_FREQUENCY).centre_text("Benchmarking\nplease wait")
+
+        self.results = run_benchmark()
+        for result in self.results:
+            log_info("%s", "display_benchmark", result)
+
+        self.recommended = recommend_frequency(self.results)
+        self.saved = False
+        log_info("Recommended DISPLAY_FREQUENCY: %s", "display_benchmark", self.recommended)
+        flush_log()
+
+        # go back to the configured frequency to show the results
+        self.display = create_display(europi_config.DISPLAY_FREQUENCY)
+
+    def main(self):
+        turn_off_all_cvs()
+
+        while True:
+            if self.rerun:
+                self.rerun = False
+                self.benchmark()
+
+            result = k1.choice(self.results)
+            if result.stable:
+                timing = f"{result.full_us // 100 / 10}/{result.partial_us // 100 / 10}ms"
+            else:
+                timing = f"{result.errors} errors"
+
+            if self.recommended is None:
+                status = "No stable freq"
+            elif self.saved:
+                status = "Saved; restart"
+            else:
+                status = f"B2: save {self.recommended // 1000}k"
+
+            marker = "*" if result.freq == self.recommended else ""
+            self.display.centre_text(f"{result.freq // 1000}kHz{marker}\n{timing}\n{status}")
+            time.sleep(0.1)
+
+
+if __name__ == "__main__":
+    DisplayBenchmark().main()
@@ -14,7 +14,7 @@
 """This module provides reusable UI components.
 """
 
-from europi import CHAR_HEIGHT, CHAR_WIDTH, OLED_HEIGHT, b1, k1, oled
+from europi import CHAR_HEIGHT, OLED_HEIGHT, b1, k1, oled
 
 
 class Menu:
@@ -45,25 +45,16 @@ class Menu:
         """The currently selected menu item."""
         return self.select_knob.read_position(steps=len(self.items) - 1)
 
-    def _inverted_text(self, s, x, y):
-        """displays the given text with an inverted background"""
-        oled.fill_rect(x, y - 1, CHAR_WIDTH * len(s), CHAR_HEIGHT + 2, 1)
-        oled.text(s, x, y, 0)
-
     def draw_menu(self):
         """This function should be called by your script's main loop in order to display and refresh the menu."""
         current = self.selected
         oled.fill(0)
         line_height = CHAR_HEIGHT + 2
 
-        for line_number, item in enumerate(self.items):
-            y_position = ((line_number - current) * line_height) + 1
-            if (
-                y_position <= (OLED_HEIGHT - line_height) and y_position > 0
-            ):  # Only draw lines which can be fully displayed
-                if line_number == (current + 1):
-                    self._inverted_text(f"{item}", 2, y_position)
-                else:
-                    oled.text(f"{item}", 2, y_position, 1)
+        # Only draw lines which can be fully displayed; the title or the item before the selected
+        # one is at the top, followed by the selected item
+        visible_lines = (OLED_HEIGHT - line_height - 1) // line_height + 1
+        lines = [f"{item}" for item in self.items[current : current + visible_lines]]
+        oled.draw_text_block(lines, 2, 1, inverted_mask=0b10, line_height=line_height)
 
         oled.show()
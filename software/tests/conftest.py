@@ -23,7 +23,64 @@ sys.path.append(str(Path(__file__).parent.parent / "tests" / "mocks"))
 
 from mock_hardware import MockHardware
 
+# The firmware modules that keep time, and the name each one imports the time module as
+FAKE_TIME_MODULES = [
+    ("europi_hardware", "time"),
+    ("europi_display", "time"),
+    ("europi_log", "utime"),
+    ("experimental.async_display", "time"),
+    ("experimental.pio_input", "time"),
+    ("tools.display_benchmark", "time"),
+]
+
+
+class FakeTime:
+    """Stands in for MicroPython's time module with a clock that only moves when a test moves it
+
+    The clock counts in microseconds; set ``us`` or ``ms`` to move it.
+    """
+
+    def __init__(self):
+        self.us = 0
+
+    @property
+    def ms(self):
+        return self.us // 1000
+
+    @ms.setter
+    def ms(self, value):
+        self.us = value * 1000
+
+    def ticks_us(self):
+        return self.us
+
+    def ticks_ms(self):
+        return self.ms
+
+    def ticks_add(self, a, b):
+        return a + b
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+    def sleep_ms(self, ms):
+        self.ms += ms
+
+    def sleep(self, s):
+        self.us += int(s * 1000000)
+
 
 @pytest.fixture
 def mockHardware(monkeypatch):
     return MockHardware(monkeypatch)
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Replace the time module of every loaded firmware module in FAKE_TIME_MODULES"""
+    t = FakeTime()
+    for name, attr in FAKE_TIME_MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            monkeypatch.setattr(module, attr, t)
+    return t
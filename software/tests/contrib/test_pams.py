@@ -0,0 +1,20 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from europi import ain, k1
+from contrib.pams import BufferedAnalogueReader
+
+
+def test_knob_percentage_is_reversed():
+    assert BufferedAnalogueReader(k1, "Knob").reverse_percentage
+    assert not BufferedAnalogueReader(ain, "AIN").reverse_percentage
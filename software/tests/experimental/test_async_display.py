@@ -0,0 +1,83 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from europi_display import Display
+from experimental.async_display import AsyncDisplay
+
+
+@pytest.fixture
+def display():
+    display = Display(
+        width=128, height=32, sda=0, scl=1, channel=0, freq=400000, contrast=255, rotate=False
+    )
+    display.show()
+    display.data.clear()
+    return display
+
+
+def test_present_without_thread_shows_immediately(fake_time, display):
+    screen = AsyncDisplay(display)
+    screen._back[0] = 0x55
+    screen.present()
+
+    assert display.buffer[0] == 0x55
+    assert len(display.data) == 1
+    assert screen.frames_presented == 1
+    assert screen.frames_shown == 1
+
+
+def test_back_buffer_is_isolated(fake_time, display):
+    screen = AsyncDisplay(display)
+    screen.running = True  # pretend the flush thread is running
+
+    screen._back[0] = 1
+    screen.present()
+    screen._back[0] = 2  # drawing the next frame doesn't affect the pending one
+
+    assert screen._flush()
+    assert display.buffer[0] == 1
+    assert not screen._flush()  # nothing new to send
+
+
+def test_frames_are_dropped(fake_time, display):
+    screen = AsyncDisplay(display)
+    screen.running = True
+
+    for i in range(3):
+        screen._back[0] = i
+        screen.present()
+    screen._flush()
+
+    assert display.buffer[0] == 2
+    assert screen.frames_presented == 3
+    assert screen.frames_shown == 1
+
+
+def test_flush_loop_is_rate_limited(fake_time, display):
+    screen = AsyncDisplay(display, max_fps=10)
+    screen.running = True
+    screen.present()
+
+    # stop the loop after its first sleep
+    def sleep_then_stop(ms):
+        fake_time.ms += ms
+        screen.running = False
+
+    fake_time.sleep_ms = sleep_then_stop
+    screen._flush_loop()
+
+    assert fake_time.ms == 100
+    assert screen.frames_shown == 0
+    assert screen._stopped
@@ -0,0 +1,93 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from experimental.custom_font import CustomFontWriter, GLYPH_OVERHEAD_BYTES
+from experimental.fonts import freesans14
+
+
+class CountingFont:
+    """Wraps a font module, counting the calls to get_ch()"""
+
+    def __init__(self, font):
+        self.font = font
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+    def get_ch(self, ch):
+        self.calls += 1
+        return self.font.get_ch(ch)
+
+
+class Device:
+    width = 128
+    height = 32
+
+    def __init__(self):
+        self.blits = []
+
+    def blit(self, fbuf, x, y):
+        self.blits.append((fbuf, x, y))
+
+
+@pytest.fixture
+def font():
+    return CountingFont(freesans14)
+
+
+def test_glyphs_are_cached(font):
+    device = Device()
+    writer = CustomFontWriter(device, font)
+
+    writer.print("aba", 0, 0)
+    assert font.calls == 2
+    # the same FrameBuffer is reused for both a's
+    assert device.blits[0][0] is device.blits[2][0]
+    assert device.blits[1][1] == freesans14.get_ch("a")[2]
+
+    writer.print("aba", 0, 0)
+    assert font.calls == 2
+
+    # inverted glyphs are cached separately
+    writer.print("a", 0, 0, c=0)
+    assert font.calls == 3
+    assert device.blits[-1][0] is not device.blits[0][0]
+
+
+def test_lru_eviction(font):
+    glyph_size = len(freesans14.get_ch("a")[0]) + GLYPH_OVERHEAD_BYTES
+    writer = CustomFontWriter(Device(), font, cache_bytes=glyph_size * 2)
+
+    writer.print("ab", 0, 0)
+    writer.print("a", 0, 0)  # b is now the least recently used
+    writer.print("c", 0, 0)
+    assert set(writer._glyphs) == {"a", "c"}
+    assert writer._cached_bytes <= writer.cache_bytes
+
+    font.calls = 0
+    writer.print("a", 0, 0)
+    assert font.calls == 0
+
+
+def test_string_len_cached(font):
+    writer = CustomFontWriter(Device(), font)
+    width = sum(freesans14.get_ch(ch)[2] for ch in "hello")
+
+    assert writer.string_len("hello") == width
+    font.calls = 0
+    assert writer.string_len("hello") == width
+    assert writer.string_len("hell") == width - freesans14.get_ch("o")[2]
+    assert font.calls == 0
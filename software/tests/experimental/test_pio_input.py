@@ -0,0 +1,82 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from experimental import pio_input
+from experimental.pio_input import PioDigitalInput
+
+
+@pytest.fixture
+def clock_in(fake_time):
+    fake_time.us = 5000
+    return PioDigitalInput(size=8)
+
+
+def pio_edges(clock_in, *timestamps_us):
+    """Push edges into the state machine's FIFO as the PIO program would and raise the IRQ"""
+    # the PIO program's counter starts at 0xFFFFFFFF and counts down once per microsecond
+    clock_in._sm.rx.extend(0xFFFFFFFF - t for t in timestamps_us)
+    clock_in._on_pio_irq(clock_in._sm)
+
+
+def test_pulse_count_and_period(clock_in):
+    pio_edges(clock_in, 100, 1100)
+    pio_edges(clock_in, 2600)
+
+    assert clock_in.pulse_count() == 3
+    assert clock_in.period_us() == 1500
+
+    clock_in.reset_pulse_count()
+    assert clock_in.pulse_count() == 0
+
+
+def test_handler_called_per_edge(clock_in):
+    calls = []
+    clock_in.handler(lambda: calls.append(True))
+
+    pio_edges(clock_in, 10, 20, 30)
+    assert len(calls) == 3
+
+    clock_in.reset_handler()
+    pio_edges(clock_in, 40)
+    assert len(calls) == 3
+    assert clock_in.pulse_count() == 4
+
+
+def test_edge_fifo(clock_in):
+    pio_edges(clock_in, 5, 10, 15)
+
+    edges = []
+    clock_in.drain(lambda t, level: edges.append((t, level)))
+    # timestamps are ticks_us(); the state machine was started at 5000us
+    assert edges == [(5005, 1), (5010, 1), (5015, 1)]
+
+
+class Registers(dict):
+    def __getitem__(self, address):
+        return self.get(address, 0)
+
+
+def test_fifo_overflow(clock_in, monkeypatch):
+    registers = Registers()
+    monkeypatch.setattr(pio_input, "mem32", registers)
+
+    pio_edges(clock_in, 10)
+    assert clock_in.overflows == 0
+
+    registers[clock_in._fdebug] = clock_in._rxstall
+    pio_edges(clock_in, 20)
+    assert clock_in.overflows == 1
+    # the flag was cleared by writing 1 to it
+    assert registers[clock_in._fdebug] == clock_in._rxstall
@@ -0,0 +1,80 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from experimental import screensaver
+from experimental.screensaver import OledWithScreensaver, Screensaver
+
+
+class FakeUtime:
+    def __init__(self):
+        self.ms = 0
+
+    def ticks_ms(self):
+        return self.ms
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    for name in ("show", "poweroff", "poweron"):
+        monkeypatch.setattr(screensaver.oled, name, lambda name=name: calls.append(name))
+    return calls
+
+
+@pytest.fixture
+def utime(monkeypatch):
+    fake = FakeUtime()
+    monkeypatch.setattr(screensaver, "utime", fake)
+    return fake
+
+
+def test_drawing_goes_straight_to_oled():
+    ssoled = OledWithScreensaver()
+    assert ssoled.text == screensaver.oled.text
+    assert ssoled.fill_rect == screensaver.oled.fill_rect
+
+
+def test_blank_turns_display_off(utime, calls):
+    ssoled = OledWithScreensaver()
+
+    ssoled.show()
+    assert calls == ["show"]
+
+    calls.clear()
+    utime.ms = Screensaver.BLANK_TIMEOUT_MS + 1
+    ssoled.show()
+    ssoled.show()
+    assert ssoled.is_blank()
+    # the display is switched off once and nothing else is sent
+    assert calls == ["poweroff"]
+
+    calls.clear()
+    ssoled.notify_user_interaction()
+    ssoled.show()
+    assert not ssoled.is_blank()
+    assert calls == ["poweron", "show"]
+
+
+def test_logo_is_cached(utime, calls):
+    saver = Screensaver()
+    saver.draw(force=True)
+    logo = Screensaver._logo_fb
+    assert logo is not None
+
+    Screensaver().draw(force=True)
+    assert Screensaver._logo_fb is logo
@@ -0,0 +1,78 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import utime
+
+from experimental import settings_menu
+from experimental.settings_menu import ActionMenuItem, SettingsMenu
+
+
+class FakeKnob:
+    def __init__(self):
+        self.index = 0
+
+    def choice(self, items):
+        return items[self.index % len(items)]
+
+
+def item(title, children=None):
+    return ActionMenuItem(["Ok"], title=title, prefix="", children=children)
+
+
+@pytest.fixture
+def menu(monkeypatch):
+    monkeypatch.setattr(settings_menu, "time", utime)
+    return SettingsMenu(
+        menu_items=[
+            item("A", children=[item("A1"), item("A2")]),
+            item("B"),
+            item("C"),
+        ],
+        navigation_knob=FakeKnob(),
+    )
+
+
+def test_visible_items_are_cached(menu):
+    items = menu.visible_items
+    assert [i.title for i in items] == ["A", "B", "C"]
+    assert menu.visible_items is items
+
+
+def test_hiding_an_item_updates_visible_items(menu):
+    items = menu.visible_items
+    menu.items[1].is_visible = False
+
+    assert menu.visible_items is not items
+    assert [i.title for i in menu.visible_items] == ["A", "C"]
+
+    menu.items[1].is_visible = True
+    assert [i.title for i in menu.visible_items] == ["A", "B", "C"]
+
+
+def test_changing_level_updates_visible_items(menu):
+    assert [i.title for i in menu.visible_items] == ["A", "B", "C"]
+
+    menu.long_press()
+    assert [i.title for i in menu.visible_items] == ["A1", "A2"]
+
+    menu.long_press()
+    assert [i.title for i in menu.visible_items] == ["A", "B", "C"]
+
+
+def test_adding_a_child_updates_visible_items(menu):
+    menu.long_press()
+    assert len(menu.visible_items) == 2
+
+    menu.items[0].add_child(item("A3"))
+    assert [i.title for i in menu.visible_items] == ["A1", "A2", "A3"]
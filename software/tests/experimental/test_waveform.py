@@ -0,0 +1,93 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from europi_display import Display
+from experimental.waveform import WaveformView
+
+
+@pytest.fixture
+def display():
+    return Display(
+        width=128, height=32, sda=0, scl=1, channel=0, freq=400000, contrast=255, rotate=False
+    )
+
+
+def lit(display, x, y):
+    return bool(display.buffer[(y >> 3) * display.width + x] & (1 << (y & 7)))
+
+
+def lit_rows(display, x):
+    return [y for y in range(display.height) if lit(display, x, y)]
+
+
+def test_value_to_row():
+    view = WaveformView(height=32, min_value=0, max_value=10)
+    assert view._to_row(10) == 0
+    assert view._to_row(0) == 31
+    assert view._to_row(5) == 16
+    assert view._to_row(-3) == 31
+    assert view._to_row(20) == 0
+
+
+def test_newest_sample_on_the_right(display):
+    view = WaveformView(width=8, height=32, max_value=31, connect=False)
+    view.push([31])
+    view.push([0])
+    view.draw(display)
+
+    assert lit_rows(display, 6) == [0]
+    assert lit_rows(display, 7) == [31]
+    # columns without samples yet are empty
+    assert lit_rows(display, 0) == []
+
+
+def test_history_wraps(display):
+    view = WaveformView(width=4, height=32, max_value=31, connect=False)
+    for v in range(6):
+        view.push([31 - v])
+    view.draw(display)
+
+    assert [lit_rows(display, x) for x in range(4)] == [[2], [3], [4], [5]]
+
+
+def test_connected_traces(display):
+    view = WaveformView(channels=2, width=4, height=32, max_value=31)
+    view.push([31 - 2, 31 - 20])
+    view.push([31 - 6])  # missing channel repeats its previous sample
+    view.draw(display)
+
+    assert lit_rows(display, 2) == [2, 20]
+    assert lit_rows(display, 3) == [2, 3, 4, 5, 6, 20]
+
+
+def test_view_must_fit(display):
+    view = WaveformView(width=128, height=32, x=1)
+    with pytest.raises(ValueError):
+        view.draw(display)
+
+
+def test_only_the_view_is_sent(display):
+    display.show()
+    display.commands.clear()
+    display.data.clear()
+
+    view = WaveformView(width=16, height=16, x=8, y=8, max_value=15)
+    view.push([5])
+    view.draw(display, clear=False)
+    display.show()
+
+    # columns 8-23, pages 1-2
+    assert display.commands[-6:] == [0x21, 8, 23, 0x22, 1, 2]
+    assert sum(len(d) for d in display.data) == 16 * 2
@@ -39,8 +39,11 @@ class MockHardware:
         self._monkeypatch.setattr(Pin, "value", lambda pin: self._digital_pin_values[pin])
 
     def set_ADC_u16_value(self, reader: AnalogueReader, value: int):
-        """Sets the value that will be returned by a call to `read_u16` on the given AnalogueReader."""
-        self._adc_pin_values[reader.pin] = value
+        """Sets the value that will be returned by a call to `read_u16` on the given AnalogueReader.
+
+        Like the real hardware, `read_u16` only returns integers, so the value is rounded.
+        """
+        self._adc_pin_values[reader.pin] = round(value)
 
     def set_digital_value(self, reader: DigitalReader, value: bool):
         """Sets the value that will be returned by a call to `value` on the given DigitalReader."""
@@ -15,5 +15,15 @@ class FrameBuffer:
     def __init__(self, *args):
         pass
 
+    def fill(self, *args):
+        pass
+
+    def text(self, *args):
+        pass
+
+    def blit(self, *args):
+        pass
+
 
+MONO_VLSB = 0
 MONO_HLSB = 3
@@ -29,11 +29,13 @@ class I2C:
 
 class Pin:
     IN = "in"
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
 
     def __init__(self, id, *args):
         pass
 
-    def irq(self, handler=None, trigger=None):
+    def irq(self, handler=None, trigger=None, hard=False):
         pass
 
     def value(self, *args):
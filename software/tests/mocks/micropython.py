@@ -8,3 +8,7 @@ def native(x):
 
 def viper(x):
     return x
+
+
+def schedule(func, arg):
+    func(arg)
@@ -16,10 +16,24 @@ import functools
 
 class PIO:
     OUT_LOW = 0
+    JOIN_RX = 2
 
 
 class StateMachine:
-    pass
+    def __init__(self, *args, **kwargs):
+        self.rx = []
+
+    def active(self, *args):
+        pass
+
+    def irq(self, handler=None, *args):
+        pass
+
+    def rx_fifo(self):
+        return len(self.rx)
+
+    def get(self, *args):
+        return self.rx.pop(0)
 
 
 def asm_pio(**kwargs):
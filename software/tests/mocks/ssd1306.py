@@ -31,8 +31,26 @@ SET_CHARGE_PUMP = 0x8D
 
 
 class SSD1306_I2C:
-    def __init__(self, *args):
-        pass
+    """Minimal stand-in for the ssd1306 driver
+
+    Like the real driver, the constructor clears the display by calling ``fill(0)`` & ``show()``.
+    Drawing methods don't change the buffer, but commands & data sent to the display are
+    recorded in ``commands`` and ``data`` so tests can inspect the I2C traffic.
+    """
+
+    def __init__(self, width=128, height=32, i2c=None, *args):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.buffer = bytearray(self.pages * width)
+        self.commands = []
+        self.data = []
+        self.init_display()
+
+    def init_display(self):
+        # The real driver sends its initialization sequence, then clears the display
+        self.fill(0)
+        self.show()
 
     def contrast(self, *args):
         pass
@@ -61,5 +79,32 @@ class SSD1306_I2C:
     def hline(self, *args):
         pass
 
-    def write_cmd(self, *args):
+    def vline(self, *args):
+        pass
+
+    def line(self, *args):
+        pass
+
+    def poly(self, *args):
+        pass
+
+    def scroll(self, *args):
+        pass
+
+    def pixel(self, *args):
         pass
+
+    def poweroff(self):
+        self.write_cmd(SET_DISP)
+
+    def poweron(self):
+        self.write_cmd(SET_DISP | 0x01)
+
+    def invert(self, *args):
+        pass
+
+    def write_cmd(self, cmd):
+        self.commands.append(cmd)
+
+    def write_data(self, buf):
+        self.data.append(bytes(buf))
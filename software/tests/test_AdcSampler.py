@@ -0,0 +1,112 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from europi import AdcSampler, MAX_ADC_RAW, MAX_UINT16, PIN_AIN, PIN_K1, PIN_K2
+
+
+@pytest.fixture
+def sampler():
+    return AdcSampler([PIN_K2, PIN_AIN, PIN_K1], depth=4)
+
+
+def fill(sampler, ain, k1, k2):
+    """Fill the sampler's buffer as the round-robin DMA capture would"""
+    for i in range(sampler.depth):
+        sampler.buffer[i * 3] = ain[i]
+        sampler.buffer[i * 3 + 1] = k1[i]
+        sampler.buffer[i * 3 + 2] = k2[i]
+
+
+def test_disabled_without_dma(sampler):
+    assert not sampler.enabled
+    assert not sampler.handles(PIN_K1, 4)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (0, 0),
+        (MAX_ADC_RAW, MAX_UINT16),
+        (2048, 2048 << 4 | 2048 >> 8),
+    ],
+)
+def test_average_matches_read_u16_scaling(sampler, raw, expected):
+    fill(sampler, [raw] * 4, [0] * 4, [0] * 4)
+
+    assert sampler._average(0, 4) == expected
+
+
+def test_average_is_per_channel(sampler):
+    fill(sampler, [0, 0, 0, 0], [100, 200, 300, 400], [MAX_ADC_RAW] * 4)
+
+    assert sampler._average(0, 4) == 0
+    assert sampler._average(1, 4) == (250 << 4) + ((250 << 4) >> 12)
+    assert sampler._average(1, 2) == (150 << 4) + ((150 << 4) >> 12)
+    assert sampler._average(2, 4) == MAX_UINT16
+
+
+@pytest.fixture
+def captures(sampler, fake_time, monkeypatch):
+    """Replace the DMA capture with one that records when it was called"""
+    calls = []
+
+    def capture():
+        calls.append(fake_time.us)
+        sampler._consumed = 0
+        sampler._captured = sampler.depth
+        sampler._captured_at = fake_time.us
+
+    sampler.enabled = True
+    monkeypatch.setattr(sampler, "_capture", capture)
+    return calls
+
+
+def test_capture_once_per_round(sampler, captures):
+    for pin in (PIN_AIN, PIN_K1, PIN_K2):
+        assert sampler.handles(pin, 4)
+        sampler.read(pin, 4)
+    assert len(captures) == 1
+
+    sampler.read(PIN_K1, 4)
+    assert len(captures) == 2
+
+
+def test_stale_samples_are_recaptured(sampler, captures, fake_time):
+    sampler.read(PIN_K1, 4)
+    assert len(captures) == 1
+
+    # ain's samples haven't been read, but they're too old to use
+    fake_time.us += sampler.max_age_us + 1
+    sampler.read(PIN_AIN, 4)
+    assert len(captures) == 2
+
+
+def test_read_during_capture_uses_buffer(sampler, captures):
+    fill(sampler, [0] * 4, [100] * 4, [0] * 4)
+    sampler._lock.acquire()
+    try:
+        assert sampler.read(PIN_K1, 4) == (100 << 4) + ((100 << 4) >> 12)
+        sampler.capture()
+    finally:
+        sampler._lock.release()
+    assert captures == []
+
+
+def test_handles_limits(sampler):
+    sampler.enabled = True
+
+    assert sampler.handles(PIN_AIN, 4)
+    assert not sampler.handles(PIN_AIN, 5)
+    assert not sampler.handles(1, 4)
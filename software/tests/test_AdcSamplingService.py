@@ -0,0 +1,85 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+import europi_hardware
+from europi import AdcSamplingService, AnalogueReader, MAX_UINT16
+
+from mock_hardware import MockHardware
+
+
+@pytest.fixture
+def readers():
+    return [AnalogueReader(pin=1), AnalogueReader(pin=2)]  # actual pin values don't matter
+
+
+@pytest.fixture
+def service(readers, monkeypatch):
+    service = AdcSamplingService(readers, window=4)
+    # route the module-level service used by AnalogueReader to our test instance
+    monkeypatch.setattr(europi_hardware, "adc_service", service)
+    yield service
+    service.stop()
+
+
+def test_stopped_by_default(service, readers):
+    assert not service.running
+    assert not service.handles(readers[0].pin_id)
+
+
+def test_start_primes_averages(mockHardware: MockHardware, service, readers):
+    mockHardware.set_ADC_u16_value(readers[0], 1000)
+    mockHardware.set_ADC_u16_value(readers[1], MAX_UINT16)
+    service.start()
+
+    assert service.latest(readers[0].pin_id) == 1000
+    assert service.latest(readers[1].pin_id) == MAX_UINT16
+
+
+def test_running_average(mockHardware: MockHardware, service, readers):
+    mockHardware.set_ADC_u16_value(readers[0], 0)
+    mockHardware.set_ADC_u16_value(readers[1], 0)
+    service.start()
+
+    mockHardware.set_ADC_u16_value(readers[0], 4000)
+    service._tick(None)
+    assert service.latest(readers[0].pin_id) == 1000
+
+    for _ in range(3):
+        service._tick(None)
+    assert service.latest(readers[0].pin_id) == 4000
+
+    # the oldest readings drop out of the window
+    mockHardware.set_ADC_u16_value(readers[0], 0)
+    service._tick(None)
+    assert service.latest(readers[0].pin_id) == 3000
+    assert service.latest(readers[1].pin_id) == 0
+
+
+def test_readers_use_snapshot(mockHardware: MockHardware, service, readers):
+    mockHardware.set_ADC_u16_value(readers[0], MAX_UINT16)
+    mockHardware.set_ADC_u16_value(readers[1], 0)
+    service.start()
+
+    # changing the hardware value has no effect until the service samples again
+    mockHardware.set_ADC_u16_value(readers[0], 0)
+    assert readers[0].percent() == 1.0
+
+    for _ in range(4):
+        service._tick(None)
+    assert readers[0].percent() == 0.0
+
+    service.stop()
+    mockHardware.set_ADC_u16_value(readers[0], MAX_UINT16)
+    assert readers[0].percent() == 1.0
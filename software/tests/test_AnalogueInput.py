@@ -0,0 +1,52 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from europi import ain, MAX_UINT16
+
+from mock_hardware import MockHardware
+
+
+@pytest.mark.parametrize(
+    "percent",
+    [0.0, 0.1, 0.25, 0.3333, 0.5, 0.75, 0.99, 1.0],
+)
+def test_read_millivolts_matches_read_voltage(mockHardware: MockHardware, percent):
+    mockHardware.set_analogue_input_percent(ain, percent)
+
+    assert abs(ain.read_millivolts() - ain.read_voltage() * 1000) <= 1
+
+
+@pytest.mark.parametrize("value", [0, 100, MAX_UINT16])
+def test_read_millivolts_clamps(mockHardware: MockHardware, value):
+    mockHardware.set_ADC_u16_value(ain, value)
+
+    assert ain.MIN_VOLTAGE * 1000 <= ain.read_millivolts() <= ain.MAX_VOLTAGE * 1000
+
+
+@pytest.mark.parametrize("percent", [0.0, 0.1, 0.5, 0.9, 1.0])
+def test_permille_matches_percent(mockHardware: MockHardware, percent):
+    mockHardware.set_analogue_input_percent(ain, percent)
+
+    assert abs(ain.permille() - ain.percent() * 1000) <= 1
+    assert ain.range_int(10) == min(int(ain.percent() * 10), 9)
+
+
+def test_lookup_table_matches_calibration():
+    for raw in range(0, MAX_UINT16, 97):
+        expected = min(max(ain._raw_to_mv(raw), 0), int(ain.MAX_VOLTAGE * 1000))
+        code = raw >> 4
+        low = ain._mv_table[code]
+        interpolated = low + (((ain._mv_table[code + 1] - low) * (raw & 0xF)) >> 4)
+        assert abs(interpolated - expected) <= 1
@@ -90,3 +90,38 @@ def test_choice(mockHardware: MockHardware, analogueReader, values, value, expec
     mockHardware.set_ADC_u16_value(analogueReader, value)
 
     assert analogueReader.choice(values) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0, 0),
+        (MAX_UINT16 // 4, 250),
+        (MAX_UINT16 // 2, 500),
+        (MAX_UINT16, 1000),
+    ],
+)
+def test_permille(mockHardware: MockHardware, analogueReader, value, expected):
+    mockHardware.set_ADC_u16_value(analogueReader, value)
+
+    assert analogueReader.permille() == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, MAX_UINT16 // 4, MAX_UINT16 // 3, MAX_UINT16 // 2, MAX_UINT16 - 1, MAX_UINT16],
+)
+@pytest.mark.parametrize("deadzone", [None, 0.0, 0.01, 0.1])
+def test_range_int_matches_range(mockHardware: MockHardware, analogueReader, value, deadzone):
+    mockHardware.set_ADC_u16_value(analogueReader, value)
+
+    for steps in (2, 10, 100, 1000):
+        assert analogueReader.range_int(steps, deadzone=deadzone) == analogueReader.range(
+            steps, deadzone=deadzone
+        )
+
+
+def test_raw_u16(mockHardware: MockHardware, analogueReader):
+    mockHardware.set_ADC_u16_value(analogueReader, 12345)
+
+    assert analogueReader.raw_u16() == 12345
@@ -34,3 +34,52 @@ def test_value(mockHardware: MockHardware, digitalReader, value, expected):
     mockHardware.set_digital_value(digitalReader, value)
 
     assert digitalReader.value() == expected
+
+
+def edge(mockHardware, reader, fake_time, us, value):
+    fake_time.us = us
+    mockHardware.set_digital_value(reader, value)
+    reader._capture_wrapper(reader.pin)
+
+
+def test_capture_and_drain(mockHardware: MockHardware, digitalReader, fake_time):
+    digitalReader.capture_edges(size=4)
+    edge(mockHardware, digitalReader, fake_time, 100, 1)
+    edge(mockHardware, digitalReader, fake_time, 150, 0)
+    edge(mockHardware, digitalReader, fake_time, 1100, 1)
+
+    assert digitalReader.pending_edges() == 3
+    assert digitalReader.last_period_us == 1000
+
+    edges = []
+    assert digitalReader.drain(lambda t, level: edges.append((t, level))) == 3
+    assert edges == [(100, 1), (150, 0), (1100, 1)]
+    assert digitalReader.pending_edges() == 0
+    assert digitalReader.drain(lambda t, level: edges.append((t, level))) == 0
+
+
+def test_capture_overflow_keeps_newest(mockHardware: MockHardware, digitalReader, fake_time):
+    digitalReader.capture_edges(size=4)
+    for i in range(10):
+        edge(mockHardware, digitalReader, fake_time, i, i % 2)
+
+    assert digitalReader.pending_edges() == 4
+    edges = []
+    digitalReader.drain(lambda t, level: edges.append(t))
+    assert edges == [6, 7, 8, 9]
+
+
+def test_capture_dispatch(mockHardware: MockHardware, digitalReader, fake_time):
+    rising = []
+    falling = []
+    digitalReader.handler(lambda: rising.append(True))
+    digitalReader.handler_falling(lambda: falling.append(True))
+    digitalReader.capture_edges(dispatch=True)
+
+    edge(mockHardware, digitalReader, fake_time, 10, 1)
+    edge(mockHardware, digitalReader, fake_time, 20, 0)
+    edge(mockHardware, digitalReader, fake_time, 30, 1)
+
+    assert len(rising) == 2
+    assert len(falling) == 1
+    assert digitalReader.pending_edges() == 0
@@ -0,0 +1,275 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+import ssd1306
+from europi_display import Display, DummyDisplay
+
+
+@pytest.fixture
+def display():
+    display = Display(
+        width=128, height=32, sda=0, scl=1, channel=0, freq=400000, contrast=255, rotate=False
+    )
+    display.show()
+    display.commands.clear()
+    display.data.clear()
+    return display
+
+
+def changed(display):
+    """The mocked drawing methods don't touch the buffer; change it so show() has a new frame"""
+    display.buffer[-1] = (display.buffer[-1] + 1) & 0xFF
+
+
+def window(display):
+    """Return the column & page window set by the last show()"""
+    cmds = display.commands
+    i = cmds.index(ssd1306.SET_COL_ADDR)
+    assert cmds[i + 3] == ssd1306.SET_PAGE_ADDR
+    return (cmds[i + 1], cmds[i + 2], cmds[i + 4], cmds[i + 5])
+
+
+def test_driver_init_sends_full_frame():
+    # the driver clears the display from its constructor, before Display.__init__ has finished
+    display = Display(
+        width=128, height=32, sda=0, scl=1, channel=0, freq=400000, contrast=255, rotate=False
+    )
+    assert window(display) == (0, 127, 0, 3)
+    assert sum(len(d) for d in display.data) == 512
+    assert display.frames_sent == 1
+
+
+def test_driver_init_with_max_fps(fake_time):
+    display = Display(
+        width=128,
+        height=32,
+        sda=0,
+        scl=1,
+        channel=0,
+        freq=400000,
+        contrast=255,
+        rotate=False,
+        max_fps=10,
+    )
+    assert display.frames_sent == 1
+
+
+def test_nothing_changed(display):
+    display.show()
+    assert display.commands == []
+    assert display.data == []
+
+
+def test_text_window(display):
+    display.text("hi", 10, 9, 1)
+    changed(display)
+    display.show()
+    assert window(display) == (10, 25, 1, 2)
+    # one write per page, each the width of the window
+    assert [len(d) for d in display.data] == [16, 16]
+
+
+def test_windows_merge(display):
+    display.pixel(5, 0, 1)
+    display.fill_rect(100, 20, 10, 4, 1)
+    changed(display)
+    display.show()
+    assert window(display) == (5, 109, 0, 2)
+
+
+def test_reading_pixel_is_not_dirty(display):
+    display.pixel(5, 5)
+    display.show()
+    assert display.data == []
+
+
+def test_clipped(display):
+    display.hline(-10, -5, 5, 1)  # entirely off-screen
+    display.show()
+    assert display.data == []
+
+    display.hline(120, 31, 20, 1)
+    changed(display)
+    display.show()
+    assert window(display) == (120, 127, 3, 3)
+
+
+def test_full_width_is_one_write(display):
+    display.fill(0)
+    changed(display)
+    display.show()
+    assert window(display) == (0, 127, 0, 3)
+    assert len(display.data) == 1
+
+
+def test_data_matches_buffer(display):
+    display.buffer[1 * 128 + 12] = 0xAA
+    display.text("x", 12, 8, 1)
+    display.show()
+    assert display.data == [b"\xaa" + bytes(7)]
+
+
+def test_max_fps(fake_time, display):
+    fake_time.ms = 1000
+    display.set_max_fps(10)
+    display.reset_frame_counters()
+
+    display.pixel(0, 0, 1)
+    changed(display)
+    display.show()
+    display.pixel(1, 0, 1)
+    changed(display)
+    fake_time.ms += 50
+    display.show()  # too soon
+    assert display.frames_sent == 1
+    assert display.frames_dropped == 1
+
+    # the dropped change is sent with the next frame
+    display.data.clear()
+    display.commands.clear()
+    fake_time.ms += 50
+    display.show()
+    assert window(display) == (1, 1, 0, 0)
+    assert display.frames_sent == 2
+
+
+def test_force_show(fake_time, display):
+    fake_time.ms = 1000
+    display.set_max_fps(10)
+    display.reset_frame_counters()
+
+    display.pixel(0, 0, 1)
+    changed(display)
+    display.show()
+    display.pixel(1, 0, 1)
+    changed(display)
+    display.show(force=True)
+    assert display.frames_sent == 2
+    assert display.frames_dropped == 0
+
+
+def test_identical_frames_are_skipped(display):
+    display.reset_frame_counters()
+
+    # redraw the same content
+    display.fill(0)
+    display.text("menu", 0, 0, 1)
+    display.show()
+    assert display.data == []
+    assert display.frames_skipped == 1
+
+    display.show()  # nothing drawn since the last show(), so nothing to send
+    assert display.data == []
+    assert display.frames_skipped == 2
+
+
+def test_repeated_shows_are_skipped(display):
+    display.reset_frame_counters()
+    for _ in range(3):
+        display.show()
+    assert display.data == []
+    assert display.frames_skipped == 3
+    assert display.frames_sent == 0
+
+
+def test_centre_text_layout():
+    from europi_display import centre_text_layout
+
+    layout = centre_text_layout("ab\nc", 128, 32)
+    assert layout == [(52, 6, "ab"), (56, 15, "c")]
+    assert centre_text_layout("ab\nc", 128, 32) is layout
+
+    # a different screen size gets a new layout
+    assert centre_text_layout("ab\nc", 64, 32) != layout
+
+    with pytest.raises(Exception):
+        centre_text_layout("1\n2\n3\n4\n5", 128, 32)
+
+
+def test_centre_text_cached(display):
+    display.centre_text_cached("hello", auto_show=False)
+    offscreen = display._offscreen
+    assert display._offscreen_text == "hello"
+
+    display.centre_text_cached("hello", auto_show=False)
+    assert display._offscreen is offscreen
+
+
+def test_text_block_window(display):
+    display.draw_text_block(["abc", "de", "fghij"], 2, 1, inverted_mask=0b10)
+    changed(display)
+    display.show()
+    # 5 characters wide; the inverted background starts 1 pixel above the first line
+    assert window(display) == (2, 41, 0, 3)
+
+
+def test_text_block_draws_each_line(display, monkeypatch):
+    calls = []
+    monkeypatch.setattr(ssd1306.SSD1306_I2C, "text", lambda self, *args: calls.append(args))
+    monkeypatch.setattr(ssd1306.SSD1306_I2C, "fill_rect", lambda self, *args: calls.append(args))
+
+    display.draw_text_block(["a", "bb", "c"], 2, 1, inverted_mask=0b10, line_height=10)
+
+    assert calls == [
+        ("a", 2, 1, 1),
+        (2, 10, 16, 10, 1),
+        ("bb", 2, 11, 0),
+        ("c", 2, 21, 1),
+    ]
+
+
+def test_empty_text_block(display):
+    display.draw_text_block([], 0, 0)
+    display.show()
+    assert display.data == []
+
+
+def test_direct_buffer_writes_are_sent(display):
+    display.reset_frame_counters()
+    # nothing drawn with the drawing methods, but the buffer changed
+    display.buffer[200] = 0x0F
+    display.show()
+    assert window(display) == (0, 127, 0, 3)
+    assert display.frames_sent == 1
+
+
+def test_failed_write_is_retried(display, monkeypatch):
+    display.reset_frame_counters()
+    display.text("x", 8, 8, 1)
+    changed(display)
+
+    def fail(buf):
+        raise OSError(5)
+
+    monkeypatch.setattr(display, "write_data", fail)
+    with pytest.raises(OSError):
+        display.show()
+    assert display.frames_sent == 0
+
+    monkeypatch.undo()
+    display.commands.clear()
+    display.show()
+    assert window(display) == (8, 15, 1, 1)
+    assert display.frames_sent == 1
+
+
+def test_dummy_display_api():
+    dummy = DummyDisplay(128, 32)
+    dummy.set_max_fps(30)
+    dummy.text("x", 0, 0, 1)
+    dummy.show()
+    dummy.show(force=True)
+    dummy.reset_frame_counters()
+    assert (dummy.frames_sent, dummy.frames_dropped, dummy.frames_skipped) == (0, 0, 0)
@@ -0,0 +1,98 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+import europi
+from europi import AnalogueInput, Knob, LazyHardware, Output, is_initialized
+
+
+class Counter:
+    created = 0
+
+    def __init__(self):
+        Counter.created += 1
+        self.value = 0
+
+    def increment(self):
+        self.value += 1
+        return self.value
+
+
+@pytest.fixture
+def lazy():
+    Counter.created = 0
+    return LazyHardware(Counter)
+
+
+def test_created_on_first_use(lazy):
+    assert Counter.created == 0
+    assert not is_initialized(lazy)
+
+    assert lazy.increment() == 1
+    assert lazy.increment() == 2
+    assert lazy.value == 2
+    assert Counter.created == 1
+    assert is_initialized(lazy)
+
+
+def test_setattr_passes_through(lazy):
+    lazy.value = 10
+    assert lazy._lazy_get().value == 10
+    assert lazy.increment() == 11
+
+
+def test_replacing_a_cached_method(lazy):
+    lazy.increment()  # caches the method on the stand-in
+    lazy.increment = lambda: -1
+    assert lazy.increment() == -1
+
+
+def test_eager_objects_are_initialized():
+    assert is_initialized(europi.din)
+    assert is_initialized(europi.b1)
+    assert is_initialized(europi.k1)
+
+
+def test_analogue_readers_keep_their_types():
+    # scripts check these, e.g. pams reverses the percentage of knobs
+    assert type(europi.k1) is Knob
+    assert type(europi.k2) is Knob
+    assert isinstance(europi.ain, AnalogueInput)
+    assert type(europi.ain) is not Knob
+
+
+def test_init_eager_names():
+    europi.init(["din", "ain", "k2"])
+
+
+def test_init_subset():
+    europi.init(["cv1", "k1"])
+    assert is_initialized(europi.cv1)
+    assert is_initialized(europi.k1)
+    assert isinstance(europi.cv1._lazy_get(), Output)
+
+
+def test_init_unknown_name():
+    with pytest.raises(ValueError):
+        europi.init(["cv7"])
+
+
+def test_output_bank_uses_real_outputs():
+    bank = europi.OutputBank([LazyHardware(lambda: Output(0)), LazyHardware(lambda: Output(1))])
+    bank.set_duties([100, 200])
+
+    outputs = bank._real_outputs()
+    assert all(isinstance(output, Output) for output in outputs)
+    assert [output._duty for output in outputs] == [100, 200]
+    assert bank._real_outputs() is outputs
@@ -0,0 +1,208 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from europi import Output, OutputBank, PwmSlices, OUTPUT_CALIBRATION_VALUES, PWM_FREQ
+from europi_hardware import PWM_SLICES_RP2350
+
+
+@pytest.fixture
+def output():
+    return Output(pin=1, calibration_values=OUTPUT_CALIBRATION_VALUES[0])  # pin doesn't matter
+
+
+@pytest.mark.parametrize("millivolts", [0, 1, 250, 999, 1000, 2500, 4321, 9999, 10000])
+def test_voltage_mv_matches_voltage(output, millivolts):
+    output.voltage(millivolts / 1000)
+    expected = output._duty
+
+    output.voltage_mv(millivolts)
+    assert output._duty == expected
+
+
+@pytest.mark.parametrize(
+    "millivolts, expected_mv",
+    [
+        (-100, 0),
+        (10001, 10000),
+        (20000, 10000),
+    ],
+)
+def test_voltage_mv_clamps(output, millivolts, expected_mv):
+    output.voltage_mv(expected_mv)
+    expected = output._duty
+
+    output.voltage_mv(millivolts)
+    assert output._duty == expected
+
+
+@pytest.mark.parametrize("resolution_mv", [1, 10])
+def test_voltage_table(output, resolution_mv):
+    expected = []
+    for mv in range(0, 10001, 37):
+        output.voltage_mv(mv - mv % resolution_mv)
+        expected.append(output._duty)
+
+    output.build_voltage_table(resolution_mv)
+    assert len(output._voltage_table) == 10000 // resolution_mv + 1
+    for mv, duty in zip(range(0, 10001, 37), expected):
+        output.voltage_mv(mv)
+        assert output._duty == duty
+
+    output.free_voltage_table()
+    assert output._voltage_table is None
+
+
+def test_voltage_uses_table(output):
+    output.voltage(3.3)
+    expected = output._duty
+
+    output.build_voltage_table()
+    output.voltage(3.3)
+    assert output._duty == expected
+
+
+@pytest.fixture
+def bank():
+    return OutputBank(
+        [Output(pin=i, calibration_values=OUTPUT_CALIBRATION_VALUES[i]) for i in range(6)]
+    )
+
+
+def test_bank_is_a_list(bank):
+    assert len(bank) == 6
+    assert all(isinstance(cv, Output) for cv in bank)
+
+
+def test_bank_set_voltages(bank):
+    voltages = [0.0, 1.5, 2.25, 5.0, 7.8, 10.0]
+    expected = []
+    for cv, v in zip(bank, voltages):
+        cv.voltage(v)
+        expected.append(cv._duty)
+        cv.off()
+
+    bank.set_voltages(voltages)
+    assert [cv._duty for cv in bank] == expected
+
+    bank.set_voltages_mv([int(v * 1000) for v in voltages])
+    assert [cv._duty for cv in bank] == expected
+
+
+def test_bank_partial_frame(bank):
+    bank.set_duties([1000] * 6)
+    bank.set_duties([0, 0])
+
+    assert [cv._duty for cv in bank] == [0, 0, 1000, 1000, 1000, 1000]
+
+
+class CountingPWM:
+    def __init__(self):
+        self.freqs = []
+
+    def freq(self, f):
+        self.freqs.append(f)
+
+    def duty_u16(self, duty):
+        self.duty = duty
+
+
+@pytest.mark.parametrize(
+    "pin, slice_id, channel",
+    [
+        (21, 2, 1),  # cv1
+        (20, 2, 0),  # cv2
+        (16, 0, 0),  # cv3
+        (17, 0, 1),  # cv4
+        (18, 1, 0),  # cv5
+        (19, 1, 1),  # cv6
+    ],
+)
+def test_slice_topology(pin, slice_id, channel):
+    slices = PwmSlices()
+    assert slices.slice_of(pin) == slice_id
+    assert slices.channel_of(pin) == channel
+
+    # the outputs use the same slices on the RP2350
+    assert PwmSlices(PWM_SLICES_RP2350).slice_of(pin) == slice_id
+
+
+@pytest.mark.parametrize("pin, slice_id", [(28, 6), (31, 7), (32, 8), (47, 11)])
+def test_rp2350_slices(pin, slice_id):
+    assert PwmSlices(PWM_SLICES_RP2350).slice_of(pin) == slice_id
+
+
+def test_slice_configured_once():
+    slices = PwmSlices()
+    pwm = CountingPWM()
+
+    assert slices.configure(pwm, 20, PWM_FREQ)
+    assert not slices.configure(pwm, 21, PWM_FREQ)  # same slice, same frequency
+    assert slices.configure(pwm, 21, 250_000)
+    assert pwm.freqs == [PWM_FREQ, 250_000]
+    assert slices.freq_of(20) == 250_000
+
+
+def test_profiles():
+    slices = PwmSlices()
+    assert slices.profile_freq("default") == PWM_FREQ
+    assert slices.profile_freq("audio") > PWM_FREQ
+
+    # the precision profile should give (almost) the full 16-bit resolution
+    pwm = CountingPWM()
+    slices.configure(pwm, 16, slices.profile_freq("precision"))
+    assert 65000 < slices.steps(16) <= 65536
+    assert slices.steps(18) == 0  # not configured
+
+    with pytest.raises(ValueError):
+        slices.profile_freq("nonexistent")
+
+
+def test_set_pwm_profile(output):
+    output.set_pwm_profile("precision")
+    assert output.pwm_profile == "precision"
+
+
+@pytest.fixture
+def slices(monkeypatch):
+    import europi_hardware
+
+    slices = PwmSlices()
+    monkeypatch.setattr(europi_hardware, "pwm_slices", slices)
+    return slices
+
+
+def test_new_partner_adopts_slice_profile(slices):
+    cv1 = Output(pin=21)
+    cv1.set_pwm_profile("precision")
+
+    # creating the partner afterwards doesn't reset the shared slice
+    cv2 = Output(pin=20, pwm_profile="default")
+    assert cv2.pwm_profile == "precision"
+    assert cv1.pwm_profile == "precision"
+    assert slices.freq_of(20) == slices.profile_freq("precision")
+
+
+def test_profile_change_updates_partner(slices):
+    cv1 = Output(pin=21)
+    cv2 = Output(pin=20)
+    cv2.pin = CountingPWM()
+    cv2.voltage(5)
+    duty = cv2._duty
+
+    cv1.set_pwm_profile("precision")
+    assert cv2.pwm_profile == "precision"
+    # the partner's duty cycle is written again for the new period
+    assert cv2.pin.duty == duty
+    assert slices.freq_of(20) == slices.profile_freq("precision")
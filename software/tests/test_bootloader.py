@@ -39,3 +39,51 @@ class BadTestScript:
 )
 def test_is_europi_script(cls, expected):
     assert BootloaderMenu._is_europi_script(cls) == expected
+
+
+def test_exit_to_menu_saves_pending_state(monkeypatch):
+    import bootloader
+
+    class DirtyScript(EuroPiScript):
+        def __init__(self):
+            super().__init__()
+            self.saved = False
+
+        def save_state(self):
+            self.saved = True
+
+    resets = []
+    monkeypatch.setattr(bootloader.machine, "reset", lambda: resets.append(True), raising=False)
+
+    menu = BootloaderMenu({})
+    menu.running_script = DirtyScript()
+    menu.running_script._state_dirty = True
+    menu.exit_to_menu()
+
+    assert menu.running_script.saved
+    assert resets == [True]
+    menu.remove_state()
+
+
+def test_exit_to_menu_resets_if_saving_fails(monkeypatch):
+    import bootloader
+
+    class BrokenScript(EuroPiScript):
+        def save_state(self):
+            raise OSError(28)
+
+    resets = []
+    warnings = []
+    monkeypatch.setattr(bootloader.machine, "reset", lambda: resets.append(True), raising=False)
+    monkeypatch.setattr(
+        bootloader, "log_warning", lambda message, tag=None, *args: warnings.append(args)
+    )
+
+    menu = BootloaderMenu({})
+    menu.running_script = BrokenScript()
+    menu.running_script._state_dirty = True
+    menu.exit_to_menu()
+
+    assert resets == [True]
+    assert len(warnings) == 1
+    menu.remove_state()
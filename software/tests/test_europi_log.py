@@ -0,0 +1,227 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+import europi_log
+from europi_log import (
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_ERROR,
+    LOG_LEVEL_INFO,
+    LOG_LEVEL_WARNING,
+    flush_log,
+    get_log_level,
+    init_log,
+    log_debug,
+    log_error,
+    log_info,
+    log_warning,
+    set_log_level,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch, fake_time):
+    path = tmp_path / "europi_log.txt"
+    monkeypatch.setattr(europi_log, "LOG_FILE", str(path))
+    monkeypatch.setattr(europi_log, "_level", europi_log._level)
+    init_log()
+    set_log_level(LOG_LEVEL_DEBUG)
+    yield path
+    init_log()
+
+
+def read(path):
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_messages_are_batched(log_file):
+    for i in range(europi_log.LOG_FLUSH_LINES - 1):
+        log_info(f"message {i}", "test")
+    assert read(log_file) == []
+
+    log_info("last", "test")
+    lines = read(log_file)
+    assert len(lines) == europi_log.LOG_FLUSH_LINES
+    assert lines[0] == "[INFO] [test] message 0"
+    assert lines[-1] == "[INFO] [test] last"
+
+
+def test_flush_after_interval(log_file):
+    log_info("first")
+    europi_log.utime.ms += europi_log.LOG_FLUSH_INTERVAL_MS
+    assert read(log_file) == []
+
+    log_info("second")
+    assert read(log_file) == ["[INFO] first", "[INFO] second"]
+
+
+def test_errors_are_saved_immediately(log_file):
+    log_warning("careful")
+    assert read(log_file) == ["[WARN] careful"]
+    log_error("broken", "test")
+    assert read(log_file) == ["[WARN] careful", "[ERR ] [test] broken"]
+
+
+class FakeTimer:
+    def __init__(self):
+        self.callback = None
+        self.period = None
+
+    def init(self, *, mode, period, callback):
+        self.period = period
+        self.callback = callback
+
+    def deinit(self):
+        self.callback = None
+
+    def fire(self):
+        callback = self.callback
+        self.callback = None
+        callback(self)
+
+
+@pytest.fixture
+def flush_timer(log_file, monkeypatch):
+    timer = FakeTimer()
+    monkeypatch.setattr(europi_log, "_flush_timer", timer)
+    return timer
+
+
+def test_timer_saves_quiet_log(log_file, flush_timer):
+    log_info("first")
+    log_info("second")
+    assert flush_timer.period == europi_log.LOG_FLUSH_INTERVAL_MS
+    assert read(log_file) == []
+
+    # nothing else is logged, but the messages are still saved
+    flush_timer.fire()
+    assert read(log_file) == ["[INFO] first", "[INFO] second"]
+
+
+def test_timer_waits_while_logging(log_file, flush_timer, monkeypatch):
+    log_info("first")
+    monkeypatch.setattr(europi_log, "_busy", True)
+    flush_timer.fire()
+    assert read(log_file) == []
+    assert flush_timer.callback is not None
+
+    monkeypatch.setattr(europi_log, "_busy", False)
+    flush_timer.fire()
+    assert read(log_file) == ["[INFO] first"]
+
+
+def test_flush_log(log_file):
+    log_debug("details")
+    flush_log()
+    flush_log()
+    assert read(log_file) == ["[DBUG] details"]
+
+
+@pytest.mark.parametrize(
+    "level, expected",
+    [
+        (LOG_LEVEL_DEBUG, ["[DBUG] d", "[INFO] i", "[WARN] w", "[ERR ] e"]),
+        (LOG_LEVEL_INFO, ["[INFO] i", "[WARN] w", "[ERR ] e"]),
+        (LOG_LEVEL_WARNING, ["[WARN] w", "[ERR ] e"]),
+        (LOG_LEVEL_ERROR, ["[ERR ] e"]),
+    ],
+)
+def test_level_filtering(log_file, capsys, level, expected):
+    set_log_level(level)
+    assert get_log_level() == level
+
+    log_debug("d")
+    log_info("i")
+    log_warning("w")
+    log_error("e")
+
+    assert read(log_file) == expected
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+def test_unknown_level():
+    with pytest.raises(ValueError):
+        set_log_level("verbose")
+
+
+def test_rotation(log_file, monkeypatch):
+    monkeypatch.setattr(europi_log, "LOG_MAX_BYTES", 100)
+    rotated = log_file.parent / "europi_log.1.txt"
+    oldest = log_file.parent / "europi_log.2.txt"
+
+    for i in range(5):
+        log_error(f"{i}" * 40)
+
+    # each line is 48 bytes, so 2 fit in each file
+    assert read(log_file) == ["[ERR ] " + "4" * 40]
+    assert read(rotated) == ["[ERR ] " + "2" * 40, "[ERR ] " + "3" * 40]
+    assert read(oldest) == ["[ERR ] " + "0" * 40, "[ERR ] " + "1" * 40]
+
+    for i in range(5, 10):
+        log_error(f"{i}" * 40)
+    # only LOG_MAX_FILES files are kept
+    assert not (log_file.parent / "europi_log.3.txt").exists()
+
+    init_log()
+    assert not log_file.exists()
+    assert not rotated.exists()
+    assert not oldest.exists()
+
+
+def test_failed_save_keeps_newest(log_file, monkeypatch):
+    monkeypatch.setattr(europi_log, "LOG_FILE", str(log_file.parent / "missing" / "log.txt"))
+    for i in range(europi_log.LOG_BUFFER_LINES + 5):
+        log_info(f"{i}")
+
+    monkeypatch.setattr(europi_log, "LOG_FILE", str(log_file))
+    flush_log()
+
+    lines = read(log_file)
+    assert len(lines) == europi_log.LOG_BUFFER_LINES
+    assert lines[0] == "[INFO] 5"
+    assert lines[-1] == f"[INFO] {europi_log.LOG_BUFFER_LINES + 4}"
+
+
+def test_format_args(log_file):
+    log_warning("Failed to process packet: %s (%d)", "osc", "timeout", 3)
+    log_info("%d%% done", None, 50)
+    log_info("100% literal")
+    log_info("%s", None, None)
+    log_info("free: %dk, used: %dk %s", "test", 10, 20, "ok")
+    flush_log()
+    assert read(log_file) == [
+        "[WARN] [osc] Failed to process packet: timeout (3)",
+        "[INFO] 50% done",
+        "[INFO] 100% literal",
+        "[INFO] None",
+        "[INFO] [test] free: 10k, used: 20k ok",
+    ]
+
+
+def test_bad_format_args(log_file):
+    log_info("only one %s", "test", 1, 2)
+    flush_log()
+    assert read(log_file) == ["[INFO] [test] only one %s (1, 2)"]
+
+
+def test_discarded_messages_are_not_formatted(log_file):
+    class Expensive:
+        def __str__(self):
+            raise AssertionError("formatted a discarded message")
+
+    set_log_level(LOG_LEVEL_WARNING)
+    log_debug("value: %s", "test", Expensive())
+    log_info("value: %s", "test", Expensive())
+    flush_log()
+    assert read(log_file) == []
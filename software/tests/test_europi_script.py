@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import pytest
 import re
 from firmware import configuration as config
-from europi_script import EuroPiScript
+from europi_script import EuroPiScript, StateSchema
 from configuration import ConfigFile
+from file_utils import BACKUP_SUFFIX, TEMP_SUFFIX
 from collections import namedtuple
 from struct import pack, unpack
 
@@ -96,3 +98,188 @@ def test_load_config_defaults(script_for_testing_with_config):
 
 def test_load_europi_config(script_for_testing_with_config):
     assert script_for_testing_with_config.europi_config.PICO_MODEL == "pico"
+
+
+class CountingScript(EuroPiScript):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save_state(self):
+        self.saves += 1
+        self.save_state_json({"saves": self.saves})
+
+
+@pytest.fixture
+def ticks(monkeypatch, fake_time):
+    import europi_script
+
+    # well after boot, so a script that has never saved can save straight away
+    fake_time.ms = 100000
+    monkeypatch.setattr(europi_script, "ticks_ms", fake_time.ticks_ms)
+    monkeypatch.setattr(europi_script, "ticks_diff", fake_time.ticks_diff)
+    return fake_time
+
+
+@pytest.fixture
+def counting_script(ticks):
+    s = CountingScript()
+    yield s
+    s.remove_state()
+
+
+def test_mark_state_dirty_defers_save(counting_script):
+    counting_script.mark_state_dirty()
+    assert counting_script.saves == 0
+
+    # never saved, so the next flush saves
+    assert counting_script.flush_state()
+    assert counting_script.saves == 1
+    assert counting_script.load_state_json() == {"saves": 1}
+
+
+def test_changes_are_coalesced(counting_script, ticks):
+    counting_script.mark_state_dirty()
+    counting_script.flush_state()
+
+    for _ in range(10):
+        ticks.ms += 100
+        counting_script.mark_state_dirty()
+        counting_script.flush_state()
+    assert counting_script.saves == 1
+
+    ticks.ms += EuroPiScript.SAVE_STATE_INTERVAL_MS
+    assert counting_script.flush_state()
+    assert counting_script.saves == 2
+
+    # nothing changed since
+    ticks.ms += EuroPiScript.SAVE_STATE_INTERVAL_MS
+    assert not counting_script.flush_state()
+
+
+def test_flush_state(counting_script, ticks):
+    assert not counting_script.flush_state()
+
+    counting_script.mark_state_dirty()
+    assert counting_script.flush_state()
+    assert counting_script.saves == 1
+
+    # too soon after the last save, unless forced
+    counting_script.mark_state_dirty()
+    assert not counting_script.flush_state()
+    assert counting_script.flush_state(force=True)
+    assert counting_script.saves == 2
+
+
+BANKS_SCHEMA = StateSchema(
+    [
+        ("bank", "B"),
+        ("recording", "B"),
+        ("rate", "f"),
+        ("steps", "h", (6, 6, 64)),
+        ("lengths", "H", 6),
+    ]
+)
+
+
+def banks_state():
+    return {
+        "bank": 3,
+        "recording": True,
+        "rate": 0.5,
+        "steps": [
+            [[b * 1000 + c * 100 + s for s in range(64)] for c in range(6)] for b in range(6)
+        ],
+        "lengths": [64, 32, 16, 8, 4, 2],
+    }
+
+
+def test_save_load_state_struct(script_for_testing):
+    state = banks_state()
+    script_for_testing.save_state_struct(state, BANKS_SCHEMA)
+    loaded = script_for_testing.load_state_struct(BANKS_SCHEMA)
+    assert loaded == state
+    assert bool(loaded["recording"]) is True
+
+
+def test_state_schema_rejects_bool_format():
+    # MicroPython's struct module has no "?" format
+    with pytest.raises(ValueError):
+        StateSchema([("recording", "?")])
+
+
+def test_load_state_struct_recovers_interrupted_save(script_for_testing):
+    state = banks_state()
+    script_for_testing.save_state_struct(state, BANKS_SCHEMA)
+    filename = script_for_testing._state_filename
+
+    # the power was cut after the old file became the backup, before the new one was renamed
+    os.rename(filename, filename + TEMP_SUFFIX)
+    with open(filename + BACKUP_SUFFIX, "wb") as f:
+        f.write(b"old")
+
+    assert script_for_testing.load_state_struct(BANKS_SCHEMA) == state
+    assert os.path.exists(filename)
+
+
+def test_state_struct_is_compact(script_for_testing):
+    state = banks_state()
+    script_for_testing.save_state_struct(state, BANKS_SCHEMA)
+    with open(script_for_testing._state_filename, "rb") as f:
+        size = len(f.read())
+    # 6 byte header, 1 + 1 + 4 bytes of scalars, 16-bit steps and lengths
+    assert size == 6 + 6 + 6 * 6 * 64 * 2 + 6 * 2
+
+    script_for_testing.save_state_json(state)
+    with open(script_for_testing._state_filename, "rb") as f:
+        assert len(f.read()) > 2 * size
+
+
+def test_load_state_struct_missing(script_for_testing):
+    assert script_for_testing.load_state_struct(BANKS_SCHEMA) == {}
+
+
+def test_load_state_struct_schema_changed(script_for_testing):
+    script_for_testing.save_state_struct(banks_state(), BANKS_SCHEMA)
+    other = StateSchema([("bank", "B"), ("recording", "B")])
+    assert script_for_testing.load_state_struct(other) == {}
+
+
+def test_load_state_struct_truncated_uses_backup(script_for_testing):
+    first = banks_state()
+    script_for_testing.save_state_struct(first, BANKS_SCHEMA)
+    second = banks_state()
+    second["bank"] = 4
+    script_for_testing.save_state_struct(second, BANKS_SCHEMA)
+
+    with open(script_for_testing._state_filename, "r+b") as f:
+        f.truncate(100)
+
+    assert script_for_testing.load_state_struct(BANKS_SCHEMA) == first
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        {"bank": 1, "recording": False, "rate": 1.0, "lengths": [1] * 6},
+        {"bank": 1, "recording": False, "rate": 1.0, "steps": [], "lengths": [1] * 6},
+        {"bank": 1, "recording": False, "rate": 1.0, "steps": [[[0] * 64] * 6] * 6, "lengths": [1]},
+    ],
+)
+def test_save_state_struct_invalid(script_for_testing, state):
+    with pytest.raises(ValueError):
+        script_for_testing.save_state_struct(state, BANKS_SCHEMA)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        [("a", "s")],
+        [("a", "hh")],
+        [("a", "h", 0)],
+        [("a", "h", (2, 0))],
+    ],
+)
+def test_invalid_schema(fields):
+    with pytest.raises(ValueError):
+        StateSchema(fields)
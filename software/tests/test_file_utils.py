@@ -0,0 +1,102 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+
+from file_utils import atomic_write, delete_file, load_file, load_json_file
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_atomic_write_str_and_bytes(in_tmp_path):
+    atomic_write("state.txt", "hello")
+    assert load_file("state.txt") == "hello"
+
+    atomic_write("state.bin", b"\x01\x02")
+    assert load_file("state.bin", "rb") == b"\x01\x02"
+
+    assert not (in_tmp_path / "state.txt.tmp").exists()
+
+
+def test_atomic_write_function():
+    atomic_write("state.json", lambda file: json.dump({"a": 1}, file))
+    assert load_json_file("state.json") == {"a": 1}
+
+
+def test_atomic_write_keeps_backup(in_tmp_path):
+    atomic_write("state.txt", "one")
+    assert not (in_tmp_path / "state.txt.bak").exists()
+
+    atomic_write("state.txt", "two")
+    atomic_write("state.txt", "three")
+    assert load_file("state.txt") == "three"
+    assert (in_tmp_path / "state.txt.bak").read_text() == "two"
+
+
+def test_atomic_write_without_backup(in_tmp_path):
+    atomic_write("state.txt", "one", backup=False)
+    atomic_write("state.txt", "two", backup=False)
+    assert load_file("state.txt") == "two"
+    assert not (in_tmp_path / "state.txt.bak").exists()
+
+
+def test_failed_write_keeps_original(in_tmp_path):
+    atomic_write("state.json", '{"a": 1}')
+
+    def broken(file):
+        file.write('{"a": ')
+        raise MemoryError()
+
+    with pytest.raises(MemoryError):
+        atomic_write("state.json", broken)
+
+    assert load_json_file("state.json") == {"a": 1}
+    assert not (in_tmp_path / "state.json.tmp").exists()
+
+
+def test_corrupt_json_uses_backup(in_tmp_path):
+    atomic_write("state.json", '{"a": 1}')
+    atomic_write("state.json", '{"a": 2}')
+    (in_tmp_path / "state.json").write_text('{"a": ')
+
+    assert load_json_file("state.json") == {"a": 1}
+
+
+def test_corrupt_json_without_backup(in_tmp_path):
+    (in_tmp_path / "state.json").write_text('{"a": ')
+    assert load_json_file("state.json") == {}
+
+
+def test_recover_interrupted_rename(in_tmp_path):
+    # power cut after the old file was moved to the backup, before the new one was renamed
+    (in_tmp_path / "state.json.bak").write_text('{"a": 1}')
+    (in_tmp_path / "state.json.tmp").write_text('{"a": 2}')
+
+    assert load_json_file("state.json") == {"a": 2}
+    assert (in_tmp_path / "state.json").exists()
+    assert not (in_tmp_path / "state.json.tmp").exists()
+
+
+def test_deleted_file_is_not_restored(in_tmp_path):
+    atomic_write("state.json", '{"a": 1}')
+    atomic_write("state.json", '{"a": 2}')
+    delete_file("state.json")
+
+    assert load_json_file("state.json") == {}
+    assert not (in_tmp_path / "state.json.bak").exists()
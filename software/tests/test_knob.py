@@ -120,3 +120,27 @@ def test_knobs_are_independent(mockHardware: MockHardware):
 
     assert k1.percent(deadzone=0.01) == 1.0
     assert k2.percent(deadzone=0.01) == 0.0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0, 1000),
+        (MAX_UINT16 // 4, 755),
+        (MAX_UINT16 // 2, 500),
+        (MAX_UINT16, 0),
+    ],
+)
+def test_permille_w_deadzone(mockHardware: MockHardware, value, expected):
+    mockHardware.set_ADC_u16_value(k1, value)
+
+    assert k1.permille(deadzone=0.01) == expected
+
+
+@pytest.mark.parametrize(
+    "value", [0, MAX_UINT16 // 4, MAX_UINT16 // 3, MAX_UINT16 // 2, MAX_UINT16]
+)
+def test_range_int_matches_read_position(mockHardware: MockHardware, value):
+    mockHardware.set_ADC_u16_value(k1, value)
+
+    assert k1.range_int() == k1.read_position()
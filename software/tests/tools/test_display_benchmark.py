@@ -0,0 +1,162 @@
+# Copyright 2025 Allen Synthesis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+
+from europi_display import Display
+from tools.display_benchmark import (
+    BenchmarkResult,
+    benchmark_frequency,
+    candidate_frequencies,
+    recommend_frequency,
+    run_benchmark,
+    save_display_frequency,
+)
+
+# Every bus transaction costs this much on top of the bytes sent
+OVERHEAD_US = 50
+
+# The fastest frequency the simulated display can keep up with
+MAX_WORKING_FREQ = 1000000
+
+
+class SimulatedDisplay(Display):
+    """A Display whose I²C transfers take time & fail above MAX_WORKING_FREQ
+
+    The mocked drawing methods don't touch the buffer, so fill() & fill_rect() change it here to
+    give show() a new frame each time.
+    """
+
+    def __init__(self, freq, clock):
+        self.freq = freq
+        self.clock = clock
+        super().__init__(
+            width=128, height=32, sda=0, scl=1, channel=0, freq=freq, contrast=255, rotate=False
+        )
+
+    def fill(self, c):
+        self.buffer[:] = bytes([0xFF if c else 0]) * len(self.buffer)
+        super().fill(c)
+
+    def fill_rect(self, x, y, w, h, c):
+        self.buffer[x : x + w] = bytes([0xFF if c else 0]) * w
+        super().fill_rect(x, y, w, h, c)
+
+    def write_data(self, buf):
+        if self.freq > MAX_WORKING_FREQ:
+            raise OSError(5)
+        # 9 clocks per byte, including the ACK
+        self.clock.us += OVERHEAD_US + len(buf) * 9 * 1000000 // self.freq
+        super().write_data(buf)
+
+
+@pytest.fixture
+def factory(fake_time):
+    return lambda freq: SimulatedDisplay(freq, fake_time)
+
+
+def test_candidate_frequencies():
+    freqs = candidate_frequencies()
+    assert freqs == sorted(freqs)
+    assert 400000 in freqs
+
+
+def test_full_and_partial_timings(factory):
+    result = benchmark_frequency(400000, iterations=4, display_factory=factory)
+
+    assert result.stable
+    # 512 bytes, 9 bits each, at 400kHz
+    assert result.full_us == OVERHEAD_US + 512 * 9 * 1000000 // 400000
+    # one 8-column page
+    assert result.partial_us == OVERHEAD_US + 8 * 9 * 1000000 // 400000
+    assert result.partial_us < result.full_us
+
+
+def test_every_frame_is_sent(factory):
+    displays = []
+
+    def tracking_factory(freq):
+        displays.append(factory(freq))
+        return displays[-1]
+
+    benchmark_frequency(400000, iterations=5, display_factory=tracking_factory)
+
+    # the driver's initial clear + 5 full + 1 clear + 5 partial frames. Only the first clear by
+    # the benchmark is skipped, since the display was already cleared by the driver
+    assert displays[0].frames_sent == 12
+    assert displays[0].frames_skipped == 1
+
+
+def test_errors_are_recorded(factory):
+    result = benchmark_frequency(1700000, iterations=4, display_factory=factory)
+
+    assert not result.stable
+    assert result.errors > 0
+    assert result.full_us is None
+    assert "failed" in str(result)
+
+
+def test_unresponsive_display():
+    def factory(freq):
+        raise OSError(19)
+
+    result = benchmark_frequency(400000, iterations=4, display_factory=factory)
+    assert not result.stable
+    assert result.errors == 4
+
+
+def test_recommends_fastest_stable_frequency(factory):
+    results = run_benchmark(
+        [100000, 400000, 1000000, 1700000, 3400000], iterations=2, display_factory=factory
+    )
+
+    assert [r.stable for r in results] == [True, True, True, False, False]
+    assert recommend_frequency(results) == 1000000
+
+
+def test_recommend_prefers_lower_frequency_when_equally_fast():
+    slow = BenchmarkResult(400000)
+    slow.full_us, slow.partial_us = 2000, 300
+    fast = BenchmarkResult(1000000)
+    fast.full_us, fast.partial_us = 2000, 300
+
+    assert recommend_frequency([fast, slow]) == 400000
+
+
+def test_recommend_none_stable():
+    result = BenchmarkResult(400000)
+    result.errors = 1
+    assert recommend_frequency([result]) is None
+    assert recommend_frequency([]) is None
+
+
+def test_save_keeps_other_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "EuroPiConfig.json").write_text(json.dumps({"DISPLAY_CONTRAST": 128}))
+
+    save_display_frequency(1000000)
+
+    saved = json.loads((tmp_path / "config" / "EuroPiConfig.json").read_text())
+    assert saved == {"DISPLAY_CONTRAST": 128, "DISPLAY_FREQUENCY": 1000000}
+
+
+def test_save_without_config_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    save_display_frequency(400000)
+
+    saved = json.loads((tmp_path / "config" / "EuroPiConfig.json").read_text())
+    assert saved == {"DISPLAY_FREQUENCY": 400000}